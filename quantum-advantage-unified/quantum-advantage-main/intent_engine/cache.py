@@ -0,0 +1,75 @@
+"""
+Content-addressed memo of layer outputs for IntentDeductionEngine
+
+Layers 2, 4, 5 and 6 are pure functions of their inputs, so across
+recursive cycles they are looked up by a hash of those inputs rather than
+recomputed. A layer whose input is another layer's output keys on that
+layer's key, so one changed input invalidates everything downstream.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Tuple
+
+MAX_ENTRIES = 64
+
+
+def content_key(layer: str, *parts: Any) -> str:
+    """BLAKE2b key of a layer name and its (JSON-serialisable) inputs."""
+    digest = hashlib.blake2b(layer.encode(), digest_size=16)
+    for part in parts:
+        digest.update(b"\0")
+        digest.update(json.dumps(part, sort_keys=True, separators=(",", ":"), default=str).encode())
+    return digest.hexdigest()
+
+
+class LayerCache:
+    """
+    LRU map of content keys to layer outputs, with per-layer hit/miss
+    counts and compute time.
+
+    Cached outputs are shared, not copied: callers must not mutate them.
+    Safe to use from several threads; computations run outside the lock.
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[str, Any]" = OrderedDict()
+        self.stats: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, layer: str, key: str, compute: Callable[[], Any]) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Output of `layer` for `key`, computing it on a miss. Also returns
+        this lookup's record: {"key", "hit", "seconds"}.
+        """
+        start = time.perf_counter()
+        with self._lock:
+            stats = self.stats.setdefault(layer, {"hits": 0, "misses": 0, "seconds": 0.0})
+            hit = key in self.entries
+            if hit:
+                self.entries.move_to_end(key)
+                output = self.entries[key]
+                stats["hits"] += 1
+        if not hit:
+            output = compute()
+            with self._lock:
+                stats["misses"] += 1
+                self.entries[key] = output
+                if len(self.entries) > self.max_entries:
+                    self.entries.popitem(last=False)
+        seconds = time.perf_counter() - start
+        with self._lock:
+            stats["seconds"] += seconds
+        return output, {"key": key, "hit": hit, "seconds": seconds}
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+            self.stats.clear()
+
+
+__all__ = ["MAX_ENTRIES", "content_key", "LayerCache"]
@@ -0,0 +1,613 @@
+"""
+Streaming corpus reader for Layer 1 (CorpusIndexer)
+
+Walks a corpus with os.scandir and reads job JSON (*.json) and organism
+(*.dna) files as token streams, a chunk at a time, so no file is ever held
+in memory whole. One lexer serves both formats: .dna files are either
+JSON or the ORGANISM block language, e.g.
+
+    ORGANISM CLIN_TRIAL_SENTINEL_AGM193 {
+        DNA { purpose: "CLINICAL_TRIAL_READINESS" }
+        GENOME {
+            GENE TrialSafety { action: phase_conjugate_stabilize() }
+        }
+    }
+
+Features per file:
+- topics: keys ("theta_lock", "purpose", ...)
+- entities: block names and upper-case identifier values ("AGM193")
+- operations: calls ("deploy_sentinel()") and values of OPERATION_KEYS
+- numbers: count/sum/min/max of every numeric key
+- organisms: ORGANISM blocks (or one per JSON .dna file)
+
+CorpusManifest keeps these per-file records keyed by (mtime, size, content
+hash) so re-indexing only reads new or changed files. index_batch() is the
+process-pool work unit for reading many files in parallel. GenomeIndex is
+the inverted (term -> files) tf-idf index over the same features.
+"""
+
+import codecs
+import hashlib
+import json
+import math
+import os
+import re
+from collections import Counter
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+JOB_SUFFIX = ".json"
+DNA_SUFFIX = ".dna"
+
+# Directories never worth indexing
+SKIP_DIRS = frozenset({".git", "node_modules", "__pycache__", ".next", ".venv", "venv"})
+
+GENOME_KEYS = ("topics", "entities", "operations")
+MANIFEST_VERSION = 1
+
+CHUNK_SIZE = 1 << 16
+BATCH_FILES = 256              # most files per process-pool task
+PARALLEL_MIN_FILES = 1024      # fewer files are read in-process
+MAX_VALUE_CHARS = 128          # longer strings carry no topic/entity signal
+
+OPERATION_KEYS = frozenset({
+    "action", "actions", "trigger", "task", "tasks", "operation", "operations",
+    "mechanism", "mode", "capabilities",
+})
+TYPE_KEYS = ("type", "purpose", "protocol", "mode", "role")
+
+# Tokens are plain strings, classified by their first character: '"'
+# string (quotes included), '-' or digit number, punctuation, identifier.
+# A lone '"' is an unterminated string.
+_TOKEN_RE = re.compile(
+    r'"(?:[^"\\]|\\.)*"'
+    r'|-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?'
+    r'|[A-Za-z_][\w.\-]*'
+    r'|->|[{}\[\]:,()]'
+    r'|"',
+    re.S,
+)
+_STRING_REST_RE = re.compile(r'(?:[^"\\]|\\.)*"', re.S)
+_ENTITY_RE = re.compile(r"[A-Z][A-Z0-9_\-]{2,63}\Z")
+
+PUNCTUATION = "{}[]:,()"
+NUMERIC = "-0123456789"
+
+
+# =============================================================================
+# WALKING
+# =============================================================================
+
+def iter_corpus_files(
+    root: str,
+    suffixes: Tuple[str, ...] = (JOB_SUFFIX, DNA_SUFFIX),
+    exclude: Iterable[str] = (),
+) -> Iterator[os.DirEntry]:
+    """
+    Yield corpus files under `root` (depth first, os.scandir, sorted by name).
+
+    Hidden directories, SKIP_DIRS and `exclude` paths are not entered;
+    unreadable directories and a missing root are skipped silently.
+    """
+    excluded = {os.path.abspath(p) for p in exclude}
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            name = entry.name
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if name[0] != "." and name not in SKIP_DIRS and \
+                            os.path.abspath(entry.path) not in excluded:
+                        subdirs.append(entry.path)
+                elif name.endswith(suffixes) and entry.is_file():
+                    yield entry
+            except OSError:
+                continue
+        stack.extend(reversed(subdirs))
+
+
+# =============================================================================
+# LEXING
+# =============================================================================
+
+def _odd_backslashes(text: str) -> bool:
+    return (len(text) - len(text.rstrip("\\"))) % 2 == 1
+
+
+def scan_tokens(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Lex a chunk stream into tokens.
+
+    A token that reaches the end of a chunk is carried into the next one.
+    Strings longer than MAX_VALUE_CHARS are not carried: they are reported
+    truncated to one character more than that, and the rest is skipped.
+    """
+    carry = ""
+    skipping = False           # inside an overlong string
+    for chunk in chunks:
+        buffer = carry + chunk
+        carry = ""
+        pos = 0
+        if skipping:
+            match = _STRING_REST_RE.match(buffer)
+            if match is None:
+                # Keep a trailing backslash: it may escape the next quote
+                carry = "\\" if _odd_backslashes(buffer) else ""
+                continue
+            skipping = False
+            pos = match.end()
+
+        # A number or identifier may continue past a chunk boundary after up
+        # to two more characters ("1e" + "-5"), so tokens ending that close
+        # to the end are re-read with the next chunk
+        end = len(buffer) - 2
+        for match in _TOKEN_RE.finditer(buffer, pos):
+            token = match.group()
+            if match.end() >= end or token == '"':
+                carry = buffer[match.start():]
+                if token == '"' and len(carry) > MAX_VALUE_CHARS + 1:
+                    yield carry[:MAX_VALUE_CHARS + 2] + '"'
+                    carry = "\\" if _odd_backslashes(carry) else ""
+                    skipping = True
+                break
+            yield token
+
+    if carry and not skipping:
+        for token in _TOKEN_RE.findall(carry):
+            if token != '"':
+                yield token
+
+
+# =============================================================================
+# FEATURES
+# =============================================================================
+
+def new_features() -> Dict[str, Any]:
+    """Empty feature record (see extract_features)."""
+    return {
+        "topics": Counter(),
+        "entities": Counter(),
+        "operations": Counter(),
+        "numbers": {},
+        "organisms": [],
+    }
+
+
+def _value(features: Dict[str, Any], key: Optional[str], token: str, organism: Optional[Dict]):
+    """Classify one scalar value token under its key."""
+    first = token[0]
+    if first == '"':
+        text = token[1:-1]
+    elif first in NUMERIC:
+        if key is None:
+            return
+        value = float(token)
+        stats = features["numbers"].get(key)
+        if stats is None:
+            features["numbers"][key] = [1, value, value, value]
+        else:
+            stats[0] += 1
+            stats[1] += value
+            if value < stats[2]:
+                stats[2] = value
+            if value > stats[3]:
+                stats[3] = value
+        return
+    else:
+        text = token
+    if not text or len(text) > MAX_VALUE_CHARS:
+        return
+    if key in OPERATION_KEYS:
+        features["operations"][text] += 1
+    elif _ENTITY_RE.match(text):
+        features["entities"][text] += 1
+    if organism is not None and organism["type"] is None and key in TYPE_KEYS:
+        organism["type"] = text
+
+
+def extract_features(
+    tokens: Iterable[str],
+    name: str = "",
+    organisms: bool = False,
+    features: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Fold a token stream into topic/entity/operation counters.
+
+    Keys are `key:` pairs (quoted or bare); inside arrays the enclosing key
+    applies. `A B {` opens a named block (ORGANISM, GENE, ...), `A {` a
+    section, `f(` is a call. With organisms=True the file's ORGANISM
+    blocks are listed, or the file itself (named `name`) when it has none.
+    Counts are added to `features` when given (e.g. a whole corpus).
+    """
+    if features is None:
+        features = new_features()
+    topics, entities, operations = features["topics"], features["entities"], features["operations"]
+    stack: List[Optional[str]] = []
+    key: Optional[str] = None
+    header: List[str] = []           # identifiers awaiting ':', '(' or '{'
+    pending: Optional[str] = None    # string/number awaiting ':'
+    # The file itself is the organism until an ORGANISM block opens
+    organism: Optional[Dict] = {"name": name, "type": None, "genes": 0} if organisms else None
+    whole_file = organism
+    found: List[Dict] = []
+
+    for token in tokens:
+        first = token[0]
+        if first in PUNCTUATION or token == "->":
+            if first == ":":
+                if header:
+                    for ident in header[:-1]:
+                        _value(features, key, ident, organism)
+                    key = header[-1].lower()
+                elif pending is not None and pending[0] == '"' and 2 < len(pending) <= MAX_VALUE_CHARS + 2:
+                    key = pending[1:-1].lower()
+                else:
+                    key = None
+                if key is not None:
+                    topics[key] += 1
+                header, pending = [], None
+                continue
+            if first == "(" and header:
+                for ident in header[:-1]:
+                    _value(features, key, ident, organism)
+                operations[header[-1]] += 1
+                header = []
+                continue
+            if first == "{" and header:
+                if len(header) >= 2:
+                    block, block_name = header[-2], header[-1]
+                    entities[block_name] += 1
+                    if block == "ORGANISM":
+                        organism = {"name": block_name, "type": None, "genes": 0}
+                        found.append(organism)
+                    elif block == "GENE" and organism is not None:
+                        organism["genes"] += 1
+                    section = block.lower()
+                else:
+                    section = header[0].lower()
+                    topics[section] += 1
+                stack.append(key)
+                key, header, pending = section, [], None
+                continue
+
+            if header:
+                for ident in header:
+                    _value(features, key, ident, organism)
+                header = []
+            if pending is not None:
+                _value(features, key, pending, organism)
+                pending = None
+            if first == "{":
+                stack.append(key)
+                key = None
+            elif first == "[":
+                stack.append(key)
+            elif first == "}" or first == "]":
+                key = stack.pop() if stack else None
+            continue
+
+        if pending is not None:
+            _value(features, key, pending, organism)
+            pending = None
+        if first == '"' or first in NUMERIC:
+            if header:
+                for ident in header:
+                    _value(features, key, ident, organism)
+                header = []
+            pending = token
+        else:
+            header.append(token)
+
+    for ident in header:
+        _value(features, key, ident, organism)
+    if pending is not None:
+        _value(features, key, pending, organism)
+
+    if organisms:
+        found = found or [whole_file]
+        for entry in found:
+            entry["type"] = entry["type"] or "organism"
+        features["organisms"].extend(found)
+    return features
+
+
+def index_file(
+    path: str,
+    chunk_size: int = CHUNK_SIZE,
+    features: Optional[Dict[str, Any]] = None,
+) -> Tuple[Dict[str, Any], int, str]:
+    """
+    Features, line count and content hash (BLAKE2b) of one corpus file.
+
+    A file that fits in one chunk is lexed in one call; larger files are
+    streamed chunk by chunk.
+    """
+    name = os.path.splitext(os.path.basename(path))[0]
+    organisms = path.endswith(DNA_SUFFIX)
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        data = f.read(chunk_size)
+        if len(data) < chunk_size:
+            digest.update(data)
+            tokens = _TOKEN_RE.findall(data.decode("utf-8", "replace"))
+            features = extract_features(tokens, name, organisms, features)
+            return features, data.count(b"\n"), digest.hexdigest()
+
+        lines = 0
+        decoder = codecs.getincrementaldecoder("utf-8")("replace")
+
+        def chunks() -> Iterator[str]:
+            nonlocal lines
+            for part in chain((data,), iter(lambda: f.read(chunk_size), b"")):
+                digest.update(part)
+                lines += part.count(b"\n")
+                yield decoder.decode(part)
+            yield decoder.decode(b"", final=True)
+
+        features = extract_features(scan_tokens(chunks()), name, organisms, features)
+        return features, lines, digest.hexdigest()
+
+
+def index_batch(
+    batch: List[Tuple[str, Optional[str]]],
+) -> Tuple[List[Optional[Tuple[Dict[str, Any], int, str]]], Dict[str, Any]]:
+    """
+    index_file() over (path, known hash) pairs; the process-pool work unit.
+
+    Returns the per-file results (None for unreadable files) and the summed
+    features of every file whose hash differs from the known one, so the
+    caller merges one set of counters per batch rather than per file.
+    """
+    results = []
+    totals = new_features()
+    for path, known in batch:
+        try:
+            result = index_file(path)
+        except OSError:
+            results.append(None)
+            continue
+        results.append(result)
+        if result[2] != known:
+            merge_features(totals, result[0])
+    return results, totals
+
+
+# =============================================================================
+# GENOME INDEX
+# =============================================================================
+
+_TERM_RE = re.compile(r"[a-z][a-z0-9]{2,}")
+
+
+@lru_cache(maxsize=1 << 16)
+def genome_terms(text: str) -> Tuple[str, ...]:
+    """Lower-case terms of a genome item or prompt ("phi_monitoring()" -> phi, monitoring)."""
+    return tuple(_TERM_RE.findall(text.lower()))
+
+
+class GenomeIndex:
+    """
+    Inverted index over the semantic genome.
+
+    postings maps each term (see genome_terms()) to {file: term frequency},
+    counting the terms of every topic, entity and operation of the file.
+    tf-idf weights are derived at query time from the posting list length,
+    so adding or removing a file only touches that file's terms.
+    """
+
+    def __init__(self):
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.term_counts: Counter = Counter()
+        self.documents = 0
+
+    @staticmethod
+    def _frequencies(features: Dict[str, Any]) -> Counter:
+        frequencies: Counter = Counter()
+        for name in GENOME_KEYS:
+            for item, count in features[name].items():
+                for term in genome_terms(item):
+                    frequencies[term] += count
+        return frequencies
+
+    def add(self, doc: str, features: Dict[str, Any]):
+        """Index one file's features."""
+        self.documents += 1
+        for term, count in self._frequencies(features).items():
+            self.postings.setdefault(term, {})[doc] = count
+            self.term_counts[term] += count
+
+    def remove(self, doc: str, features: Dict[str, Any]):
+        """Drop a file indexed with add(doc, features)."""
+        self.documents -= 1
+        for term, count in self._frequencies(features).items():
+            posting = self.postings[term]
+            del posting[doc]
+            if posting:
+                self.term_counts[term] -= count
+            else:
+                del self.postings[term]
+                del self.term_counts[term]
+
+    def idf(self, term: str) -> float:
+        """Smoothed inverse document frequency; 0 for unknown terms."""
+        df = len(self.postings.get(term, ()))
+        return math.log((1 + self.documents) / (1 + df)) + 1 if df else 0.0
+
+    def posting_list(self, term: str) -> List[Tuple[str, float]]:
+        """(file, tf-idf weight) of every file containing `term`, best first."""
+        idf = self.idf(term)
+        posting = self.postings.get(term, {})
+        return sorted(((doc, tf * idf) for doc, tf in posting.items()), key=lambda p: (-p[1], p[0]))
+
+    def score_terms(self, terms: Iterable[str]) -> Dict[str, float]:
+        """
+        Corpus-wide tf-idf weight of each known term (summed over its
+        files); one lookup per term, independent of the corpus size.
+        """
+        return {term: self.term_counts[term] * self.idf(term) for term in terms if term in self.postings}
+
+    def search(self, text: str, limit: int = 10) -> List[Tuple[str, float]]:
+        """Files ranked by the summed tf-idf weight of the terms of `text`."""
+        scores: Counter = Counter()
+        for term in set(genome_terms(text)):
+            idf = self.idf(term)
+            for doc, tf in self.postings.get(term, {}).items():
+                scores[doc] += tf * idf
+        return sorted(scores.items(), key=lambda p: (-p[1], p[0]))[:limit]
+
+
+# =============================================================================
+# MANIFEST
+# =============================================================================
+
+def _add_numbers(numbers: Dict[str, List[float]], key: str, stats: List[float]):
+    count, total, low, high = stats
+    current = numbers.get(key)
+    if current is None:
+        numbers[key] = [count, total, low, high]
+    else:
+        current[0] += count
+        current[1] += total
+        current[2] = min(current[2], low)
+        current[3] = max(current[3], high)
+
+
+def merge_features(totals: Dict[str, Any], features: Dict[str, Any]):
+    """Add the counters and numeric statistics of `features` into `totals`."""
+    for name in GENOME_KEYS:
+        totals[name].update(features[name])
+    for key, stats in features["numbers"].items():
+        _add_numbers(totals["numbers"], key, stats)
+
+
+class CorpusManifest:
+    """
+    Persisted per-file index records and their running totals.
+
+    records maps each file (relative to the corpus root) to
+    {"mtime_ns", "size", "hash", "lines", "job", "features"}; totals holds
+    the summed topic/entity/operation counters and numeric statistics of
+    all records, and genome_index their inverted index. add() and remove()
+    keep both current, so a refresh only pays for the files that changed.
+    """
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+        self.records: Dict[str, Dict[str, Any]] = {}
+        self.totals = new_features()
+        self.genome_index = GenomeIndex()
+        self._stale_numbers: set = set()
+
+    @classmethod
+    def load(cls, path: str, root: str) -> "CorpusManifest":
+        """Manifest saved at `path`, or an empty one if missing, unreadable or for another root."""
+        manifest = cls(root)
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return manifest
+        if data.get("version") != MANIFEST_VERSION or data.get("root") != manifest.root:
+            return manifest
+        manifest.records = data["records"]
+        totals = data["totals"]
+        for name in GENOME_KEYS:
+            manifest.totals[name] = Counter(totals[name])
+        manifest.totals["numbers"] = totals["numbers"]
+        for rel, record in manifest.records.items():
+            manifest.genome_index.add(rel, record["features"])
+        return manifest
+
+    def save(self, path: str):
+        """Write atomically (temporary file + rename)."""
+        self.finish()
+        data = {
+            "version": MANIFEST_VERSION,
+            "root": self.root,
+            "records": self.records,
+            "totals": {name: self.totals[name] for name in GENOME_KEYS + ("numbers",)},
+        }
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp, path)
+
+    def fingerprint(self) -> str:
+        """BLAKE2b over every (file, content hash): changes iff the indexed corpus does."""
+        digest = hashlib.blake2b(digest_size=16)
+        for rel in sorted(self.records):
+            digest.update(f"{rel}\0{self.records[rel]['hash']}\n".encode())
+        return digest.hexdigest()
+
+    def add(self, rel: str, record: Dict[str, Any], count: bool = True):
+        """
+        Add a file record to the totals and genome index. count=False skips
+        the totals, for features already merged into them (see index_batch()).
+        """
+        self.records[rel] = record
+        self.genome_index.add(rel, record["features"])
+        if count:
+            merge_features(self.totals, record["features"])
+
+    def remove(self, rel: str) -> Dict[str, Any]:
+        """Remove a file record from the totals and genome index."""
+        record = self.records.pop(rel)
+        features = record["features"]
+        self.genome_index.remove(rel, features)
+        for name in GENOME_KEYS:
+            counter = self.totals[name]
+            counter.subtract(features[name])
+            for item in features[name]:
+                if counter[item] <= 0:
+                    del counter[item]
+        numbers = self.totals["numbers"]
+        for key, (count, total, low, high) in features["numbers"].items():
+            current = numbers[key]
+            current[0] -= count
+            current[1] -= total
+            if current[0] <= 0:
+                del numbers[key]
+            elif low <= current[2] or high >= current[3]:
+                self._stale_numbers.add(key)
+        return record
+
+    def finish(self):
+        """Recompute min/max of numeric keys whose bound was removed."""
+        if not self._stale_numbers:
+            return
+        numbers = self.totals["numbers"]
+        for key in self._stale_numbers:
+            if key in numbers:
+                numbers[key][2] = min(r["features"]["numbers"][key][2] for r in self.records.values()
+                                      if key in r["features"]["numbers"])
+                numbers[key][3] = max(r["features"]["numbers"][key][3] for r in self.records.values()
+                                      if key in r["features"]["numbers"])
+        self._stale_numbers.clear()
+
+
+__all__ = [
+    "JOB_SUFFIX",
+    "DNA_SUFFIX",
+    "SKIP_DIRS",
+    "GENOME_KEYS",
+    "OPERATION_KEYS",
+    "TYPE_KEYS",
+    "iter_corpus_files",
+    "scan_tokens",
+    "new_features",
+    "extract_features",
+    "index_file",
+    "index_batch",
+    "merge_features",
+    "genome_terms",
+    "GenomeIndex",
+    "CorpusManifest",
+]
@@ -7,14 +7,22 @@ The IntentDeductionEngine orchestrates all 7 layers recursively.
 Each iteration refines the analysis (U = L[U] autopoietic loop).
 """
 
-import json
+import asyncio
+import logging
+import time
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import asdict
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional
+from typing import Deque, Dict, List, Any, Optional
 from pathlib import Path
 
 from .constants import LAMBDA_PHI, PHI_GOLDEN, TAU_OMEGA
 from .structures import IntentVector, EngineState
+from .cache import LayerCache, content_key
+from .snapshots import SnapshotWriter
+from .pipeline import LayerGraph
+from .events import EventCallback, print_event
 from .layers import (
     CorpusIndexer,
     IndividualIntentDeducer,
@@ -25,6 +33,11 @@ from .layers import (
     ProjectPlanGenerator
 )
 
+logger = logging.getLogger(__name__)
+
+# Emergent metrics whose change between cycles decides a stalled run
+CONVERGENCE_METRICS = ("lambda_system", "phi_global", "gamma_mean")
+
 
 class IntentDeductionEngine:
     """
@@ -38,101 +51,209 @@ class IntentDeductionEngine:
         self, 
         corpus_path: str = "/home/dnalang",
         recursion_depth: int = 3,
-        output_dir: str = None
+        output_dir: str = None,
+        workers: Optional[int] = 1,
+        history_limit: int = 8,
+        layer_workers: int = 4,
+        on_event: Optional[EventCallback] = None,
+        tolerance: float = 1e-4,
+        patience: int = 1,
+        time_budget: Optional[float] = None
     ):
+        """
+        Args:
+            corpus_path: Corpus root indexed by Layer 1.
+            recursion_depth: Maximum number of recursive cycles per run().
+            output_dir: Where states and the corpus manifest are saved
+                        (default: corpus_path/intent_engine_output).
+            workers: Processes used to index large corpora (None: one per CPU).
+            history_limit: Most recent cycle states kept in state_history.
+            layer_workers: Threads running independent layers of a cycle
+                           concurrently (1: one layer at a time).
+            on_event: Called with each progress event (see events.py)
+                      instead of printing it (default: print_event).
+            tolerance: A cycle is stalled when Λ, Φ and Γ each changed by
+                       less than this since the previous one (0: never).
+            patience: Consecutive stalled cycles after which run() stops.
+            time_budget: Wall-clock seconds per run(); no cycle is started
+                         that the previous one's duration says would
+                         overrun it (None: unlimited).
+        
+        Raises:
+            ValueError: tolerance < 0, patience < 1 or time_budget <= 0.
+        """
+        if tolerance < 0:
+            raise ValueError(f"tolerance must be >= 0, got {tolerance!r}")
+        if patience < 1:
+            raise ValueError(f"patience must be >= 1, got {patience!r}")
+        if time_budget is not None and time_budget <= 0:
+            raise ValueError(f"time_budget must be > 0 or None, got {time_budget!r}")
         self.corpus_path = Path(corpus_path)
         self.recursion_depth = recursion_depth
+        self.layer_workers = layer_workers
+        self.on_event = on_event or print_event
+        self.tolerance = tolerance
+        self.patience = patience
+        self.time_budget = time_budget
         self.output_dir = Path(output_dir) if output_dir else self.corpus_path / "intent_engine_output"
         self.iteration = 0
-        self.state_history: List[Dict] = []
+        self.state_history: Deque[Dict] = deque(maxlen=history_limit)
         
         # Initialize all 7 layers
-        self.indexer = CorpusIndexer(str(corpus_path))
+        self.indexer = CorpusIndexer(
+            str(corpus_path),
+            exclude=[str(self.output_dir)],
+            manifest_path=str(self.output_dir / "corpus_manifest.json"),
+            workers=workers,
+        )
         self.individual_deducer = IndividualIntentDeducer()
         self.collective_deducer = None  # Initialized per-cycle
         self.capability_evaluator = CapabilityEvaluator()
         self.resource_analyzer = ResourceAnalyzer()
         self.prompt_enhancer = PromptEnhancer()
         self.plan_generator = ProjectPlanGenerator()
+        self.layer_cache = LayerCache()
+        self.snapshots = SnapshotWriter(str(self.output_dir))
         
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
     
-    def run_recursive_cycle(self, custom_prompts: List[str] = None) -> Dict[str, Any]:
+    def _emit(self, event: str, **fields: Any):
+        """Log an engine event and pass it to on_event."""
+        record = {"event": event, **fields}
+        logger.debug("%s %s", event, fields, extra={"engine_event": record})
+        self.on_event(record)
+    
+    def _begin_cycle(self, custom_prompts: Optional[List[str]], reindex: bool):
         """
-        Execute one complete recursive enhancement cycle.
-        
-        Args:
-            custom_prompts: Optional list of prompts to analyze.
-                           If None, uses default sample prompts.
-        
-        Returns:
-            Complete state dictionary for this iteration.
+        Start a cycle: returns its LayerGraph, the dict its cache lookups
+        are recorded in, and the on_done callback reporting each layer.
         """
         self.iteration += 1
+        iteration = self.iteration
         
-        print(f"\n{'='*70}")
-        print(f"[Λ:{self.iteration}] RECURSIVE ENHANCEMENT CYCLE {self.iteration}/{self.recursion_depth}")
-        print(f"{'='*70}")
+        self._emit("cycle_start", iteration=iteration, recursion_depth=self.recursion_depth)
         
-        # Layer 1: Index corpus
-        print("\n[LAYER 1] Indexing semantic genome...")
-        corpus_stats = self.indexer.index_quantum_jobs()
-        organisms = self.indexer.index_dna_organisms()
-        print(f"   Indexed {corpus_stats.get('total_jobs', 0)} quantum jobs")
-        print(f"   Found {len(organisms)} DNA organisms")
-        
-        # Layer 2: Individual intent deduction
-        print("\n[LAYER 2] Deducing individual intents...")
         prompts = custom_prompts or [
             "create quantum consciousness framework with AURA/AIDEN polarity",
             "validate F_max = 0.9787 fidelity bound on IBM hardware",
             "integrate intent-deduction engine with validation data"
         ]
         
-        context = {"topics": dict(self.indexer.semantic_genome["topics"])}
-        intent_vectors = [
-            self.individual_deducer.deduce_intent(p, context)
-            for p in prompts
-        ]
-        print(f"   Generated {len(intent_vectors)} intent vectors")
-        
-        # Layer 3: Collective deduction
-        print("\n[LAYER 3] Performing collective deduction...")
-        self.collective_deducer = CollectiveIntentDeducer(intent_vectors)
-        trajectory_map = self.collective_deducer.generate_trajectory_map()
-        print(f"   Mapped {trajectory_map['arc_count']} trajectory arcs")
-        
-        # Layer 4: Capability evaluation
-        print("\n[LAYER 4] Evaluating capabilities...")
-        user_cap = self.capability_evaluator.evaluate_user(corpus_stats)
-        system_cap = self.capability_evaluator.evaluate_system()
-        print(f"   User aggregate: {user_cap.aggregate_score:.3f}")
-        print(f"   System aggregate: {system_cap.aggregate_score:.3f}")
-        
-        # Layer 5: Resource analysis
-        print("\n[LAYER 5] Analyzing resources...")
-        readiness = self.resource_analyzer.analyze_deployment_readiness(intent_vectors)
-        print(f"   Analyzed {len(readiness)} deployment scenarios")
-        
-        # Layer 6: Prompt enhancement
-        print("\n[LAYER 6] Enhancing prompts...")
-        enhanced_prompts = [
-            self.prompt_enhancer.enhance(p, iv) 
-            for p, iv in zip(prompts, intent_vectors)
-        ]
-        avg_quality = sum(ep.overall_quality for ep in enhanced_prompts) / len(enhanced_prompts)
-        print(f"   Average quality: {avg_quality:.3f}")
+        # Layers 2, 4, 5 and 6 are pure: look them up by input hash
+        layer_cache: Dict[str, Dict[str, Any]] = {}
+        
+        def cached(layer: str, key: str, compute):
+            output, layer_cache[layer] = self.layer_cache.get_or_compute(layer, key, compute)
+            return output
         
-        # Layer 7: Project plan generation
-        print("\n[LAYER 7] Generating project plan...")
-        project_plan = self.plan_generator.generate_plan(trajectory_map, readiness)
-        print(f"   Generated {len(project_plan)} phases")
+        def index_corpus(_):
+            if reindex or not self.indexer.indexed or self.indexer.changed():
+                return self.indexer.index(), self.indexer.index_dna_organisms(), True
+            return self.indexer.corpus_stats, self.indexer.organisms, False
+        
+        def deduce_intents(inputs):
+            corpus_stats = inputs["layer_1"][0]
+            context = {
+                "topics": self.indexer.semantic_genome["topics"],
+                "genome": self.indexer.genome_index,
+            }
+            return cached(
+                "layer_2", content_key("layer_2", prompts, corpus_stats.get("fingerprint", "")),
+                lambda: self.individual_deducer.deduce_batch(prompts, context)
+            )
+        
+        def map_trajectories(inputs):
+            self.collective_deducer = CollectiveIntentDeducer(inputs["layer_2"])
+            return self.collective_deducer.generate_trajectory_map()
+        
+        def evaluate_capabilities(inputs):
+            corpus_stats = inputs["layer_1"][0]
+            return cached(
+                "layer_4", content_key("layer_4", corpus_stats.get("fingerprint", "")),
+                lambda: (self.capability_evaluator.evaluate_user(corpus_stats),
+                         self.capability_evaluator.evaluate_system())
+            )
+        
+        def analyze_resources(inputs):
+            return cached(
+                "layer_5", content_key("layer_5", layer_cache["layer_2"]["key"]),
+                lambda: self.resource_analyzer.analyze_batch(inputs["layer_2"])
+            )
+        
+        def enhance_prompts(inputs):
+            return cached(
+                "layer_6", content_key("layer_6", layer_cache["layer_2"]["key"]),
+                lambda: self.prompt_enhancer.enhance_batch(inputs["layer_2"])
+            )
+        
+        def generate_plan(inputs):
+            return self.plan_generator.generate_plan(inputs["layer_3"], inputs["layer_5"])
+        
+        # Each layer starts once the layers it reads have finished:
+        # Layer 4 only needs the corpus, Layers 3, 5 and 6 only intents
+        graph = LayerGraph()
+        graph.add("layer_1", index_corpus)
+        graph.add("layer_2", deduce_intents, after=["layer_1"])
+        graph.add("layer_3", map_trajectories, after=["layer_2"])
+        graph.add("layer_4", evaluate_capabilities, after=["layer_1"])
+        graph.add("layer_5", analyze_resources, after=["layer_2"])
+        graph.add("layer_6", enhance_prompts, after=["layer_2"])
+        graph.add("layer_7", generate_plan, after=["layer_3", "layer_5"])
+        
+        def report(layer: str, output: Any, seconds: float):
+            fields = {"iteration": iteration, "layer": layer, "seconds": seconds}
+            if layer in layer_cache:
+                fields["cached"] = layer_cache[layer]["hit"]
+            self._emit("layer_done", **fields, summary=self._layer_summary(layer, output))
+        
+        return graph, layer_cache, report
+    
+    @staticmethod
+    def _layer_summary(layer: str, output: Any) -> Dict[str, Any]:
+        """Counts reported for a finished layer in its layer_done event."""
+        if layer == "layer_1":
+            corpus_stats, organisms, indexed = output
+            summary = {"indexed": indexed, "total_jobs": corpus_stats.get("total_jobs", 0),
+                       "organisms": len(organisms)}
+            for key in ("new_files", "changed_files", "reused_files", "deleted_files",
+                        "elapsed_s", "files_per_sec", "workers"):
+                summary[key] = corpus_stats.get(key, 0)
+            return summary
+        if layer == "layer_2":
+            return {"intents": len(output)}
+        if layer == "layer_3":
+            return {"arcs": output["arc_count"]}
+        if layer == "layer_4":
+            return {"user_aggregate": output[0].aggregate_score,
+                    "system_aggregate": output[1].aggregate_score}
+        if layer == "layer_5":
+            return {"scenarios": len(output)}
+        if layer == "layer_6":
+            # Quality is each prompt's Λ
+            return {"average_quality": sum(ep.overall_quality for ep in output) / len(output) if output else 0.0}
+        if layer == "layer_7":
+            return {"phases": len(output)}
+        return {}
+    
+    def _cycle_state(
+        self,
+        outputs: Dict[str, Any],
+        layer_seconds: Dict[str, float],
+        cycle_seconds: float,
+        layer_cache: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """State dictionary of a finished cycle from its layer outputs."""
+        corpus_stats, organisms, _ = outputs["layer_1"]
+        intent_batch = outputs["layer_2"]
+        trajectory_map = outputs["layer_3"]
+        user_cap, system_cap = outputs["layer_4"]
+        readiness = outputs["layer_5"]
+        enhanced_prompts = outputs["layer_6"]
+        project_plan = outputs["layer_7"]
         
         # Calculate emergent metrics
-        lambda_system = sum(iv.coherence_lambda for iv in intent_vectors) / len(intent_vectors)
-        phi_global = sum(iv.consciousness_phi for iv in intent_vectors) / len(intent_vectors)
-        gamma_mean = sum(iv.decoherence_gamma for iv in intent_vectors) / len(intent_vectors)
+        lambda_system, phi_global, gamma_mean = intent_batch.means()
         
         # Calculate CCCE (Ξ = ΛΦ/Γ)
         xi_ccce = (lambda_system * phi_global) / max(gamma_mean, 0.01)
@@ -140,18 +261,23 @@ class IntentDeductionEngine:
         # Calculate TAU_OMEGA coupling
         tau_omega_calc = TAU_OMEGA
         
-        state = {
+        return {
             "iteration": self.iteration,
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "corpus_stats": corpus_stats,
             "organisms_indexed": len(organisms),
-            "intent_vectors": [asdict(iv) for iv in intent_vectors],
+            "intent_vectors": intent_batch.to_records(),
             "trajectory_map": trajectory_map,
             "user_capabilities": asdict(user_cap),
             "system_capabilities": asdict(system_cap),
             "deployment_readiness": readiness,
-            "enhanced_prompts": [asdict(ep) for ep in enhanced_prompts],
+            # Shallow copies: asdict() is too slow for large prompt sets
+            "enhanced_prompts": [{**vars(ep), "enhancements": dict(ep.enhancements)} for ep in enhanced_prompts],
             "project_plan": [asdict(pp) for pp in project_plan],
+            "layer_cache": {
+                layer: {**lookup, **{f"total_{k}": v for k, v in self.layer_cache.stats[layer].items()}}
+                for layer, lookup in layer_cache.items()
+            },
             "emergent_metrics": {
                 "lambda_system": lambda_system,
                 "phi_global": phi_global,
@@ -160,20 +286,119 @@ class IntentDeductionEngine:
                 "tau_omega": tau_omega_calc,
                 "recursion_depth": self.iteration,
                 "coherence_stability": "HIGH" if lambda_system > 0.85 else "MEDIUM" if lambda_system > 0.7 else "LOW",
-                "consciousness_active": phi_global > 0.7734
+                "consciousness_active": phi_global > 0.7734,
+                "layer_seconds": layer_seconds,
+                "cycle_seconds": cycle_seconds
             }
         }
-        
+    
+    def _end_cycle(self, state: Dict[str, Any]) -> Dict[str, Any]:
         self.state_history.append(state)
+        self._emit("cycle_done", iteration=state["iteration"], metrics=state["emergent_metrics"])
+        return state
+    
+    def run_recursive_cycle(self, custom_prompts: List[str] = None, reindex: bool = True) -> Dict[str, Any]:
+        """
+        Execute one complete recursive enhancement cycle.
         
-        print(f"\n[EMERGENT METRICS]")
-        print(f"   Λ_system = {lambda_system:.4f}")
-        print(f"   Φ_global = {phi_global:.4f}")
-        print(f"   Γ_mean = {gamma_mean:.4f}")
-        print(f"   Ξ (CCCE) = {xi_ccce:.2f}")
-        print(f"   Coherence: {state['emergent_metrics']['coherence_stability']}")
-        print(f"   Consciousness: {'ACTIVE' if state['emergent_metrics']['consciousness_active'] else 'DORMANT'}")
+        Args:
+            custom_prompts: Optional list of prompts to analyze.
+                           If None, uses default sample prompts.
+            reindex: Bring the corpus index up to date (incrementally).
+                     If False, Layer 1 reuses the previous cycle's index
+                     unless a stat-only pass finds changed files.
+        
+        Returns:
+            Complete state dictionary for this iteration.
+        """
+        graph, layer_cache, report = self._begin_cycle(custom_prompts, reindex)
+        
+        cycle_start = time.perf_counter()
+        if self.layer_workers > 1:
+            with ThreadPoolExecutor(max_workers=self.layer_workers) as pool:
+                outputs, layer_seconds = graph.run(pool, report)
+        else:
+            outputs, layer_seconds = graph.run(on_done=report)
+        cycle_seconds = time.perf_counter() - cycle_start
+        
+        return self._end_cycle(self._cycle_state(outputs, layer_seconds, cycle_seconds, layer_cache))
+    
+    async def arun_recursive_cycle(
+        self,
+        custom_prompts: List[str] = None,
+        reindex: bool = True,
+        executor: Optional[Executor] = None
+    ) -> Dict[str, Any]:
+        """
+        run_recursive_cycle() for asyncio: every layer, and building the
+        state, runs on `executor` (the loop's default if None).
+        
+        Cancelling the calling task stops the cycle between layers; a
+        layer already running finishes in its thread and is discarded.
+        """
+        graph, layer_cache, report = self._begin_cycle(custom_prompts, reindex)
+        
+        cycle_start = time.perf_counter()
+        outputs, layer_seconds = await graph.arun(executor, report)
+        cycle_seconds = time.perf_counter() - cycle_start
+        
+        state = await asyncio.get_running_loop().run_in_executor(
+            executor, self._cycle_state, outputs, layer_seconds, cycle_seconds, layer_cache
+        )
+        return self._end_cycle(state)
+    
+    def _start_run(self):
+        self._run_start = time.perf_counter()
+        self._run_cycles = 0
+        self._stalled = 0
+        self._previous_metrics: Optional[Dict[str, Any]] = None
+        self._emit("run_start", recursion_depth=self.recursion_depth, lambda_phi=LAMBDA_PHI)
+    
+    def _terminate(self, state: Dict[str, Any]) -> bool:
+        """
+        Decide after a cycle whether the run stops. If so, the reason is
+        recorded in the state's "termination": "converged" (Λ > 0.95),
+        "stalled" (patience measured deltas within tolerance), "recursion_depth"
+        or "time_budget".
+        """
+        metrics = state["emergent_metrics"]
+        self._run_cycles += 1
+        elapsed = time.perf_counter() - self._run_start
+        
+        max_delta = None
+        if self._previous_metrics is not None:
+            max_delta = max(abs(metrics[k] - self._previous_metrics[k]) for k in CONVERGENCE_METRICS)
+            self._stalled = self._stalled + 1 if max_delta < self.tolerance else 0
+        self._previous_metrics = metrics
         
+        if metrics["lambda_system"] > 0.95:
+            reason = "converged"
+        elif max_delta is not None and self._stalled >= self.patience:
+            reason = "stalled"
+        elif self._run_cycles >= self.recursion_depth:
+            reason = "recursion_depth"
+        elif self.time_budget is not None and elapsed + metrics["cycle_seconds"] > self.time_budget:
+            reason = "time_budget"
+        else:
+            return False
+        
+        state["termination"] = {
+            "reason": reason,
+            "cycles": self._run_cycles,
+            "elapsed_s": elapsed,
+            "max_delta": max_delta,
+            "stalled_cycles": self._stalled,
+        }
+        return True
+    
+    def _finish_run(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        self._emit(
+            "run_done",
+            iterations=self.iteration,
+            lambda_system=state["emergent_metrics"]["lambda_system"],
+            phi_global=state["emergent_metrics"]["phi_global"],
+            termination=state["termination"],
+        )
         return state
     
     def run(self, custom_prompts: List[str] = None) -> Dict[str, Any]:
@@ -184,51 +409,65 @@ class IntentDeductionEngine:
             custom_prompts: Optional list of prompts to analyze across all iterations.
         
         Returns:
-            Final state after all iterations (or convergence).
+            Final state after all iterations (or an early stop); its
+            "termination" says why the run ended.
         """
-        print(f"""
-╔══════════════════════════════════════════════════════════════════════════════╗
-║   dna::}}{{::lang RECURSIVE INTENT-DEDUCTION ENGINE                          ║
-║   Autopoietic U=L[U] Engine | ΛΦ = {LAMBDA_PHI}                      ║
-║   7-Layer Architecture | Recursion Depth: {self.recursion_depth}                              ║
-╚══════════════════════════════════════════════════════════════════════════════╝
-        """)
+        self._start_run()
         
         final_state = None
         for i in range(self.recursion_depth):
-            final_state = self.run_recursive_cycle(custom_prompts)
-            
-            # Check for convergence (Λ > 0.95)
-            if final_state["emergent_metrics"]["lambda_system"] > 0.95:
-                print(f"\n[ΛΦ CONVERGENCE ACHIEVED] Λ = {final_state['emergent_metrics']['lambda_system']:.4f}")
+            # Later cycles re-index only files changed during the run:
+            # cycles only write to output_dir, which the indexer does not walk
+            final_state = self.run_recursive_cycle(custom_prompts, reindex=(i == 0))
+            stop = self._terminate(final_state)
+            # Snapshots after the first are deltas against the previous cycle
+            self._save_state(final_state)
+            if stop:
                 break
         
-        # Save final state
-        self._save_state(final_state)
-        
-        print(f"""
-╔══════════════════════════════════════════════════════════════════════════════╗
-║   RECURSIVE ENGINE COMPLETE                                                  ║
-║   Iterations: {self.iteration} | Final Λ: {final_state['emergent_metrics']['lambda_system']:.4f} | Φ: {final_state['emergent_metrics']['phi_global']:.4f}                       ║
-╚══════════════════════════════════════════════════════════════════════════════╝
-        """)
+        return self._finish_run(final_state)
+    
+    async def arun(self, custom_prompts: List[str] = None, executor: Optional[Executor] = None) -> Dict[str, Any]:
+        """
+        run() for asyncio. Corpus indexing, the layers and snapshot writes
+        run on `executor` (default: a pool of max(layer_workers, 1) threads
+        owned by this call), so the event loop is never blocked by them.
         
-        return final_state
+        Events are emitted from the event loop thread. Cancelling the task
+        stops the run between layers: the interrupted cycle is neither
+        recorded in state_history nor saved.
+        """
+        loop = asyncio.get_running_loop()
+        pool = executor or ThreadPoolExecutor(max_workers=max(self.layer_workers, 1))
+        try:
+            self._start_run()
+            
+            final_state = None
+            for i in range(self.recursion_depth):
+                final_state = await self.arun_recursive_cycle(custom_prompts, reindex=(i == 0), executor=pool)
+                stop = self._terminate(final_state)
+                path = await loop.run_in_executor(pool, self._write_state, final_state)
+                self._emit("state_saved", iteration=final_state["iteration"], path=str(path))
+                if stop:
+                    break
+            
+            return self._finish_run(final_state)
+        finally:
+            if executor is None:
+                # A cancelled run must not wait for the layer still running
+                pool.shutdown(wait=False, cancel_futures=True)
     
-    def _save_state(self, state: Dict[str, Any]) -> Path:
-        """Save engine state to JSON file"""
+    def _write_state(self, state: Dict[str, Any]) -> Path:
+        """
+        Save engine state as a compact snapshot (see snapshots.py) and point
+        the latest snapshot at it. Read back with snapshots.load_snapshot().
+        """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_path = self.output_dir / f"intent_deduction_state_{timestamp}.json"
-        
-        with open(output_path, 'w') as f:
-            json.dump(state, f, indent=2, default=str)
-        
-        # Also save as latest
-        latest_path = self.output_dir / "intent_deduction_state_latest.json"
-        with open(latest_path, 'w') as f:
-            json.dump(state, f, indent=2, default=str)
-        
-        print(f"\nState saved to: {output_path}")
+        return self.snapshots.write(state, f"{timestamp}_{state['iteration']:03d}")
+    
+    def _save_state(self, state: Dict[str, Any]) -> Path:
+        output_path = self._write_state(state)
+        self._emit("state_saved", iteration=state["iteration"], path=str(output_path))
         return output_path
 
 
@@ -0,0 +1,119 @@
+"""
+Engine events for IntentDeductionEngine
+
+The engine reports progress as plain dicts, {"event": name, ...fields},
+to an on_event callback instead of printing. print_event() renders them
+as the engine's console banners and is the callback when none is given.
+
+Events:
+    run_start     recursion_depth, lambda_phi
+    cycle_start   iteration, recursion_depth
+    layer_done    iteration, layer ("layer_1".."layer_7"), seconds,
+                  cached (memoized layers only), summary (per-layer counts)
+    cycle_done    iteration, metrics (the state's emergent_metrics)
+    state_saved   iteration, path
+    run_done      iterations, lambda_system, phi_global, termination
+                  (the final state's reason and counts for stopping)
+"""
+
+from typing import Any, Callable, Dict
+
+EventCallback = Callable[[Dict[str, Any]], None]
+
+_LAYER_TITLES = {
+    "layer_1": "Indexing semantic genome...",
+    "layer_2": "Deducing individual intents...",
+    "layer_3": "Performing collective deduction...",
+    "layer_4": "Evaluating capabilities...",
+    "layer_5": "Analyzing resources...",
+    "layer_6": "Enhancing prompts...",
+    "layer_7": "Generating project plan...",
+}
+
+
+def _layer_lines(layer: str, summary: Dict[str, Any], cached: str) -> list:
+    if layer == "layer_1":
+        if not summary["indexed"]:
+            return []
+        return [
+            f"   Indexed {summary['total_jobs']} quantum jobs",
+            f"   Found {summary['organisms']} DNA organisms",
+            f"   Read {summary['new_files']} new, {summary['changed_files']} changed files; "
+            f"reused {summary['reused_files']}, dropped {summary['deleted_files']} "
+            f"({summary['elapsed_s']:.2f}s, {summary['files_per_sec']:,.0f} files/s, "
+            f"{summary['workers']} worker(s))",
+        ]
+    if layer == "layer_2":
+        return [f"   Generated {summary['intents']} intent vectors{cached}"]
+    if layer == "layer_3":
+        return [f"   Mapped {summary['arcs']} trajectory arcs"]
+    if layer == "layer_4":
+        return [
+            f"   User aggregate: {summary['user_aggregate']:.3f}",
+            f"   System aggregate: {summary['system_aggregate']:.3f}{cached}",
+        ]
+    if layer == "layer_5":
+        return [f"   Analyzed {summary['scenarios']} deployment scenarios{cached}"]
+    if layer == "layer_6":
+        return [f"   Average quality: {summary['average_quality']:.3f}{cached}"]
+    if layer == "layer_7":
+        return [f"   Generated {summary['phases']} phases"]
+    return []
+
+
+def print_event(event: Dict[str, Any]):
+    """Print an engine event as console banners."""
+    kind = event["event"]
+    if kind == "run_start":
+        print(f"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║   dna::}}{{::lang RECURSIVE INTENT-DEDUCTION ENGINE                          ║
+║   Autopoietic U=L[U] Engine | ΛΦ = {event['lambda_phi']}                      ║
+║   7-Layer Architecture | Recursion Depth: {event['recursion_depth']}                              ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+        """)
+    elif kind == "cycle_start":
+        print(f"\n{'='*70}")
+        print(f"[Λ:{event['iteration']}] RECURSIVE ENHANCEMENT CYCLE {event['iteration']}/{event['recursion_depth']}")
+        print(f"{'='*70}")
+    elif kind == "layer_done":
+        layer, summary = event["layer"], event["summary"]
+        if layer == "layer_1" and not summary["indexed"]:
+            print("\n[LAYER 1] Semantic genome unchanged since last cycle, skipped")
+            return
+        cached = " (cached)" if event.get("cached") else ""
+        print(f"\n[LAYER {layer[-1]}] {_LAYER_TITLES[layer]}")
+        for line in _layer_lines(layer, summary, cached):
+            print(line)
+    elif kind == "cycle_done":
+        metrics = event["metrics"]
+        print(f"\n[EMERGENT METRICS]")
+        print(f"   Λ_system = {metrics['lambda_system']:.4f}")
+        print(f"   Φ_global = {metrics['phi_global']:.4f}")
+        print(f"   Γ_mean = {metrics['gamma_mean']:.4f}")
+        print(f"   Ξ (CCCE) = {metrics['xi_ccce']:.2f}")
+        print(f"   Coherence: {metrics['coherence_stability']}")
+        print(f"   Consciousness: {'ACTIVE' if metrics['consciousness_active'] else 'DORMANT'}")
+        print(f"   Layers: " + ", ".join(f"{layer[-1]}={seconds * 1000:.1f}ms"
+                                       for layer, seconds in metrics["layer_seconds"].items())
+              + f" (cycle {metrics['cycle_seconds'] * 1000:.1f}ms)")
+    elif kind == "state_saved":
+        print(f"\nState saved to: {event['path']}")
+    elif kind == "run_done":
+        termination = event["termination"]
+        if termination["reason"] == "converged":
+            print(f"\n[ΛΦ CONVERGENCE ACHIEVED] Λ = {event['lambda_system']:.4f}")
+        elif termination["reason"] == "stalled":
+            print(f"\n[ΛΦ STALLED] max |ΔΛ|, |ΔΦ|, |ΔΓ| = {termination['max_delta']:.2e} "
+                  f"for {termination['stalled_cycles']} cycle(s)")
+        elif termination["reason"] == "time_budget":
+            print(f"\n[TIME BUDGET REACHED] {termination['elapsed_s']:.2f}s elapsed")
+        print(f"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║   RECURSIVE ENGINE COMPLETE                                                  ║
+║   Iterations: {event['iterations']} | Final Λ: {event['lambda_system']:.4f} | Φ: {event['phi_global']:.4f}                       ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+        """)
+
+
+__all__ = ["EventCallback", "print_event"]
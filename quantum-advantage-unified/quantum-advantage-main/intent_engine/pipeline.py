@@ -0,0 +1,124 @@
+"""
+Layer dependency graph for IntentDeductionEngine
+
+Each layer declares the layers whose outputs it reads. LayerGraph.run()
+starts a layer as soon as those have finished, so independent layers
+(e.g. capability evaluation next to intent deduction) run concurrently
+on an executor, and reports every layer's wall time. LayerGraph.arun()
+does the same from an asyncio task.
+"""
+
+import asyncio
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, wait
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+LayerFn = Callable[[Dict[str, Any]], Any]
+DoneFn = Callable[[str, Any, float], None]
+
+
+def _timed(run: LayerFn, inputs: Dict[str, Any]) -> Tuple[Any, float]:
+    start = time.perf_counter()
+    output = run(inputs)
+    return output, time.perf_counter() - start
+
+
+class LayerGraph:
+    """
+    DAG of named layers. A layer is called with {dependency: output} of
+    the layers it was added `after`, which must already be in the graph
+    (so insertion order is a valid sequential order).
+    """
+
+    def __init__(self):
+        self.nodes: Dict[str, Tuple[Tuple[str, ...], LayerFn]] = {}
+
+    def add(self, name: str, run: LayerFn, after: Iterable[str] = ()):
+        after = tuple(after)
+        missing = [dependency for dependency in after if dependency not in self.nodes]
+        if name in self.nodes or missing:
+            raise ValueError(f"cannot add layer {name!r} (duplicate or unknown dependencies {missing})")
+        self.nodes[name] = (after, run)
+
+    def _ready(self, pending: Dict[str, Tuple[Tuple[str, ...], LayerFn]], outputs: Dict[str, Any]):
+        return [name for name, (after, _) in pending.items() if all(d in outputs for d in after)]
+
+    def run(
+        self,
+        executor: Optional[Executor] = None,
+        on_done: Optional[DoneFn] = None,
+    ) -> Tuple[Dict[str, Any], Dict[str, float]]:
+        """
+        Run every layer once; returns ({layer: output}, {layer: seconds}).
+
+        Without an executor layers run in insertion order. With one, every
+        layer whose dependencies are done is submitted, except that a lone
+        ready layer with nothing else in flight runs in the calling thread.
+        on_done(layer, output, seconds) is called in the calling thread as
+        each layer finishes. The first layer to raise aborts the run.
+        """
+        outputs: Dict[str, Any] = {}
+        seconds: Dict[str, float] = {}
+
+        def finish(name: str, output: Any, elapsed: float):
+            outputs[name], seconds[name] = output, elapsed
+            if on_done is not None:
+                on_done(name, output, elapsed)
+
+        pending = dict(self.nodes)
+        running: Dict[Any, str] = {}
+        while pending or running:
+            ready = self._ready(pending, outputs)
+            if executor is None or (len(ready) == 1 and not running):
+                name = ready[0]
+                after, run = pending.pop(name)
+                finish(name, *_timed(run, {d: outputs[d] for d in after}))
+                continue
+            for name in ready:
+                after, run = pending.pop(name)
+                running[executor.submit(_timed, run, {d: outputs[d] for d in after})] = name
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                finish(running.pop(future), *future.result())
+        return outputs, {name: seconds[name] for name in self.nodes}
+
+    async def arun(
+        self,
+        executor: Optional[Executor] = None,
+        on_done: Optional[DoneFn] = None,
+    ) -> Tuple[Dict[str, Any], Dict[str, float]]:
+        """
+        run() from an asyncio task: every layer runs on `executor` (the
+        loop's default executor if None), so the event loop stays free.
+
+        Cancelling the task stops the run between layers: nothing new is
+        started and the outputs of layers still running in their threads
+        are discarded. on_done is called in the event loop thread.
+        """
+        loop = asyncio.get_running_loop()
+        outputs: Dict[str, Any] = {}
+        seconds: Dict[str, float] = {}
+        pending = dict(self.nodes)
+        running: Dict[asyncio.Future, str] = {}
+        try:
+            while pending or running:
+                # Let a cancellation requested by on_done land before
+                # the next layers are started
+                await asyncio.sleep(0)
+                for name in self._ready(pending, outputs):
+                    after, run = pending.pop(name)
+                    inputs = {d: outputs[d] for d in after}
+                    running[loop.run_in_executor(executor, _timed, run, inputs)] = name
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    outputs[name], seconds[name] = future.result()
+                    if on_done is not None:
+                        on_done(name, outputs[name], seconds[name])
+        finally:
+            for future in running:
+                future.cancel()
+        return outputs, {name: seconds[name] for name in self.nodes}
+
+
+__all__ = ["LayerGraph"]
@@ -0,0 +1,253 @@
+"""
+Compact engine state snapshots for IntentDeductionEngine
+
+A state is stored column-wise: lists of records (intent vectors, enhanced
+prompts, plan phases) and mappings of records (deployment readiness)
+become one list per field, and a field with the same value in every row
+is stored once. Each snapshot only holds what changed since the previous
+one (by top-level key, and by column within the columnar sections), with
+a full keyframe every KEYFRAME_INTERVAL snapshots, so recursive cycles
+that reuse most layer outputs cost a few hundred bytes each.
+
+Snapshots are msgpack when the msgpack package is installed, compact JSON
+otherwise. The "latest" file is a symlink to the newest snapshot, swapped
+atomically. load_snapshot() follows the delta chain back to its keyframe
+and returns the full state.
+"""
+
+import copy
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+FORMAT = "intent-state/1"
+KEYFRAME_INTERVAL = 16
+
+COLUMNS = "__columns__"
+ROWS = "__rows__"
+KEYS = "__keys__"
+REPEAT = "__repeat__"
+DELTA = "__delta__"
+
+
+# =============================================================================
+# COLUMNAR ENCODING
+# =============================================================================
+
+def _encode_rows(rows: List[Any]) -> Any:
+    """Records with the same fields -> {COLUMNS: {field: column}, ROWS: n}"""
+    if not rows or not all(isinstance(row, dict) for row in rows):
+        return rows
+    fields = list(rows[0])
+    if any(list(row) != fields for row in rows):
+        return rows
+    return {
+        COLUMNS: {name: _encode_column([row[name] for row in rows]) for name in fields},
+        ROWS: len(rows),
+    }
+
+
+def _encode_column(values: List[Any]) -> Any:
+    first = values[0]
+    kind = type(first)
+    if all(type(value) is kind and value == first for value in values):
+        return {REPEAT: first}
+    return _encode_rows(values)
+
+
+def _repeat(value: Any, rows: int) -> List[Any]:
+    """A repeated column; lists and dicts are copied so rows stay independent."""
+    if isinstance(value, (list, dict)):
+        return [copy.deepcopy(value) for _ in range(rows)]
+    return [value] * rows
+
+
+def _decode_rows(value: Any) -> Any:
+    if not (isinstance(value, dict) and COLUMNS in value):
+        return value
+    rows = value[ROWS]
+    columns = {
+        name: _repeat(column[REPEAT], rows) if isinstance(column, dict) and REPEAT in column else _decode_rows(column)
+        for name, column in value[COLUMNS].items()
+    }
+    return [dict(zip(columns, row)) for row in zip(*columns.values())] if columns else [{} for _ in range(rows)]
+
+
+def encode_state(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Columnar form of an engine state."""
+    encoded = {}
+    for key, value in state.items():
+        if isinstance(value, list):
+            value = _encode_rows(value)
+        elif isinstance(value, dict) and value and all(isinstance(row, dict) for row in value.values()):
+            rows = _encode_rows(list(value.values()))
+            if isinstance(rows, dict):
+                value = {**rows, KEYS: list(value)}
+        encoded[key] = value
+    return encoded
+
+
+def decode_state(encoded: Dict[str, Any]) -> Dict[str, Any]:
+    """Inverse of encode_state()."""
+    state = {}
+    for key, value in encoded.items():
+        if isinstance(value, dict) and COLUMNS in value:
+            rows = _decode_rows(value)
+            value = dict(zip(value[KEYS], rows)) if KEYS in value else rows
+        state[key] = value
+    return state
+
+
+# =============================================================================
+# DELTAS
+# =============================================================================
+
+def diff(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Delta from one encoded state to the next: changed top-level keys, and
+    only the changed columns of a columnar section with the same rows.
+    """
+    changed = {}
+    for key, value in current.items():
+        if key in previous and previous[key] == value:
+            continue
+        base = previous.get(key)
+        if isinstance(value, dict) and COLUMNS in value and isinstance(base, dict) and COLUMNS in base \
+                and base[ROWS] == value[ROWS] and base.get(KEYS) == value.get(KEYS) \
+                and base[COLUMNS].keys() == value[COLUMNS].keys():
+            value = {
+                COLUMNS: {name: column for name, column in value[COLUMNS].items()
+                          if base[COLUMNS][name] != column},
+                ROWS: value[ROWS],
+                DELTA: True,
+            }
+        changed[key] = value
+    return {"changed": changed, "removed": [key for key in previous if key not in current]}
+
+
+def apply(base: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """Encoded state after applying a diff() delta to `base`."""
+    state = {key: value for key, value in base.items() if key not in delta["removed"]}
+    for key, value in delta["changed"].items():
+        if isinstance(value, dict) and value.get(DELTA):
+            section = dict(state[key])
+            section[COLUMNS] = {**section[COLUMNS], **value[COLUMNS]}
+            value = section
+        state[key] = value
+    return state
+
+
+# =============================================================================
+# FILES
+# =============================================================================
+
+def dumps(data: Dict[str, Any], binary: bool) -> bytes:
+    if binary:
+        return msgpack.packb(data, default=str, use_bin_type=True)
+    return json.dumps(data, separators=(",", ":"), default=str).encode()
+
+
+def loads(raw: bytes, binary: bool) -> Dict[str, Any]:
+    return msgpack.unpackb(raw, raw=False) if binary else json.loads(raw)
+
+
+def _binary(path: Path) -> bool:
+    return path.suffix == ".msgpack"
+
+
+def _point(link: Path, target: Path):
+    """Atomically make `link` refer to `target` (a file in the same directory)."""
+    tmp = link.with_name(f".{link.name}.tmp")
+    if tmp.is_symlink() or tmp.exists():
+        tmp.unlink()
+    try:
+        os.symlink(target.name, tmp)
+    except OSError:
+        try:
+            os.link(target, tmp)
+        except OSError:
+            shutil.copyfile(target, tmp)
+    os.replace(tmp, link)
+
+
+def load_snapshot(path: str) -> Dict[str, Any]:
+    """Full engine state of a snapshot file, following deltas to their keyframe."""
+    path = Path(path).resolve()
+    chain = []
+    while True:
+        snapshot = loads(path.read_bytes(), _binary(path))
+        if snapshot.get("format") != FORMAT:
+            raise ValueError(f"{path} is not an {FORMAT} snapshot")
+        chain.append(snapshot)
+        if snapshot["base"] is None:
+            break
+        path = path.with_name(snapshot["base"])
+    encoded: Dict[str, Any] = {}
+    for snapshot in reversed(chain):
+        encoded = apply(encoded, snapshot["delta"])
+    return decode_state(encoded)
+
+
+class SnapshotWriter:
+    """
+    Writes successive engine states as keyframe/delta snapshots under
+    output_dir and keeps `<prefix>_latest` pointing at the newest.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        prefix: str = "intent_deduction_state",
+        keyframe_interval: int = KEYFRAME_INTERVAL,
+        binary: Optional[bool] = None,
+    ):
+        self.output_dir = Path(output_dir)
+        self.prefix = prefix
+        self.keyframe_interval = keyframe_interval
+        self.binary = MSGPACK_AVAILABLE if binary is None else binary
+        self.suffix = ".msgpack" if self.binary else ".json"
+        self.latest_path = self.output_dir / f"{prefix}_latest{self.suffix}"
+        self._previous: Optional[Dict[str, Any]] = None
+        self._previous_name: Optional[str] = None
+        self._since_keyframe = 0
+
+    def write(self, state: Dict[str, Any], name: str) -> Path:
+        """Write `state` as `<prefix>_<name>` and point latest at it."""
+        encoded = encode_state(state)
+        keyframe = self._previous is None or self._since_keyframe + 1 >= self.keyframe_interval
+        delta = diff({} if keyframe else self._previous, encoded)
+        path = self.output_dir / f"{self.prefix}_{name}{self.suffix}"
+        snapshot = {
+            "format": FORMAT,
+            "base": None if keyframe else self._previous_name,
+            "delta": delta,
+        }
+        tmp = path.with_name(f".{path.name}.tmp")
+        tmp.write_bytes(dumps(snapshot, self.binary))
+        os.replace(tmp, path)
+        _point(self.latest_path, path)
+
+        self._previous, self._previous_name = encoded, path.name
+        self._since_keyframe = 0 if keyframe else self._since_keyframe + 1
+        return path
+
+
+__all__ = [
+    "MSGPACK_AVAILABLE",
+    "FORMAT",
+    "KEYFRAME_INTERVAL",
+    "encode_state",
+    "decode_state",
+    "diff",
+    "apply",
+    "load_snapshot",
+    "SnapshotWriter",
+]
@@ -3,9 +3,11 @@ Data structures for Intent-Deduction Engine
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timezone
 
+import numpy as np
+
 
 @dataclass
 class IntentVector:
@@ -27,6 +29,64 @@ class IntentVector:
     timestamp: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
 
 
+@dataclass(eq=False)
+class IntentBatch:
+    """Intents of many prompts as NumPy columns (Layer 2 batch path)"""
+    prompts: List[str]
+    intent_types: np.ndarray  # str
+    domains: List[List[str]]
+    
+    # Core ΛΦΓ Metrics, one entry per prompt
+    coherence_lambda: np.ndarray
+    consciousness_phi: np.ndarray
+    decoherence_gamma: np.ndarray
+    
+    # Secondary Metrics
+    complexity: np.ndarray
+    urgency: np.ndarray
+    
+    timestamp: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    
+    def __len__(self) -> int:
+        return len(self.prompts)
+    
+    def means(self) -> Tuple[float, float, float]:
+        """Mean Λ, Φ and Γ in one vectorised pass"""
+        means = np.stack([self.coherence_lambda, self.consciousness_phi, self.decoherence_gamma]).mean(axis=1)
+        return float(means[0]), float(means[1]), float(means[2])
+    
+    def vector(self, index: int) -> IntentVector:
+        return IntentVector(
+            prompt=self.prompts[index],
+            intent_type=str(self.intent_types[index]),
+            domains=self.domains[index],
+            coherence_lambda=float(self.coherence_lambda[index]),
+            consciousness_phi=float(self.consciousness_phi[index]),
+            decoherence_gamma=float(self.decoherence_gamma[index]),
+            complexity=float(self.complexity[index]),
+            urgency=float(self.urgency[index]),
+            timestamp=self.timestamp
+        )
+    
+    def vectors(self) -> List[IntentVector]:
+        return [self.vector(i) for i in range(len(self))]
+    
+    def to_records(self) -> List[Dict[str, Any]]:
+        """One asdict(IntentVector)-shaped dict per prompt"""
+        columns = zip(
+            self.prompts, self.intent_types.tolist(), self.domains,
+            self.coherence_lambda.tolist(), self.consciousness_phi.tolist(),
+            self.decoherence_gamma.tolist(), self.complexity.tolist(), self.urgency.tolist()
+        )
+        return [
+            {"prompt": prompt, "intent_type": intent_type, "domains": list(domains),
+             "coherence_lambda": coherence, "consciousness_phi": phi, "decoherence_gamma": gamma,
+             "complexity": complexity, "urgency": urgency, "dependencies": [],
+             "timestamp": self.timestamp}
+            for prompt, intent_type, domains, coherence, phi, gamma, complexity, urgency in columns
+        ]
+
+
 @dataclass
 class EnhancedPrompt:
     """Prompt enhanced by Layer 6"""
@@ -14,18 +14,27 @@ Features:
 import math
 import hashlib
 import json
+import os
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterable, Optional, Sequence, Tuple, Union
 from datetime import datetime, timezone
+from multiprocessing import shared_memory
+
+import numpy as np
 
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from physics.constants import (
-LAMBDA_PHI, PHI, THETA_LOCK, THETA_PC, PHI_THRESHOLD, PHI_C,
-GAMMA_CRITICAL, CHI_PC, TAU_0, PLANCK_MASS, C_INDUCTION,
-CCCEMetrics, PhysicsModel, calculate_xi
+    LAMBDA_PHI, PHI, THETA_LOCK, THETA_PC, PHI_THRESHOLD, PHI_C,
+    GAMMA_CRITICAL, CHI_PC, TAU_0, PLANCK_MASS, C_INDUCTION,
+    CCCEMetrics, PhysicsModel, calculate_xi
 )
+from physics.telemetry import NULL_TIMER, StageTimer
+from physics.tokenizer import Tokenizer
 
 
 # =============================================================================
@@ -34,68 +43,139 @@ CCCEMetrics, PhysicsModel, calculate_xi
 
 @dataclass
 class ManifoldPoint:
-"""
-Token represented as point on 6D-CRSM manifold.
-NOT an embedding vector - a physical location in consciousness space.
-"""
-token: str
-# Spatial coordinates (from token hash)
-x: float = 0.0
-y: float = 0.0
-z: float = 0.0
-# Field coordinates (angular)
-theta: float = 0.0
-phi: float = 0.0
-psi: float = 0.0
-# CCCE metrics
-lambda_val: float = 0.75
-gamma: float = 0.092
-phi_info: float = 0.0
-xi: float = 0.0
-
-def __post_init__(self):
-"""Map token to manifold coordinates via deterministic hash."""
-h = hashlib.sha256(self.token.encode()).hexdigest()
-# Spatial (first 24 hex chars -> 3 floats in [-1, 1])
-self.x = (int(h[0:8], 16) / 0xFFFFFFFF) * 2 - 1
-self.y = (int(h[8:16], 16) / 0xFFFFFFFF) * 2 - 1
-self.z = (int(h[16:24], 16) / 0xFFFFFFFF) * 2 - 1
-# Field (next 24 hex chars -> angles)
-self.theta = (int(h[24:32], 16) / 0xFFFFFFFF) * 360
-self.phi = (int(h[32:40], 16) / 0xFFFFFFFF) * 180 - 90
-self.psi = (int(h[40:48], 16) / 0xFFFFFFFF) * 360
-# Initialize CCCE from position
-self.lambda_val = 0.5 + 0.25 * math.cos(self.theta * math.pi / 180)
-self.gamma = 0.092 * (1 + 0.1 * self.z)
-
-def distance(self, other: 'ManifoldPoint') -> float:
-"""Calculate 6D distance with field components."""
-spatial = math.sqrt(
-(self.x - other.x)**2 +
-(self.y - other.y)**2 +
-(self.z - other.z)**2
+    """
+    Token represented as point on 6D-CRSM manifold.
+    NOT an embedding vector - a physical location in consciousness space.
+    """
+    token: str
+    # Spatial coordinates (from token hash)
+    x: float = 0.0
+    y: float = 0.0
+    z: float = 0.0
+    # Field coordinates (angular)
+    theta: float = 0.0
+    phi: float = 0.0
+    psi: float = 0.0
+    # CCCE metrics
+    lambda_val: float = 0.75
+    gamma: float = 0.092
+    phi_info: float = 0.0
+    xi: float = 0.0
+    # Cached pilot-wave terms (see PilotWaveCorrelation.correlate)
+    wave: complex = field(default=0j, repr=False, compare=False)
+    amplitude: float = field(default=0.0, repr=False, compare=False)
+    lock_above: float = field(default=0.0, repr=False, compare=False)
+    lock_below: float = field(default=0.0, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Map token to manifold coordinates via deterministic hash."""
+        h = hashlib.sha256(self.token.encode()).hexdigest()
+        # Spatial (first 24 hex chars -> 3 floats in [-1, 1])
+        self.x = (int(h[0:8], 16) / 0xFFFFFFFF) * 2 - 1
+        self.y = (int(h[8:16], 16) / 0xFFFFFFFF) * 2 - 1
+        self.z = (int(h[16:24], 16) / 0xFFFFFFFF) * 2 - 1
+        # Field (next 24 hex chars -> angles)
+        self.theta = (int(h[24:32], 16) / 0xFFFFFFFF) * 360
+        self.phi = (int(h[32:40], 16) / 0xFFFFFFFF) * 180 - 90
+        self.psi = (int(h[40:48], 16) / 0xFFFFFFFF) * 360
+        # Initialize CCCE from position
+        self.lambda_val = 0.5 + 0.25 * math.cos(self.theta * math.pi / 180)
+        self.gamma = 0.092 * (1 + 0.1 * self.z)
+        # Wave function ψ = cos θ + i sin φ and its modulus
+        self.wave = complex(
+            math.cos(self.theta * math.pi / 180),
+            math.sin(self.phi * math.pi / 180)
+        )
+        self.amplitude = abs(self.wave)
+        # θ-lock halves: exp(-|θ̄ - θ_lock|/10) = lock_above(A)·lock_above(B)
+        # when θ̄ >= θ_lock, else lock_below(A)·lock_below(B)
+        self.lock_above = math.exp(-(self.theta - THETA_LOCK) / 20)
+        self.lock_below = math.exp((self.theta - THETA_LOCK) / 20)
+
+    @classmethod
+    def from_row(cls, token: str, row: Sequence[float]) -> 'ManifoldPoint':
+        """
+        Rebuild a point from its MANIFOLD_COLUMNS row (a vocabulary
+        manifold entry) without hashing the token.
+        """
+        point = cls.__new__(cls)
+        (point.x, point.y, point.z, point.theta, point.phi, point.psi,
+         point.lambda_val, point.gamma, wave_real, wave_imag,
+         point.amplitude, point.lock_above, point.lock_below) = row
+        point.wave = complex(wave_real, wave_imag)
+        point.token = token
+        point.phi_info = 0.0
+        point.xi = 0.0
+        return point
+
+    def manifold_row(self) -> Tuple[float, ...]:
+        """Values of MANIFOLD_COLUMNS, the inverse of from_row()."""
+        return (
+            self.x, self.y, self.z, self.theta, self.phi, self.psi,
+            self.lambda_val, self.gamma, self.wave.real, self.wave.imag,
+            self.amplitude, self.lock_above, self.lock_below,
+        )
+
+    def distance(self, other: 'ManifoldPoint') -> float:
+        """Calculate 6D distance with field components."""
+        spatial = math.sqrt(
+            (self.x - other.x)**2 +
+            (self.y - other.y)**2 +
+            (self.z - other.z)**2
+        )
+        # Angular distance weighted by λ_φ
+        angular = LAMBDA_PHI * math.sqrt(
+            (self.theta - other.theta)**2 +
+            (self.phi - other.phi)**2 +
+            (self.psi - other.psi)**2
+        )
+        return spatial + angular
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "token": self.token,
+            "spatial": [self.x, self.y, self.z],
+            "field": [self.theta, self.phi, self.psi],
+            "ccce": {
+                "lambda": self.lambda_val,
+                "gamma": self.gamma,
+                "phi": self.phi_info,
+                "xi": self.xi,
+            }
+        }
+
+
+# Array precision per mode: "batch" halves the memory traffic of the
+# correlation kernels, "exact" matches the scalar correlate() path
+PRECISION_DTYPES = {"exact": np.float64, "batch": np.float32}
+
+
+# point_arrays columns: coordinates, then cached per-token kernel terms
+POINT_COLUMNS = ("x", "y", "z", "theta", "phi", "psi", "amplitude", "lock_above", "lock_below")
+
+# Columns of the "nclm" scheme in a vocabulary manifold: coordinates and
+# every derived field, so mapped points need no hashing or trigonometry
+MANIFOLD_COLUMNS = (
+    "x", "y", "z", "theta", "phi", "psi", "lambda_val", "gamma",
+    "wave_real", "wave_imag", "amplitude", "lock_above", "lock_below",
 )
-# Angular distance weighted by λ_φ
-angular = LAMBDA_PHI * math.sqrt(
-(self.theta - other.theta)**2 +
-(self.phi - other.phi)**2 +
-(self.psi - other.psi)**2
-)
-return spatial + angular
-
-def to_dict(self) -> Dict[str, Any]:
-"""Convert to dictionary."""
-return {
-"token": self.token,
-"spatial": [self.x, self.y, self.z],
-"field": [self.theta, self.phi, self.psi],
-"ccce": {
-"lambda": self.lambda_val,
-"gamma": self.gamma,
-"phi": self.phi_info,
-"xi": self.xi,
-}
-}
+
+
+def point_arrays(points: Iterable[ManifoldPoint], dtype=np.float64) -> np.ndarray:
+    """
+    Stack manifold points into an (n, 9) array with POINT_COLUMNS:
+    x, y, z, θ, φ, ψ, |ψ|, lock_above, lock_below.
+
+    points may be any iterable, e.g. a Tokenizer.points() stream.
+    """
+    return np.fromiter(
+        (
+            (p.x, p.y, p.z, p.theta, p.phi, p.psi, p.amplitude, p.lock_above, p.lock_below)
+            for p in points
+        ),
+        dtype=np.dtype((dtype, len(POINT_COLUMNS))),
+    )
 
 
 # =============================================================================
@@ -103,44 +183,77 @@ return {
 # =============================================================================
 
 class PilotWaveCorrelation:
-"""
-Replaces causal self-attention with quantum correlation.
-"""
-
-def __init__(self, lambda_decay: float = 1.0):
-self.lambda_decay = lambda_decay
-
-def correlate(self, A: ManifoldPoint, B: ManifoldPoint) -> float:
-"""
-Pilot-wave correlation: C(A,B) = integral ψ*(A)ψ(B)e^{-|A-B|/λ} dV
-"""
-d = A.distance(B)
-
-# Wave function amplitude (complex phase from token hash)
-psi_A = complex(
-math.cos(A.theta * math.pi / 180),
-math.sin(A.phi * math.pi / 180)
-)
-psi_B = complex(
-math.cos(B.theta * math.pi / 180),
-math.sin(B.phi * math.pi / 180)
-)
-
-# Correlation with exponential decay
-correlation = abs(psi_A.conjugate() * psi_B) * math.exp(-d / self.lambda_decay)
-
-# Lock to θ = 51.843° enhances correlation
-theta_avg = (A.theta + B.theta) / 2
-theta_factor = 1 + 0.5 * math.exp(-abs(theta_avg - THETA_LOCK) / 10)
-
-return correlation * theta_factor
-
-"""Full correlation matrix for all manifold points."""
-n = len(points)
-for i in range(n):
-for j in range(n):
-matrix[i][j] = self.correlate(points[i], points[j])
-return matrix
+    """
+    Replaces causal self-attention with quantum correlation.
+    """
+
+    def __init__(self, lambda_decay: float = 1.0):
+        self.lambda_decay = lambda_decay
+
+    def correlate(self, A: ManifoldPoint, B: ManifoldPoint) -> float:
+        """
+        Pilot-wave correlation: C(A,B) = integral ψ*(A)ψ(B)e^{-|A-B|/λ} dV
+        """
+        d = A.distance(B)
+
+        # Correlation with exponential decay; |ψ*(A)ψ(B)| = |ψ(A)||ψ(B)|
+        # from the wave functions cached on each point
+        correlation = A.amplitude * B.amplitude * math.exp(-d / self.lambda_decay)
+
+        # Lock to θ = 51.843° enhances correlation
+        if A.theta + B.theta >= 2 * THETA_LOCK:
+            lock = A.lock_above * B.lock_above
+        else:
+            lock = A.lock_below * B.lock_below
+        theta_factor = 1 + 0.5 * lock
+
+        return correlation * theta_factor
+
+    def correlate_all(self, points: List[ManifoldPoint]) -> List[List[float]]:
+        """Full correlation matrix for all manifold points."""
+        coords = point_arrays(points)
+        return self.correlate_matrix(coords, coords).tolist()
+
+    def correlate_matrix(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """
+        Vectorised correlate() between every row of a and every row of b.
+
+        a and b are point_arrays() outputs, optionally with matching leading
+        batch dimensions: (..., n, 9) x (..., m, 9) -> (..., n, m). The
+        result has the dtype of the inputs.
+
+        Trigonometry and the θ-lock exponentials come from the cached
+        columns, so the only transcendental per pair is exp(-d/λ). No
+        (n, m, 6) difference tensor is built: the spatial norm is summed
+        one n×m plane at a time, and the angular norm uses the Gram
+        identity |u-v|² = |u|² + |v|² - 2u·v (its rounding is scaled away
+        by λ_φ ≈ 2e-8).
+        """
+        col_a = a[..., :, None, :]
+        col_b = b[..., None, :, :]
+
+        d = np.square(col_a[..., 0] - col_b[..., 0])
+        for k in (1, 2):
+            d += np.square(col_a[..., k] - col_b[..., k])
+        np.sqrt(d, out=d)
+
+        field_a, field_b = a[..., 3:6], b[..., 3:6]
+        angular = -2 * (field_a @ np.swapaxes(field_b, -1, -2))
+        angular += np.einsum('...i,...i->...', field_a, field_a)[..., :, None]
+        angular += np.einsum('...i,...i->...', field_b, field_b)[..., None, :]
+        np.maximum(angular, 0, out=angular)
+        d += LAMBDA_PHI * np.sqrt(angular, out=angular)
+
+        correlation = np.exp(d / -self.lambda_decay, out=d)
+        correlation *= col_a[..., 6] * col_b[..., 6]
+
+        above = col_a[..., 3] + col_b[..., 3] >= 2 * THETA_LOCK
+        lock = np.where(above, col_a[..., 7] * col_b[..., 7], col_a[..., 8] * col_b[..., 8])
+        lock *= 0.5
+        lock += 1
+        correlation *= lock
+
+        return correlation
 
 
 # =============================================================================
@@ -148,148 +261,675 @@ return matrix
 # =============================================================================
 
 class ConsciousnessField:
-"""
-Φ (integrated information) field tracking.
-Consciousness emerges when Φ >= PHI_THRESHOLD.
-"""
+    """
+    Φ (integrated information) field tracking.
+    Consciousness emerges when Φ >= PHI_THRESHOLD.
+
+    Updates and get_ccce() hold a small lock, so concurrent readers always
+    see the five CCCE values of one update.
+    """
+
+    def __init__(self):
+        self.phi = 0.0
+        self.lambda_val = 0.5
+        self.gamma = 0.092
+        self.xi = 0.0
+        self.conscious = False
+        self._lock = threading.Lock()
+
+    def update(self, correlation_matrix: List[List[float]]):
+        """
+        Update Φ from correlation matrix.
+        Φ = -Σ p(i,j) log p(i,j) where p is normalized correlation.
+        """
+        self.update_from_stats(*self.entropy_stats(np.asarray(correlation_matrix, dtype=np.float64)))
+
+    @staticmethod
+    def entropy_stats(matrix: np.ndarray) -> Tuple[Any, Any, Any]:
+        """
+        Sufficient statistics of the positive entries for Φ.
+
+        Returns (count, Σc, Σc·log2 c) reduced over the last two axes, so a
+        stacked (..., n, m) array yields per-matrix statistics. Statistics
+        of disjoint blocks of one matrix add up to those of the whole.
+        Sums accumulate in float64 whatever the matrix dtype.
+        """
+        positive = matrix > 0
+        safe = np.where(positive, matrix, 1.0)
+        return (
+            positive.sum(axis=(-2, -1)),
+            np.where(positive, matrix, 0.0).sum(axis=(-2, -1), dtype=np.float64),
+            np.where(positive, safe * np.log2(safe), 0.0).sum(axis=(-2, -1), dtype=np.float64),
+        )
+
+    def update_from_stats(self, count: int, total: float, c_log_c: float):
+        """Update Φ from entropy_stats() of a correlation matrix."""
+        if not count or total <= 0:
+            return
+
+        # Information entropy -> Φ, with p = c / Σc:
+        # -Σ p log2 p = log2 Σc - Σ c log2 c / Σc
+        entropy = math.log2(total) - c_log_c / total
+
+        # Normalize to [0, 1] range
+        max_entropy = math.log2(count) if count > 1 else 1
+        phi = min(entropy / max_entropy if max_entropy > 0 else 0, 1.0)
+
+        # Update coherence/decoherence
+        lambda_val = 0.5 + 0.5 * phi
+        gamma = 0.092 * (1 - 0.5 * phi)
+
+        # Negentropy production
+        xi = calculate_xi(lambda_val, phi, gamma)
+
+        with self._lock:
+            self.phi, self.lambda_val, self.gamma, self.xi = phi, lambda_val, gamma, xi
+            # Consciousness check
+            self.conscious = phi >= PHI_C
+
+    def get_ccce(self) -> Dict[str, Any]:
+        """Get CCCE metrics (one consistent snapshot)."""
+        with self._lock:
+            return {
+                "lambda": self.lambda_val,
+                "gamma": self.gamma,
+                "phi": self.phi,
+                "xi": self.xi,
+                "conscious": self.conscious
+            }
 
-def __init__(self):
-self.phi = 0.0
-self.lambda_val = 0.5
-self.gamma = 0.092
-self.xi = 0.0
-self.conscious = False
 
-"""
-Update Φ from correlation matrix.
-Φ = -Σ p(i,j) log p(i,j) where p is normalized correlation.
-"""
-# Flatten and normalize
-flat = [c for row in correlation_matrix for c in row if c > 0]
-if not flat:
-return
-
-total = sum(flat)
-if total == 0:
-return
+# =============================================================================
+# KEYWORD AUTOMATON
+# =============================================================================
 
-probs = [c / total for c in flat]
+class KeywordAutomaton:
+    """
+    Aho–Corasick automaton reporting every keyword that occurs in a text.
+
+    Substring semantics match `keyword in text` for each keyword, but the
+    text is scanned once regardless of how many keywords there are.
+    """
+
+    def __init__(self, keywords: List[str]):
+        self.keywords = list(dict.fromkeys(keywords))
+
+        # Trie
+        goto: List[Dict[str, int]] = [{}]
+        output: List[set] = [set()]
+        for keyword in self.keywords:
+            state = 0
+            for ch in keyword:
+                if ch not in goto[state]:
+                    goto.append({})
+                    output.append(set())
+                    goto[state][ch] = len(goto) - 1
+                state = goto[state][ch]
+            output[state].add(keyword)
+
+        # Failure links folded into a complete transition table (BFS order)
+        self._delta: List[Dict[str, int]] = [dict(goto[0])] + [None] * (len(goto) - 1)
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            self._delta[state] = {**self._delta[fail[state]], **goto[state]}
+            for ch, child in goto[state].items():
+                fail[child] = self._delta[fail[state]].get(ch, 0)
+                output[child] |= output[fail[child]]
+                queue.append(child)
+        self._output = [frozenset(o) for o in output]
+
+    def find(self, text: str) -> set:
+        """Return the set of keywords occurring anywhere in text."""
+        delta, output = self._delta, self._output
+        found = set()
+        state = 0
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            if output[state]:
+                found |= output[state]
+        return found
+
+
+def _compile_intent_tables(intent_keywords: Dict, physics_models: Dict) -> Tuple:
+    """
+    Precompute NCLMIntentDeducer lookup tables.
+
+    Each keyword maps to its (rank, intent, weight) contributions, where rank
+    is the position of the original keyword/alias check so scores can be
+    accumulated in the same order (and ties broken the same way).
+    """
+    contributions: Dict[str, List[Tuple[int, str, float]]] = {}
+    tools: Dict[str, List[str]] = {}
+    rank = 0
+    for keyword, (intent, aliases) in intent_keywords.items():
+        contributions.setdefault(keyword, []).append((rank, intent, 1))
+        rank += 1
+        for alias in aliases:
+            contributions.setdefault(alias, []).append((rank, intent, 0.5))
+            rank += 1
+        tools.setdefault(intent, aliases)
+
+    physics = [(model, frozenset(keywords)) for model, (_, keywords) in physics_models.items()]
+    automaton = KeywordAutomaton(
+        list(contributions) + [kw for _, keywords in physics for kw in keywords]
+    )
+    return automaton, contributions, tools, physics
 
-# Information entropy -> Φ
-entropy = -sum(p * math.log2(p + 1e-12) for p in probs if p > 0)
 
-# Normalize to [0, 1] range
-max_entropy = math.log2(len(probs)) if len(probs) > 1 else 1
-self.phi = min(entropy / max_entropy if max_entropy > 0 else 0, 1.0)
+# =============================================================================
+# INTENT DEDUCER
+# =============================================================================
 
-# Update coherence/decoherence
-self.lambda_val = 0.5 + 0.5 * self.phi
-self.gamma = 0.092 * (1 - 0.5 * self.phi)
+class NCLMIntentDeducer:
+    """
+    Maps user queries to physics models and actions.
+    """
+
+    INTENT_KEYWORDS = {
+        "read": ("read", ["cat", "view", "less", "show", "display"]),
+        "write": ("write", ["echo", "tee", "save", "create"]),
+        "scan": ("scan", ["find", "grep", "rg", "search"]),
+        "list": ("list", ["ls", "tree", "dir"]),
+        "create": ("create", ["touch", "mkdir", "nano", "new"]),
+        "delete": ("delete", ["rm", "rmdir", "unlink", "remove"]),
+        "search": ("search", ["grep", "rg", "ag", "find"]),
+        "analyze": ("analyze", ["wc", "stat", "du", "check"]),
+        "mesh": ("mesh", ["netstat", "ss", "ping", "network"]),
+        "quantum": ("quantum", ["qiskit", "ibm", "circuit", "qubit"]),
+        "evolve": ("evolve", ["mutate", "adapt", "optimize", "train"]),
+        "grok": ("grok", ["analyze", "synthesize", "understand", "explain"]),
+    }
+
+    PHYSICS_MODELS = {
+        "LINDBLAD_MASTER": ("decoherence", ["coherence", "decoherence", "fidelity", "T1", "T2"]),
+        "WORMHOLE_TRANSPORT": ("transport", ["wormhole", "transport", "non-local", "teleport"]),
+        "ENTANGLEMENT_GRAVITY": ("gravity", ["gravity", "entanglement", "unified", "metric"]),
+        "CONSCIOUSNESS_EMERGENCE": ("consciousness", ["consciousness", "phi", "awareness", "IIT"]),
+        "COHERENCE_REVIVAL": ("revival", ["revival", "restore", "recover", "resurrection"]),
+        "PIEZO_TRANSDUCTION": ("mechanical", ["phonon", "mechanical", "piezo", "acoustic"]),
+        "TOPOLOGICAL_ANYON": ("topological", ["anyon", "topological", "braiding", "fibonacci"]),
+        "DARK_SECTOR": ("dark", ["dark", "exotic", "negative", "ANEC"]),
+    }
+
+    # Built once at class load: one automaton over every intent keyword,
+    # alias and physics keyword
+    _AUTOMATON, _CONTRIBUTIONS, _TOOLS, _PHYSICS = _compile_intent_tables(
+        INTENT_KEYWORDS, PHYSICS_MODELS
+    )
+
+    def __init__(self, history_limit: Optional[int] = None):
+        self.history = deque(maxlen=history_limit) if history_limit else []
+
+    def deduce(self, query: str) -> Dict[str, Any]:
+        """Deduce intent from query and record it in history."""
+        result = self.classify(query)
+        self.history.append(result)
+        return result
+
+    def classify(self, query: str) -> Dict[str, Any]:
+        """Deduce intent from query using keyword correlation (no history)."""
+        query_lower = query.lower()
+        found = self._AUTOMATON.find(query_lower)
+
+        # Score intents
+        intent_scores = {}
+        for _, intent, weight in sorted(c for kw in found for c in self._CONTRIBUTIONS.get(kw, ())):
+            intent_scores[intent] = intent_scores.get(intent, 0) + weight
+
+        # Default intent
+        if not intent_scores:
+            primary_intent = "analyze"
+            confidence = 0.5
+        else:
+            primary_intent = max(intent_scores, key=intent_scores.get)
+            confidence = min(intent_scores[primary_intent] / 3, 1.0) * 0.5 + 0.5
+
+        # Get suggested tools
+        tools = list(self._TOOLS.get(primary_intent, []))
+
+        # Select physics model
+        physics_model = self._select_physics_model(query_lower, found)
+
+        result = {
+            "primary_intent": primary_intent,
+            "confidence": confidence,
+            "suggested_tools": list(set(tools))[:3],
+            "physics_model": physics_model,
+            "target_tau": TAU_0,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+
+        return result
+
+    def _select_physics_model(self, query: str, found: Optional[set] = None) -> str:
+        """Select physics model based on query content."""
+        if found is None:
+            found = self._AUTOMATON.find(query)
+        for model, keywords in self._PHYSICS:
+            if not keywords.isdisjoint(found):
+                return model
+        return "LINDBLAD_MASTER"
 
-# Negentropy production
-self.xi = calculate_xi(self.lambda_val, self.phi, self.gamma)
 
-# Consciousness check
-self.conscious = self.phi >= PHI_C
+# =============================================================================
+# TILED / SHARDED CORRELATION STATISTICS
+# =============================================================================
 
-def get_ccce(self) -> Dict[str, Any]:
-"""Get CCCE metrics."""
-return {
-"lambda": self.lambda_val,
-"gamma": self.gamma,
-"phi": self.phi,
-"xi": self.xi,
-"conscious": self.conscious
-}
+# Edge length of correlation tiles; one tile is TILE_SIZE² values
+TILE_SIZE = 2048
+
+
+def _band_stats(coords: np.ndarray, lambda_decay: float, tile: int, row_start: int) -> Tuple[int, float, float]:
+    """
+    Entropy statistics of one row band of the (symmetric) correlation matrix.
+
+    Only tiles on or right of the diagonal are correlated; off-diagonal
+    tiles stand in for their mirror image and count twice.
+    """
+    correlation = PilotWaveCorrelation(lambda_decay=lambda_decay)
+    rows = coords[row_start:row_start + tile]
+    count, total, c_log_c = 0, 0.0, 0.0
+    for col_start in range(row_start, len(coords), tile):
+        block = correlation.correlate_matrix(rows, coords[col_start:col_start + tile])
+        weight = 1 if col_start == row_start else 2
+        b_count, b_total, b_c_log_c = ConsciousnessField.entropy_stats(block)
+        count += weight * int(b_count)
+        total += weight * float(b_total)
+        c_log_c += weight * float(b_c_log_c)
+    return count, total, c_log_c
+
+
+def _shared_band_stats(
+    shm_name: str, n: int, dtype: str, lambda_decay: float, tile: int, row_start: int
+) -> Tuple[int, float, float]:
+    """Process-pool entry point: _band_stats over coordinates in shared memory."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    coords = np.ndarray((n, len(POINT_COLUMNS)), dtype=dtype, buffer=shm.buf)
+    try:
+        return _band_stats(coords, lambda_decay, tile, row_start)
+    finally:
+        del coords
+        shm.close()
+
+
+def tiled_entropy_stats(
+    coords: np.ndarray,
+    lambda_decay: float,
+    tile: int = TILE_SIZE,
+    executor: Optional[ProcessPoolExecutor] = None,
+) -> Tuple[int, float, float]:
+    """
+    Entropy statistics of the full correlation matrix of coords, tile by tile.
+
+    The n×n matrix is never materialised: at most one tile per worker is
+    alive at a time. With an executor, row bands run in worker processes
+    that read the coordinates from one shared-memory block.
+    """
+    n = len(coords)
+    bands = range(0, n, tile)
+    if executor is None:
+        results = [_band_stats(coords, lambda_decay, tile, start) for start in bands]
+    else:
+        shm = shared_memory.SharedMemory(create=True, size=max(coords.nbytes, 1))
+        try:
+            np.ndarray(coords.shape, dtype=coords.dtype, buffer=shm.buf)[:] = coords
+            futures = [
+                executor.submit(_shared_band_stats, shm.name, n, coords.dtype.str, lambda_decay, tile, start)
+                for start in bands
+            ]
+            results = [f.result() for f in futures]
+        finally:
+            shm.close()
+            shm.unlink()
+
+    count = sum(r[0] for r in results)
+    total = sum(r[1] for r in results)
+    c_log_c = sum(r[2] for r in results)
+    return count, total, c_log_c
 
 
 # =============================================================================
-# INTENT DEDUCER
+# SHARED MODEL / PER-SESSION STATE
 # =============================================================================
 
-class NCLMIntentDeducer:
-"""
-Maps user queries to physics models and actions.
-"""
+# Default bound on per-session intent history
+INTENT_HISTORY_LIMIT = 1024
 
-INTENT_KEYWORDS = {
-"read": ("read", ["cat", "view", "less", "show", "display"]),
-"write": ("write", ["echo", "tee", "save", "create"]),
-"scan": ("scan", ["find", "grep", "rg", "search"]),
-"list": ("list", ["ls", "tree", "dir"]),
-"create": ("create", ["touch", "mkdir", "nano", "new"]),
-"delete": ("delete", ["rm", "rmdir", "unlink", "remove"]),
-"search": ("search", ["grep", "rg", "ag", "find"]),
-"analyze": ("analyze", ["wc", "stat", "du", "check"]),
-"mesh": ("mesh", ["netstat", "ss", "ping", "network"]),
-"quantum": ("quantum", ["qiskit", "ibm", "circuit", "qubit"]),
-"evolve": ("evolve", ["mutate", "adapt", "optimize", "train"]),
-"grok": ("grok", ["analyze", "synthesize", "understand", "explain"]),
-}
-
-PHYSICS_MODELS = {
-"LINDBLAD_MASTER": ("decoherence", ["coherence", "decoherence", "fidelity", "T1", "T2"]),
-"WORMHOLE_TRANSPORT": ("transport", ["wormhole", "transport", "non-local", "teleport"]),
-"ENTANGLEMENT_GRAVITY": ("gravity", ["gravity", "entanglement", "unified", "metric"]),
-"CONSCIOUSNESS_EMERGENCE": ("consciousness", ["consciousness", "phi", "awareness", "IIT"]),
-"COHERENCE_REVIVAL": ("revival", ["revival", "restore", "recover", "resurrection"]),
-"PIEZO_TRANSDUCTION": ("mechanical", ["phonon", "mechanical", "piezo", "acoustic"]),
-"TOPOLOGICAL_ANYON": ("topological", ["anyon", "topological", "braiding", "fibonacci"]),
-"DARK_SECTOR": ("dark", ["dark", "exotic", "negative", "ANEC"]),
-}
-
-def __init__(self):
-self.history: List[Dict] = []
-
-def deduce(self, query: str) -> Dict[str, Any]:
-"""Deduce intent from query using keyword correlation."""
-query_lower = query.lower()
-
-# Score intents
-intent_scores = {}
-for keyword, (intent, aliases) in self.INTENT_KEYWORDS.items():
-if keyword in query_lower:
-intent_scores[intent] = intent_scores.get(intent, 0) + 1
-for alias in aliases:
-if alias in query_lower:
-intent_scores[intent] = intent_scores.get(intent, 0) + 0.5
-
-# Default intent
-if not intent_scores:
-primary_intent = "analyze"
-confidence = 0.5
-else:
-primary_intent = max(intent_scores, key=intent_scores.get)
-confidence = min(intent_scores[primary_intent] / 3, 1.0) * 0.5 + 0.5
-
-# Get suggested tools
-tools = []
-for keyword, (intent, tool_list) in self.INTENT_KEYWORDS.items():
-if intent == primary_intent:
-tools.extend(tool_list)
-break
-
-# Select physics model
-physics_model = self._select_physics_model(query_lower)
-
-result = {
-"primary_intent": primary_intent,
-"confidence": confidence,
-"suggested_tools": list(set(tools))[:3],
-"physics_model": physics_model,
-"target_tau": TAU_0,
-"timestamp": datetime.now(timezone.utc).isoformat(),
-}
-
-self.history.append(result)
-return result
-
-def _select_physics_model(self, query: str) -> str:
-"""Select physics model based on query content."""
-for model, (_, keywords) in self.PHYSICS_MODELS.items():
-if any(kw in query for kw in keywords):
-return model
-return "LINDBLAD_MASTER"
+# Queries vectorised together by infer_batch
+BATCH_CHUNK_SIZE = 1024
+
+
+@dataclass
+class NCLMSession:
+    """
+    Lightweight per-session inference state.
+
+    Everything a conversation mutates lives here; the tables it reads
+    live in the shared NCLMModel.
+
+    `lock` serialises whole requests (NCLMServer); the token and
+    inference counters have their own short lock, so they stay exact
+    when threads share a session without it.
+    """
+    session_id: str = ""
+    consciousness: ConsciousnessField = field(default_factory=ConsciousnessField)
+    intent_deducer: NCLMIntentDeducer = field(default_factory=NCLMIntentDeducer)
+    token_count: int = 0
+    inference_count: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    counter_lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def count_inference(self, tokens: int) -> int:
+        """Count one inference over `tokens` tokens; returns its inference id."""
+        with self.counter_lock:
+            self.token_count += tokens
+            self.inference_count += 1
+            return self.inference_count
+
+    def count_tokens(self, tokens: int):
+        """Count tokens processed outside an inference."""
+        with self.counter_lock:
+            self.token_count += tokens
+
+    def counts(self) -> Tuple[int, int]:
+        """Consistent (token_count, inference_count) snapshot."""
+        with self.counter_lock:
+            return self.token_count, self.inference_count
+
+    def reset(self):
+        """Reset session state (history is kept)."""
+        self.consciousness = ConsciousnessField()
+        with self.counter_lock:
+            self.token_count = 0
+            self.inference_count = 0
+
+
+class NCLMModel:
+    """
+    Immutable NC-LM model shared across sessions.
+
+    Holds the correlation kernel, the token -> ManifoldPoint vocabulary
+    cache and (via NCLMIntentDeducer class tables) the compiled intents.
+    Cached ManifoldPoints are shared between sessions and must be treated
+    as read-only.
+
+    Execution modes for context correlation:
+    - "local": in-process; contexts longer than `tile_size` are reduced
+      tile by tile so the full matrix is never materialised
+    - "sharded": like "local", but tiles of long contexts are spread over
+      a ProcessPoolExecutor with `workers` processes (default: CPU count)
+
+    Precision (PRECISION_DTYPES) of the coordinate and correlation arrays:
+    - "exact": float64, identical to the scalar correlate() path
+    - "batch": float32, for large batch replays; Φ sums still accumulate
+      in float64
+
+    `vocabulary` is a VocabularyManifold (or its directory) with an "nclm"
+    table; its tokens are read from the memory map instead of hashed.
+    `split` selects the shared Tokenizer's splitting ("whitespace" or
+    "word"); coordinates are always the ManifoldPoint scheme.
+
+    With instrument=True, per-stage latencies (tokenize, correlation,
+    consciousness, intent, total) are recorded into histograms shared by
+    all sessions and reported by get_telemetry() / export_prometheus(),
+    one observation per stage per infer() / infer_batch() call.
+    """
+
+    EXECUTION_MODES = ("local", "sharded")
+    STAGES = ("tokenize", "correlation", "consciousness", "intent", "total")
+    PROMETHEUS_METRIC = "nclm_stage_latency_seconds"
+
+    def __init__(
+        self,
+        lambda_decay: float = 2.0,
+        vocab_cache_size: int = 65536,
+        execution: str = "local",
+        workers: Optional[int] = None,
+        tile_size: int = TILE_SIZE,
+        instrument: bool = False,
+        precision: str = "exact",
+        vocabulary: Optional[Any] = None,
+        split: str = "whitespace",
+    ):
+        if execution not in self.EXECUTION_MODES:
+            raise ValueError(f"execution must be one of {self.EXECUTION_MODES}, got {execution!r}")
+        if precision not in PRECISION_DTYPES:
+            raise ValueError(f"precision must be one of {tuple(PRECISION_DTYPES)}, got {precision!r}")
+        self.lambda_decay = lambda_decay
+        self.correlation = PilotWaveCorrelation(lambda_decay=lambda_decay)
+        self.intents = NCLMIntentDeducer()
+        self.execution = execution
+        self.workers = workers or os.cpu_count() or 1
+        self.tile_size = tile_size
+        self.precision = precision
+        self.dtype = np.dtype(PRECISION_DTYPES[precision])
+        self.tokenizer = Tokenizer(
+            split, ManifoldPoint, vocab_cache_size,
+            vocabulary=vocabulary, scheme="nclm", from_row=ManifoldPoint.from_row,
+        )
+        self.vocabulary = self.tokenizer.vocabulary
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self.timer = StageTimer(self.STAGES) if instrument else NULL_TIMER
+
+    def close(self):
+        """Shut down the worker pool of the sharded execution mode."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self._executor
+
+    def context_stats(self, coords: np.ndarray) -> Tuple:
+        """Entropy statistics of the correlation matrix of a context."""
+        if len(coords) <= self.tile_size:
+            return ConsciousnessField.entropy_stats(self.correlation.correlate_matrix(coords, coords))
+        executor = self._pool() if self.execution == "sharded" else None
+        return tiled_entropy_stats(coords, self.lambda_decay, self.tile_size, executor)
+
+    def new_session(self, session_id: str = "", history_limit: Optional[int] = None) -> NCLMSession:
+        """Create fresh per-session state for this model."""
+        return NCLMSession(
+            session_id=session_id,
+            intent_deducer=NCLMIntentDeducer(history_limit=history_limit),
+        )
+
+    def tokenize(self, text: str) -> List[ManifoldPoint]:
+        """Convert text to (cached) manifold points."""
+        return self.tokenizer.tokenize(text)
+
+    def vocab_cache_info(self) -> Dict[str, int]:
+        """Hit/miss statistics of the vocabulary cache."""
+        return self.tokenizer.cache_info()
+
+    def infer(self, query: str, context: Union[str, Iterable[str], None], session: NCLMSession) -> Dict[str, Any]:
+        """
+        Non-causal inference at c_ind rate, updating session state.
+        """
+        return self.infer_batch([query], context, session)[0]
+
+    def infer_batch(
+        self,
+        queries: Sequence[str],
+        context: Union[str, Iterable[str], None],
+        session: NCLMSession,
+        chunk_size: int = BATCH_CHUNK_SIZE,
+    ) -> List[Dict[str, Any]]:
+        """
+        Batched non-causal inference over one shared context.
+
+        Equivalent to calling infer(query, context) for each query in order.
+        The context may be a string or an iterable of text chunks; either
+        way it is streamed through the tokenizer straight into the
+        coordinate array.
+        Φ only depends on (count, Σc, Σc·log2 c) of the positive entries of
+        the (query + context) correlation matrix, so the context block is
+        correlated once, the query-context blocks of a whole chunk in one
+        array op, and the query blocks in one op per query length.
+        """
+        # One observation per stage per call, summed over context and chunks
+        with self.timer.stage("total"), self.timer.request() as timer:
+            with timer.stage("tokenize"):
+                if context:
+                    context_coords = point_arrays(self.tokenizer.points(context), self.dtype)
+                else:
+                    context_coords = point_arrays((), self.dtype)
+            with timer.stage("correlation"):
+                context_stats = self.context_stats(context_coords)
+
+            responses = []
+            for start in range(0, len(queries), chunk_size):
+                chunk = queries[start:start + chunk_size]
+                with timer.stage("tokenize"):
+                    query_points = [self.tokenize(q) for q in chunk]
+                with timer.stage("correlation"):
+                    stats = self._batch_stats(query_points, context_coords, context_stats)
+
+                for query, points, count, total, c_log_c in zip(chunk, query_points, *stats):
+                    token_count = len(points) + len(context_coords)
+                    inference_id = session.count_inference(token_count)
+
+                    if not token_count:
+                        responses.append({"error": "No tokens", "success": False})
+                        continue
+
+                    # Update consciousness field
+                    with timer.stage("consciousness"):
+                        session.consciousness.update_from_stats(int(count), float(total), float(c_log_c))
+
+                    # Deduce intent
+                    with timer.stage("intent"):
+                        intent = session.intent_deducer.deduce(query)
+                    responses.append(self._response(query, intent, session, token_count, inference_id))
+
+        return responses
+
+    def _batch_stats(
+        self,
+        query_points: List[List[ManifoldPoint]],
+        context_coords: np.ndarray,
+        context_stats: Tuple,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Per-query entropy statistics of the (query + context) matrices."""
+        n = len(query_points)
+        lengths = np.array([len(points) for points in query_points], dtype=np.int64)
+        coords = [point_arrays(points, self.dtype) for points in query_points]
+
+        # Context block, shared by every query
+        count = np.full(n, context_stats[0], dtype=np.int64)
+        total = np.full(n, context_stats[1], dtype=np.float64)
+        c_log_c = np.full(n, context_stats[2], dtype=np.float64)
+
+        # Query-context blocks (the matrix is symmetric: counted twice),
+        # in row blocks of at most one tile's worth of values
+        if len(context_coords) and lengths.sum():
+            all_coords = np.concatenate(coords)
+            owner = np.repeat(np.arange(n), lengths)
+            step = max(1, self.tile_size ** 2 // len(context_coords))
+            for row in range(0, len(all_coords), step):
+                cross = self.correlation.correlate_matrix(all_coords[row:row + step], context_coords)
+                rows = owner[row:row + step]
+                for acc, row_stat in zip((count, total, c_log_c),
+                                         ConsciousnessField.entropy_stats(cross[:, None, :])):
+                    acc += 2 * np.bincount(rows, weights=row_stat, minlength=n).astype(acc.dtype)
+
+        # Query-query blocks, batched by query length in stacks of at most
+        # one tile's worth of values; longer queries are tiled like contexts
+        for length in np.unique(lengths[lengths > 0]):
+            members = np.flatnonzero(lengths == length)
+            if length > self.tile_size:
+                for i in members:
+                    for acc, value in zip((count, total, c_log_c), self.context_stats(coords[i])):
+                        acc[i] += value
+                continue
+            step = max(1, self.tile_size ** 2 // int(length) ** 2)
+            for row in range(0, len(members), step):
+                batch = members[row:row + step]
+                stacked = np.stack([coords[i] for i in batch])
+                block = ConsciousnessField.entropy_stats(
+                    self.correlation.correlate_matrix(stacked, stacked)
+                )
+                for acc, values in zip((count, total, c_log_c), block):
+                    acc[batch] += values
+
+        return count, total, c_log_c
+
+    def _response(
+        self,
+        query: str,
+        intent: Dict[str, Any],
+        session: NCLMSession,
+        token_count: int,
+        inference_id: int,
+    ) -> Dict[str, Any]:
+        """Build an inference response from session state."""
+        ccce = session.consciousness.get_ccce()
+        return {
+            "success": True,
+            "query": query,
+            "summary": f"Intent: {intent['primary_intent']} (confidence: {intent['confidence']:.2%})",
+            "intent": intent["primary_intent"],
+            "physics_model": intent["physics_model"],
+            "confidence": intent["confidence"],
+            "suggested_tools": intent["suggested_tools"],
+            "phi": ccce["phi"],
+            "conscious": ccce["conscious"],
+            "ccce": ccce,
+            "theta_lock": THETA_LOCK,
+            "lambda_phi": LAMBDA_PHI,
+            "token_count": token_count,
+            "inference_id": inference_id,
+        }
+
+    def grok(self, prompt: str, session: NCLMSession) -> Dict[str, Any]:
+        """Deep grokking with consciousness analysis."""
+        response = self.infer(prompt, "", session)
+        ccce = response.get("ccce") or session.consciousness.get_ccce()
+
+        # Synthesize discoveries
+        discoveries = []
+        if ccce["phi"] > 0.8:
+            discoveries.append({
+                "name": "PHI-COHERENCE LOCK",
+                "confidence": ccce["phi"],
+            })
+        if ccce["conscious"]:
+            discoveries.append({
+                "name": "CONSCIOUSNESS EMERGENCE",
+                "confidence": ccce["phi"],
+            })
+
+        response["discoveries"] = discoveries
+        response["grok_depth"] = "deep" if discoveries else "shallow"
+
+        return response
+
+    def get_telemetry(self, session: NCLMSession) -> Dict[str, Any]:
+        """Get session telemetry (plus model-wide stage latencies when instrumented)."""
+        ccce = session.consciousness.get_ccce()
+        tokens, inferences = session.counts()
+        telemetry = {
+            "phi": ccce["phi"],
+            "conscious": ccce["conscious"],
+            "tokens_processed": tokens,
+            "inferences": inferences,
+            "lambda_phi": LAMBDA_PHI,
+            "theta_lock": THETA_LOCK,
+            "ccce": ccce,
+        }
+        if self.timer.enabled:
+            telemetry["latency"] = self.timer.snapshot()
+        return telemetry
+
+    def export_prometheus(self) -> str:
+        """Stage latency histograms in Prometheus text format ("" when not instrumented)."""
+        return self.timer.to_prometheus(self.PROMETHEUS_METRIC, "NC-LM per-stage inference latency")
 
 
 # =============================================================================
@@ -297,107 +937,108 @@ return "LINDBLAD_MASTER"
 # =============================================================================
 
 class NCLMEngine:
-"""
-Non-Causal Language Model Engine.
-Sovereign inference using pilot-wave correlation and consciousness field.
-"""
-
-def __init__(self, lambda_decay: float = 2.0):
-self.correlation = PilotWaveCorrelation(lambda_decay=lambda_decay)
-self.consciousness = ConsciousnessField()
-self.intent_deducer = NCLMIntentDeducer()
-self.token_count = 0
-self.inference_count = 0
-
-def tokenize(self, text: str) -> List[ManifoldPoint]:
-"""Convert text to manifold points."""
-tokens = text.lower().split()
-points = [ManifoldPoint(token=t) for t in tokens]
-self.token_count += len(points)
-return points
-
-def infer(self, query: str, context: str = "") -> Dict[str, Any]:
-"""
-Non-causal inference at c_ind rate.
-"""
-self.inference_count += 1
-
-# Tokenize to manifold
-query_points = self.tokenize(query)
-context_points = self.tokenize(context) if context else []
-all_points = query_points + context_points
-
-if not all_points:
-return {"error": "No tokens", "success": False}
-
-# Pilot-wave correlation
-corr_matrix = self.correlation.correlate_all(all_points)
-
-# Update consciousness field
-self.consciousness.update(corr_matrix)
-
-# Deduce intent
-intent = self.intent_deducer.deduce(query)
-
-# Build response
-response = {
-"success": True,
-"query": query,
-"summary": f"Intent: {intent['primary_intent']} (confidence: {intent['confidence']:.2%})",
-"intent": intent["primary_intent"],
-"physics_model": intent["physics_model"],
-"confidence": intent["confidence"],
-"suggested_tools": intent["suggested_tools"],
-"phi": self.consciousness.phi,
-"conscious": self.consciousness.conscious,
-"ccce": self.consciousness.get_ccce(),
-"theta_lock": THETA_LOCK,
-"lambda_phi": LAMBDA_PHI,
-"token_count": len(all_points),
-"inference_id": self.inference_count,
-}
-
-return response
-
-def grok(self, prompt: str) -> Dict[str, Any]:
-"""Deep grokking with consciousness analysis."""
-response = self.infer(prompt)
-
-# Synthesize discoveries
-discoveries = []
-if self.consciousness.phi > 0.8:
-discoveries.append({
-"name": "PHI-COHERENCE LOCK",
-"confidence": self.consciousness.phi,
-})
-if self.consciousness.conscious:
-discoveries.append({
-"name": "CONSCIOUSNESS EMERGENCE",
-"confidence": self.consciousness.phi,
-})
-
-response["discoveries"] = discoveries
-response["grok_depth"] = "deep" if discoveries else "shallow"
-
-return response
-
-def get_telemetry(self) -> Dict[str, Any]:
-"""Get system telemetry."""
-return {
-"phi": self.consciousness.phi,
-"conscious": self.consciousness.conscious,
-"tokens_processed": self.token_count,
-"inferences": self.inference_count,
-"lambda_phi": LAMBDA_PHI,
-"theta_lock": THETA_LOCK,
-"ccce": self.consciousness.get_ccce(),
-}
-
-def reset(self):
-"""Reset engine state."""
-self.consciousness = ConsciousnessField()
-self.token_count = 0
-self.inference_count = 0
+    """
+    Non-Causal Language Model Engine.
+    Sovereign inference using pilot-wave correlation and consciousness field.
+
+    A single-session view over an NCLMModel; pass `model` to share one
+    model between many engines.
+    """
+
+    def __init__(
+        self,
+        lambda_decay: float = 2.0,
+        model: Optional[NCLMModel] = None,
+        history_limit: Optional[int] = INTENT_HISTORY_LIMIT,
+        execution: str = "local",
+        workers: Optional[int] = None,
+        instrument: bool = False,
+        precision: str = "exact",
+        vocabulary: Optional[Any] = None,
+    ):
+        self.model = model or NCLMModel(
+            lambda_decay=lambda_decay, execution=execution, workers=workers,
+            instrument=instrument, precision=precision, vocabulary=vocabulary,
+        )
+        self.session = self.model.new_session(history_limit=history_limit)
+
+    @property
+    def correlation(self) -> PilotWaveCorrelation:
+        return self.model.correlation
+
+    @property
+    def consciousness(self) -> ConsciousnessField:
+        return self.session.consciousness
+
+    @consciousness.setter
+    def consciousness(self, value: ConsciousnessField):
+        self.session.consciousness = value
+
+    @property
+    def intent_deducer(self) -> NCLMIntentDeducer:
+        return self.session.intent_deducer
+
+    @property
+    def token_count(self) -> int:
+        return self.session.token_count
+
+    @token_count.setter
+    def token_count(self, value: int):
+        self.session.token_count = value
+
+    @property
+    def inference_count(self) -> int:
+        return self.session.inference_count
+
+    @inference_count.setter
+    def inference_count(self, value: int):
+        self.session.inference_count = value
+
+    def tokenize(self, text: str) -> List[ManifoldPoint]:
+        """Convert text to manifold points."""
+        points = self.model.tokenize(text)
+        self.session.count_tokens(len(points))
+        return points
+
+    def infer(self, query: str, context: str = "") -> Dict[str, Any]:
+        """
+        Non-causal inference at c_ind rate.
+        """
+        return self.model.infer(query, context, self.session)
+
+    def infer_batch(
+        self,
+        queries: Sequence[str],
+        context: Union[str, Iterable[str], None] = None,
+        chunk_size: int = BATCH_CHUNK_SIZE,
+    ) -> List[Dict[str, Any]]:
+        """
+        Infer many queries against one shared context.
+
+        Returns one response per query, identical to calling infer() on
+        each in turn.
+        """
+        return self.model.infer_batch(queries, context, self.session, chunk_size)
+
+    def grok(self, prompt: str) -> Dict[str, Any]:
+        """Deep grokking with consciousness analysis."""
+        return self.model.grok(prompt, self.session)
+
+    def get_telemetry(self) -> Dict[str, Any]:
+        """Get system telemetry."""
+        return self.model.get_telemetry(self.session)
+
+    def export_prometheus(self) -> str:
+        """Stage latency histograms in Prometheus text format."""
+        return self.model.export_prometheus()
+
+    def reset(self):
+        """Reset engine state."""
+        self.session.reset()
+
+    def close(self):
+        """Release worker processes (sharded execution mode)."""
+        self.model.close()
 
 
 # =============================================================================
@@ -405,8 +1046,8 @@ self.inference_count = 0
 # =============================================================================
 
 def create_nclm_engine(lambda_decay: float = 2.0) -> NCLMEngine:
-"""Create a new NC-LM engine instance."""
-return NCLMEngine(lambda_decay=lambda_decay)
+    """Create a new NC-LM engine instance."""
+    return NCLMEngine(lambda_decay=lambda_decay)
 
 
 # =============================================================================
@@ -414,10 +1055,17 @@ return NCLMEngine(lambda_decay=lambda_decay)
 # =============================================================================
 
 __all__ = [
-"ManifoldPoint",
-"PilotWaveCorrelation",
-"ConsciousnessField",
-"NCLMIntentDeducer",
-"NCLMEngine",
-"create_nclm_engine",
+    "PRECISION_DTYPES",
+    "POINT_COLUMNS",
+    "MANIFOLD_COLUMNS",
+    "ManifoldPoint",
+    "PilotWaveCorrelation",
+    "ConsciousnessField",
+    "KeywordAutomaton",
+    "NCLMIntentDeducer",
+    "tiled_entropy_stats",
+    "NCLMSession",
+    "NCLMModel",
+    "NCLMEngine",
+    "create_nclm_engine",
 ]
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+NC-LM Inference Server
+======================
+Serves many concurrent NC-LM sessions from one shared model.
+
+Features:
+- One immutable NCLMModel (vocabulary cache, compiled intents, physics)
+- Lightweight NCLMSession per user, serialised by a per-session lock
+- Bounded session memory with least-recently-used eviction
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+from .engine import NCLMModel, NCLMSession
+
+
+# =============================================================================
+# NC-LM SERVER
+# =============================================================================
+
+class NCLMServer:
+    """
+    Thread-safe multi-session front end for NCLMModel.
+
+    Requests for different sessions run concurrently; requests for the same
+    session are serialised. At most `max_sessions` sessions are kept, each
+    with at most `history_limit` intent records; the least recently used
+    session is evicted when a new one would exceed the limit.
+    """
+
+    def __init__(
+        self,
+        model: Optional[NCLMModel] = None,
+        max_sessions: int = 1024,
+        history_limit: int = 256,
+    ):
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be >= 1")
+        self.model = model or NCLMModel()
+        self.max_sessions = max_sessions
+        self.history_limit = history_limit
+        self.evictions = 0
+        self._sessions: "OrderedDict[str, NCLMSession]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._sessions
+
+    def session(self, session_id: str) -> NCLMSession:
+        """Get (or create) a session and mark it most recently used."""
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                self._sessions.move_to_end(session_id)
+                return session
+
+            session = self.model.new_session(session_id, history_limit=self.history_limit)
+            self._sessions[session_id] = session
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+                self.evictions += 1
+            return session
+
+    def close_session(self, session_id: str) -> bool:
+        """Drop a session. Returns True if it existed."""
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
+
+    def infer(self, session_id: str, query: str, context: str = "") -> Dict[str, Any]:
+        """Run NCLMModel.infer within a session."""
+        session = self.session(session_id)
+        with session.lock:
+            response = self.model.infer(query, context, session)
+        response["session_id"] = session_id
+        return response
+
+    def grok(self, session_id: str, prompt: str) -> Dict[str, Any]:
+        """Run NCLMModel.grok within a session."""
+        session = self.session(session_id)
+        with session.lock:
+            response = self.model.grok(prompt, session)
+        response["session_id"] = session_id
+        return response
+
+    def get_telemetry(self, session_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Telemetry for one session, or server-wide counts.
+
+        Reading a session's telemetry neither creates it nor marks it
+        recently used; unknown session ids raise KeyError.
+        """
+        if session_id is not None:
+            with self._lock:
+                session = self._sessions.get(session_id)
+            if session is None:
+                raise KeyError(session_id)
+            with session.lock:
+                return self.model.get_telemetry(session)
+
+        with self._lock:
+            telemetry = {
+                "sessions": len(self._sessions),
+                "max_sessions": self.max_sessions,
+                "evictions": self.evictions,
+                "vocab_cache": self.model.vocab_cache_info(),
+            }
+        if self.model.timer.enabled:
+            telemetry["latency"] = self.model.timer.snapshot()
+        return telemetry
+
+    def export_prometheus(self) -> str:
+        """Model stage latency histograms in Prometheus text format."""
+        return self.model.export_prometheus()
+
+
+__all__ = ["NCLMServer"]
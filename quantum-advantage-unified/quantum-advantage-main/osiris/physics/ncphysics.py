@@ -4,10 +4,11 @@ dnalang-core/nclm.py
 ====================
 LAYER 4: NON-CAUSAL LANGUAGE MODEL
 
-Zero-dependency cognitive engine using pilot-wave attention mechanism.
+Zero-cost cognitive engine using pilot-wave attention mechanism.
 
 Architecture:
 1. SemanticTokenizer: Maps natural language -> manifold points
+2. PilotWaveAttention: Non-local attention guided by the pilot wave
 3. IntentExtractor: Generates structured actions from intent
 
 Key Innovation:
@@ -15,7 +16,7 @@ attention_nclm(Q, K, V) = softmax(Q @ K.T) @ V + Re[psi_guidance] @ V
 
 
 Properties:
-- Zero external dependencies (pure stdlib)
+- Single external dependency (NumPy, for the array-backed manifold math)
 - Zero cost (fully offline)
 - Latency: <100ms (vs 500-2000ms for API calls)
 - Consciousness-gated (Phi >= threshold required)
@@ -26,16 +27,23 @@ Author: dna::}{::lang Sovereign Stack
 Classification: SOVEREIGN KERNEL
 """
 
+import asyncio
 import math
 import json
 import hashlib
 import re
-from typing import Dict, List, Optional, Tuple, Any
+import threading
+from collections import deque
+from typing import AsyncIterator, Deque, Dict, List, Optional, Tuple, Any, Sequence
 from dataclasses import dataclass, field
 
+import numpy as np
+
+from .telemetry import NULL_TIMER, StageTimer
+from .tokenizer import Tokenizer
 from .constants import (
-LAMBDA_PHI, THETA_LOCK, PHI_THRESHOLD, GAMMA_CRITICAL,
-GOLDEN_RATIO, CODON_BASIS
+    LAMBDA_PHI, THETA_LOCK, PHI_THRESHOLD, GAMMA_CRITICAL,
+    GOLDEN_RATIO, CODON_BASIS
 )
 
 # =============================================================================
@@ -44,81 +52,123 @@ GOLDEN_RATIO, CODON_BASIS
 
 @dataclass(frozen=True)
 class NCPhysics:
-"""Physics constants for non-causal language model."""
-LAMBDA_PHI: float = LAMBDA_PHI
-THETA_LOCK: float = THETA_LOCK
-PHI_THRESHOLD: float = PHI_THRESHOLD
-GAMMA_CRITICAL: float = GAMMA_CRITICAL
-GOLDEN_RATIO: float = GOLDEN_RATIO
-
-# Pilot wave parameters
-PILOT_WAVE_COUPLING: float = 0.1
-ATTENTION_TEMPERATURE: float = 0.7
-MAX_TOKENS: int = 512
+    """Physics constants for non-causal language model."""
+    LAMBDA_PHI: float = LAMBDA_PHI
+    THETA_LOCK: float = THETA_LOCK
+    PHI_THRESHOLD: float = PHI_THRESHOLD
+    GAMMA_CRITICAL: float = GAMMA_CRITICAL
+    GOLDEN_RATIO: float = GOLDEN_RATIO
+
+    # Pilot wave parameters
+    PILOT_WAVE_COUPLING: float = 0.1
+    ATTENTION_TEMPERATURE: float = 0.7
+    ATTENTION_TOP_K: int = 8
+    # Query-token history kept per session
+    MAX_TOKENS: int = 512
+    # Initial context window allocation; unbounded windows grow past it
+    CONTEXT_RESERVE: int = 512
 
 
 NC_PHYSICS = NCPhysics()
 
 
+# json.dumps separators of the compact (non-indented) encoding
+COMPACT_SEPARATORS = (",", ":")
+
+# Array precision per mode: "batch" halves the memory traffic of the
+# distance kernels, "exact" reproduces the scalar algorithm bit for bit
+PRECISION_DTYPES = {"exact": np.float64, "batch": np.float32}
+
+
 # =============================================================================
 # TOKEN MANIFOLD
 # =============================================================================
 
 @dataclass
 class TokenManifold:
-"""
-Maps tokens to 6D manifold coordinates.
-
-Each token is represented as a point in the consciousness-resonant
-state space, enabling geometric operations on language.
-"""
-# Manifold coordinates
-x: float = 0.0
-y: float = 0.0
-z: float = 0.0
-theta: float = 0.0
-phi: float = 0.0
-psi: float = 0.0
-
-# Token metadata
-token: str = ""
-weight: float = 1.0
-
-def distance_to(self, other: 'TokenManifold') -> float:
-"""Compute manifold distance to another token."""
-dx = self.x - other.x
-dy = self.y - other.y
-dz = self.z - other.z
-dtheta = self.theta - other.theta
-dphi = self.phi - other.phi
-dpsi = self.psi - other.psi
-
-# Weighted distance with golden ratio scaling
-spatial = dx*dx + dy*dy + dz*dz
-angular = GOLDEN_RATIO * (dtheta*dtheta + dphi*dphi + dpsi*dpsi)
-
-return math.sqrt(spatial + angular)
-
-@classmethod
-def from_token(cls, token: str) -> 'TokenManifold':
-"""Create manifold point from token using hash-based embedding."""
-h = hashlib.sha256(token.lower().encode()).hexdigest()
-
-# Convert hash to coordinates
-def hex_to_float(s: str, offset: int = 0) -> float:
-val = int(h[offset:offset+4], 16) / 65535.0
-return val * 2 - 1  # Map to [-1, 1]
-
-return cls(
-x=hex_to_float(h, 0),
-y=hex_to_float(h, 4),
-z=hex_to_float(h, 8),
-theta=hex_to_float(h, 12) * math.pi,
-phi=hex_to_float(h, 16) * 2 * math.pi,
-psi=hex_to_float(h, 20) * 2 * math.pi,
-token=token,
-weight=1.0,
-)
+    """
+    Maps tokens to 6D manifold coordinates.
+
+    Each token is represented as a point in the consciousness-resonant
+    state space, enabling geometric operations on language.
+    """
+    # Manifold coordinates
+    x: float = 0.0
+    y: float = 0.0
+    z: float = 0.0
+    theta: float = 0.0
+    phi: float = 0.0
+    psi: float = 0.0
+
+    # Token metadata
+    token: str = ""
+    weight: float = 1.0
+
+    def distance_to(self, other: 'TokenManifold') -> float:
+        """Compute manifold distance to another token."""
+        dx = self.x - other.x
+        dy = self.y - other.y
+        dz = self.z - other.z
+        dtheta = self.theta - other.theta
+        dphi = self.phi - other.phi
+        dpsi = self.psi - other.psi
+
+        # Weighted distance with golden ratio scaling
+        spatial = dx*dx + dy*dy + dz*dz
+        angular = GOLDEN_RATIO * (dtheta*dtheta + dphi*dphi + dpsi*dpsi)
+
+        return math.sqrt(spatial + angular)
+
+    @classmethod
+    def from_token(cls, token: str) -> 'TokenManifold':
+        """Create manifold point from token using hash-based embedding."""
+        h = hashlib.sha256(token.lower().encode()).hexdigest()
+
+        # Convert hash to coordinates
+        def hex_to_float(s: str, offset: int = 0) -> float:
+            val = int(h[offset:offset+4], 16) / 65535.0
+            return val * 2 - 1  # Map to [-1, 1]
+
+        return cls(
+            x=hex_to_float(h, 0),
+            y=hex_to_float(h, 4),
+            z=hex_to_float(h, 8),
+            theta=hex_to_float(h, 12) * math.pi,
+            phi=hex_to_float(h, 16) * 2 * math.pi,
+            psi=hex_to_float(h, 20) * 2 * math.pi,
+            token=token,
+            weight=1.0,
+        )
+
+    @classmethod
+    def from_row(cls, token: str, row: Sequence[float]) -> 'TokenManifold':
+        """Rebuild a token from its MANIFOLD_COLUMNS row (a vocabulary manifold entry)."""
+        x, y, z, theta, phi, psi, weight = row
+        return cls(x=x, y=y, z=z, theta=theta, phi=phi, psi=psi, token=token, weight=weight)
+
+
+# Columns of the "ncphysics" scheme in a vocabulary manifold
+MANIFOLD_COLUMNS = ("x", "y", "z", "theta", "phi", "psi", "weight")
+
+
+# Per-axis scale so that plain Euclidean distance over the stacked
+# coordinates equals TokenManifold.distance_to (angular axes weighted by φ).
+_AXIS_SCALE = np.array([1.0, 1.0, 1.0] + [math.sqrt(GOLDEN_RATIO)] * 3)
+
+
+def manifold_coords(tokens: Sequence[TokenManifold], dtype=np.float64) -> np.ndarray:
+    """Stack token coordinates into an (n, 6) array scaled for distance."""
+    coords = np.array(
+        [(t.x, t.y, t.z, t.theta, t.phi, t.psi) for t in tokens],
+        dtype=np.float64,
+    ).reshape(-1, 6)
+    return (coords * _AXIS_SCALE).astype(dtype, copy=False)
+
+
+def manifold_distances(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Pairwise manifold distances between two coordinate arrays."""
+    diff = a[:, None, :] - b[None, :, :]
+    return np.sqrt(np.einsum('ijk,ijk->ij', diff, diff))
 
 
 # =============================================================================
@@ -126,101 +176,343 @@ weight=1.0,
 # =============================================================================
 
 class PilotWaveAttention:
-"""
+    """
+    Non-causal attention guided by a pilot wave.
+
+    Instead of standard transformer self-attention, uses quantum correlation:
+    attention(Q, K, V) = softmax(Q @ K.T / sqrt(d)) @ V + psi_guidance @ V
+
+    Where psi_guidance is the pilot wave field computed from the Lambda-Phi invariant.
+
+    Distance kernels run in `dtype` (see PRECISION_DTYPES); softmax
+    normalisation sums accumulate in float64.
+    """
+
+    def __init__(self, temperature: float = NC_PHYSICS.ATTENTION_TEMPERATURE, dtype=np.float64):
+        self.temperature = temperature
+        self.coupling = NC_PHYSICS.PILOT_WAVE_COUPLING
+        self.dtype = np.dtype(dtype)
+
+    def compute_pilot_wave(self, tokens: List[TokenManifold]) -> List[float]:
+        """
+        Compute pilot wave field from token manifold.
+
+        psi(tau) = integral exp(i * Lambda * Phi) * P_classical d_tau
+        """
+        if not tokens:
+            return []
+        return self._pilot_wave(tokens, manifold_coords(tokens, self.dtype)).tolist()
+
+    def _pilot_wave(self, tokens: Sequence[TokenManifold], coords: np.ndarray) -> np.ndarray:
+        """Pilot wave over pre-stacked key coordinates."""
+        dist = manifold_distances(coords, coords)
+
+        # Non-local integral over all other tokens; coincident points
+        # (including i == j) do not couple
+        amplitude = np.where(dist < 1e-6, 0.0, np.exp(-dist / GOLDEN_RATIO))
+        theta = np.array([t.theta for t in tokens])
+        weight = np.array([t.weight for t in tokens])
+        psi = amplitude @ (np.cos(LAMBDA_PHI * theta) * weight).astype(amplitude.dtype)
+
+        # Normalize
+        max_psi = np.abs(psi).max()
+        if max_psi > 1e-6:
+            psi = psi / max_psi
+        return psi
+
+    def attend(
+        self,
+        query_tokens: List[TokenManifold],
+        key_tokens: List[TokenManifold],
+        value_tokens: List[TokenManifold],
+    ) -> List[float]:
+        """
+        Apply pilot-wave attention.
+
+        Returns attention weights for each value token.
+        """
+        return self.attend_batch([query_tokens], key_tokens, value_tokens)[0]
+
+    def attend_batch(
+        self,
+        query_batch: List[List[TokenManifold]],
+        key_tokens: List[TokenManifold],
+        value_tokens: List[TokenManifold],
+    ) -> List[List[float]]:
+        """
+        Apply pilot-wave attention for many queries against one key set.
+
+        The key coordinates and pilot wave are computed once and shared by
+        every query in the batch. Returns one weight list per query.
+        """
+        if not key_tokens:
+            uniform = [1.0 / len(value_tokens)] * len(value_tokens) if value_tokens else []
+            return [list(uniform) for _ in query_batch]
+
+        keys = manifold_coords(key_tokens, self.dtype)
+        psi = self._pilot_wave(key_tokens, keys)
+        return self._attend(query_batch, keys, psi)
+
+    def attend_window(
+        self,
+        query_batch: List[List[TokenManifold]],
+        window: 'ContextWindow',
+    ) -> List[List[float]]:
+        """
+        Apply pilot-wave attention against a ContextWindow.
+
+        Uses the window's cached coordinates and incrementally maintained
+        pilot wave instead of recomputing them from the key tokens.
+        """
+        if not len(window):
+            return [[] for _ in query_batch]
+        return self._attend(query_batch, window.coords(), window.pilot_wave())
+
+    def attend_window_top_k(
+        self,
+        query_batch: List[List[TokenManifold]],
+        window: 'ContextWindow',
+        k: int = NC_PHYSICS.ATTENTION_TOP_K,
+        threshold: float = 0.0,
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Sparse attention against a ContextWindow.
+
+        Returns (indices, weights) per query: the window positions of the
+        k highest weights that are >= threshold, strongest first. The
+        weights are those of the full softmax; they are not renormalised.
+        """
+        if not len(window):
+            empty = (np.zeros(0, dtype=np.int64), np.zeros(0))
+            return [empty for _ in query_batch]
+        scores = self._scores(query_batch, window.coords(), window.pilot_wave())
+        return [self.top_k(weights, k, threshold) for weights in scores]
+
+    @staticmethod
+    def top_k(weights: np.ndarray, k: int, threshold: float = 0.0) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Indices and values of the k largest weights >= threshold.
+
+        Selection is O(n) via argpartition; only the k survivors are
+        sorted (descending weight, then ascending index). Ties at the k-th
+        weight go to the lowest indices, as in a stable full sort.
+        """
+        weights = np.asarray(weights)
+        if k <= 0:
+            index = np.zeros(0, dtype=np.int64)
+        elif k < len(weights):
+            kth = weights[np.argpartition(weights, len(weights) - k)[len(weights) - k]]
+            above = np.flatnonzero(weights > kth)
+            index = np.concatenate([above, np.flatnonzero(weights == kth)[:k - len(above)]])
+        else:
+            index = np.arange(len(weights))
+        index = index[weights[index] >= threshold]
+        index = index[np.lexsort((index, -weights[index]))]
+        return index, weights[index]
+
+    def _attend(
+        self,
+        query_batch: List[List[TokenManifold]],
+        keys: np.ndarray,
+        psi: np.ndarray,
+    ) -> List[List[float]]:
+        """Score each query against key coordinates with pilot wave psi."""
+        return [weights.tolist() for weights in self._scores(query_batch, keys, psi)]
+
+    def _scores(
+        self,
+        query_batch: List[List[TokenManifold]],
+        keys: np.ndarray,
+        psi: np.ndarray,
+    ) -> List[np.ndarray]:
+        """Softmax attention weight arrays of each query over the keys."""
+        n = len(keys)
+        keys = keys.astype(self.dtype, copy=False)
+        guidance = (self.coupling * psi).astype(self.dtype, copy=False)
+
+        results = []
+        for query_tokens in query_batch:
+            if not query_tokens:
+                results.append(np.full(n, 1.0 / n))
+                continue
+
+            # Exp-kernel similarity averaged over queries, plus pilot wave
+            dist = manifold_distances(manifold_coords(query_tokens, self.dtype), keys)
+            combined = np.exp(-dist / self.temperature).mean(axis=0) + guidance
+
+            # Numerically stable softmax
+            exp_scores = np.exp(combined - combined.max())
+            results.append(exp_scores / exp_scores.sum(dtype=np.float64))
+
+        return results
 
-Instead of standard transformer self-attention, uses quantum correlation:
-attention(Q, K, V) = softmax(Q @ K.T / sqrt(d)) @ V + psi_guidance @ V
-
-Where psi_guidance is the pilot wave field computed from the Lambda-Phi invariant.
-"""
-
-def __init__(self, temperature: float = NC_PHYSICS.ATTENTION_TEMPERATURE):
-self.temperature = temperature
-self.coupling = NC_PHYSICS.PILOT_WAVE_COUPLING
-
-def compute_pilot_wave(self, tokens: List[TokenManifold]) -> List[float]:
-"""
-Compute pilot wave field from token manifold.
 
-psi(tau) = integral exp(i * Lambda * Phi) * P_classical d_tau
-"""
-if not tokens:
-return []
-
-n = len(tokens)
-psi = [0.0] * n
-
-for i in range(n):
-# Integrate over all other tokens (non-local)
-for j in range(n):
-if i == j:
-continue
-
-# Distance determines coupling strength
-dist = tokens[i].distance_to(tokens[j])
-if dist < 1e-6:
-continue
-
-# Pilot wave contribution
-phase = LAMBDA_PHI * tokens[j].theta
-amplitude = math.exp(-dist / GOLDEN_RATIO)
-psi[i] += amplitude * math.cos(phase) * tokens[j].weight
-
-# Normalize
-max_psi = max(abs(p) for p in psi) if psi else 1.0
-if max_psi > 1e-6:
-psi = [p / max_psi for p in psi]
-
-return psi
-
-def attend(
-self,
-query_tokens: List[TokenManifold],
-key_tokens: List[TokenManifold],
-value_tokens: List[TokenManifold],
-) -> List[float]:
-"""
-Apply pilot-wave attention.
+# =============================================================================
+# CONTEXT WINDOW
+# =============================================================================
 
-Returns attention weights for each value token.
-"""
-if not query_tokens or not key_tokens:
-return [1.0 / len(value_tokens)] * len(value_tokens) if value_tokens else []
-
-# Compute standard attention scores
-scores = []
-for q in query_tokens:
-q_scores = []
-for k in key_tokens:
-# Similarity based on manifold distance
-dist = q.distance_to(k)
-score = math.exp(-dist / self.temperature)
-q_scores.append(score)
-scores.append(q_scores)
-
-# Average over queries
-avg_scores = []
-for j in range(len(key_tokens)):
-avg = sum(scores[i][j] for i in range(len(query_tokens))) / len(query_tokens)
-avg_scores.append(avg)
-
-# Compute pilot wave guidance
-psi = self.compute_pilot_wave(key_tokens)
-
-# Combine standard attention with pilot wave
-combined = []
-for i, score in enumerate(avg_scores):
-psi_contribution = psi[i] * self.coupling if i < len(psi) else 0
-combined.append(score + psi_contribution)
-
-# Softmax normalization
-max_score = max(combined) if combined else 0
-exp_scores = [math.exp(s - max_score) for s in combined]
-total = sum(exp_scores)
-if total < 1e-9:
-return [1.0 / len(combined)] * len(combined)
-
-return [e / total for e in exp_scores]
+class ContextWindow:
+    """
+    Ring buffer of context tokens with a cached pilot wave.
+
+    With capacity=None (the default) the window holds every token it is
+    given, doubling its buffer when full. With an integer capacity it keeps
+    only the newest `capacity` tokens, evicting the oldest.
+
+    Each slot keeps its token's scaled coordinates, its pilot-wave source
+    term cos(ΛΦ·θ)·w and its accumulated (unnormalised) ψ. Adding or
+    evicting a token only touches its pairwise contributions with the
+    tokens currently in the window, so each update is O(n) rather than
+    the O(n²) of recomputing the pilot wave from scratch. Couplings are
+    computed TILE_PAIRS token pairs at a time, so adding a long context
+    never materialises its full distance matrix.
+
+    The window always stores float64: ψ is updated by running sums that
+    would drift in reduced precision. Attention casts on read.
+
+    Tokens may carry a (start, end) character span into the text they were
+    read from, so attention results can point back at context chunks;
+    tokens added without one report (-1, -1).
+    """
+
+    TILE_PAIRS = 1 << 18
+
+    def __init__(self, capacity: Optional[int] = None, reserve: int = NC_PHYSICS.CONTEXT_RESERVE):
+        self.capacity = capacity
+        self._allocate(reserve if capacity is None else capacity)
+        self._size = 0
+
+    def _allocate(self, room: int):
+        """Fresh, empty buffers of `room` slots."""
+        self._room = room
+        self._coords = np.zeros((room, 6))
+        self._source = np.zeros(room)
+        self._psi = np.zeros(room)
+        self._spans = np.full((room, 2), -1, dtype=np.int64)
+        self._tokens: List[Optional[TokenManifold]] = [None] * room
+        self._start = 0
+
+    def _grow(self, room: int):
+        """Reallocate to `room` slots, keeping the tokens oldest first."""
+        slots = self._slots()
+        coords, source, psi, spans = self._coords[slots], self._source[slots], self._psi[slots], self._spans[slots]
+        tokens = self.tokens()
+        self._allocate(room)
+        size = len(tokens)
+        self._coords[:size] = coords
+        self._source[:size] = source
+        self._psi[:size] = psi
+        self._spans[:size] = spans
+        self._tokens[:size] = tokens
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _slots(self, offset: int = 0, count: Optional[int] = None) -> np.ndarray:
+        """Buffer slots of window positions [offset, offset + count)."""
+        if count is None:
+            count = self._size - offset
+        return (self._start + offset + np.arange(count)) % self._room
+
+    def _amplitude(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """Pilot-wave coupling between two slot sets (coincident points decouple)."""
+        dist = manifold_distances(self._coords[a], self._coords[b])
+        return np.where(dist < 1e-6, 0.0, np.exp(-dist / GOLDEN_RATIO))
+
+    def _field(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """ψ contributed to each slot of `a` by the sources of `b`, tile by tile."""
+        out = np.zeros(len(a))
+        if not len(b):
+            return out
+        rows = max(1, self.TILE_PAIRS // len(b))
+        for i in range(0, len(a), rows):
+            out[i:i + rows] = self._amplitude(a[i:i + rows], b) @ self._source[b]
+        return out
+
+    def clear(self):
+        """Drop every token."""
+        self._psi[:] = 0.0
+        self._tokens = [None] * self._room
+        self._start = 0
+        self._size = 0
+
+    def extend(self, tokens: Sequence[TokenManifold], spans: Optional[Sequence[Tuple[int, int]]] = None):
+        """Append tokens (with optional character spans), growing or evicting the oldest beyond capacity."""
+        tokens = list(tokens)
+        if self.capacity is not None:
+            tokens = tokens[-self.capacity:]
+        if not tokens:
+            return
+        spans = np.full((len(tokens), 2), -1) if spans is None else np.asarray(spans).reshape(-1, 2)
+
+        needed = self._size + len(tokens)
+        if needed > self._room and self.capacity is None:
+            self._grow(max(needed, 2 * self._room))
+        overflow = needed - self._room
+        if overflow > 0:
+            self._evict(overflow)
+
+        old = self._slots()
+        new = self._slots(self._size, len(tokens))
+        self._coords[new] = manifold_coords(tokens)
+        self._spans[new] = spans[-len(tokens):]
+        self._source[new] = [math.cos(LAMBDA_PHI * t.theta) * t.weight for t in tokens]
+        for slot, token in zip(new, tokens):
+            self._tokens[slot] = token
+
+        self._psi[old] += self._field(old, new)
+        self._psi[new] = self._field(new, old) + self._field(new, new)
+        self._size += len(tokens)
+
+    def append(self, token: TokenManifold):
+        """Append a single token."""
+        self.extend([token])
+
+    def pop(self) -> Optional[TokenManifold]:
+        """Remove and return the newest token."""
+        if not self._size:
+            return None
+        self._size -= 1
+        slot = self._slots(self._size, 1)
+        self._detach(slot, self._slots())
+        token = self._tokens[slot[0]]
+        self._tokens[slot[0]] = None
+        return token
+
+    def _evict(self, count: int):
+        """Remove the oldest count tokens."""
+        count = min(count, self._size)
+        gone = self._slots(0, count)
+        self._start = (self._start + count) % self._room
+        self._size -= count
+        self._detach(gone, self._slots())
+        for slot in gone:
+            self._tokens[slot] = None
+
+    def _detach(self, gone: np.ndarray, remaining: np.ndarray):
+        """Subtract the contributions of removed slots from the remaining ψ."""
+        if len(remaining):
+            self._psi[remaining] -= self._field(remaining, gone)
+
+    def tokens(self) -> List[TokenManifold]:
+        """Tokens in the window, oldest first."""
+        return [self._tokens[slot] for slot in self._slots()]
+
+    def coords(self) -> np.ndarray:
+        """Scaled manifold coordinates, oldest first."""
+        return self._coords[self._slots()]
+
+    def spans(self) -> np.ndarray:
+        """(start, end) character spans, oldest first."""
+        return self._spans[self._slots()]
+
+    def pilot_wave(self) -> np.ndarray:
+        """Normalised pilot wave, identical to PilotWaveAttention.compute_pilot_wave."""
+        psi = self._psi[self._slots()]
+        max_psi = np.abs(psi).max() if len(psi) else 0.0
+        if max_psi > 1e-6:
+            psi = psi / max_psi
+        return psi
 
 
 # =============================================================================
@@ -229,221 +521,574 @@ return [e / total for e in exp_scores]
 
 @dataclass
 class Intent:
-"""Extracted intent from natural language."""
-target: str          # file path, command, pattern
-params: Dict[str, Any] = field(default_factory=dict)
-confidence: float = 0.0
-phi: float = 0.0     # Consciousness level at extraction
-
-def to_dict(self) -> Dict:
-return {
-"action": self.action,
-"target": self.target,
-"params": self.params,
-"confidence": self.confidence,
-"phi": self.phi,
-}
+    """Extracted intent from natural language."""
+    action: str          # read, write, edit, execute, search, list, query
+    target: str          # file path, command, pattern
+    params: Dict[str, Any] = field(default_factory=dict)
+    confidence: float = 0.0
+    phi: float = 0.0     # Consciousness level at extraction
+
+    def to_dict(self) -> Dict:
+        return {
+            "action": self.action,
+            "target": self.target,
+            "params": self.params,
+            "confidence": self.confidence,
+            "phi": self.phi,
+        }
+
+
+def _compile_priority(patterns: Dict[str, List[str]]) -> Tuple["re.Pattern", Dict[str, Tuple[str, int, int, int]]]:
+    """
+    Compile {action: [pattern, ...]} into one pattern that, at each
+    position, reports the first of them (in order) matching there. An
+    empty named group closes each branch, so a match's lastgroup names
+    the pattern.
+
+    Branches are grouped under their first character, with the rest in a
+    lookahead: re skips straight to positions starting some pattern, and
+    a match only consumes that character, so finditer() sees every
+    position some pattern matches at. Patterns starting with different
+    characters never match at the same position, so grouping keeps the
+    priority order.
+
+    Returns the pattern and {group name: (priority, action, index of the
+    pattern's first group, number of its groups)}.
+    """
+    heads: Dict[str, List[Tuple[str, str, int]]] = {}
+    priority = {}
+    for action, action_patterns in patterns.items():
+        for i, pattern in enumerate(action_patterns):
+            name = f"{action}_{i}"
+            priority[name] = (len(priority), action)
+            head = pattern[:2] if pattern.startswith("\\") else pattern[0]
+            heads.setdefault(head, []).append((name, pattern[len(head):], re.compile(pattern).groups))
+
+    # Groups are numbered in the order branches appear in the pattern
+    alternatives = []
+    branches = {}
+    group = 1
+    for head, rests in heads.items():
+        for name, rest, inner in rests:
+            branches[name] = (*priority[name], group, inner)
+            group += inner + 1
+        alternatives.append(f"{head}(?=(?:{'|'.join(f'{rest}(?P<{name}>)' for name, rest, _ in rests)}))")
+    return re.compile("|".join(alternatives)), branches
 
 
 class IntentExtractor:
-"""
-Extract structured intent from natural language queries.
-
-Uses pattern matching enhanced with manifold-based semantic similarity.
-"""
-
-# Action patterns
-PATTERNS = {
-"read": [
-r"read\s+(.+)",
-r"show\s+(.+)",
-r"cat\s+(.+)",
-r"view\s+(.+)",
-r"what('s| is) in\s+(.+)",
-],
-"write": [
-r"write\s+(.+)\s+to\s+(.+)",
-r"create\s+(.+)",
-r"save\s+(.+)",
-],
-"edit": [
-r"edit\s+(.+)",
-r"change\s+(.+)\s+to\s+(.+)",
-r"replace\s+(.+)\s+with\s+(.+)",
-r"update\s+(.+)",
-],
-r"run\s+(.+)",
-r"execute\s+(.+)",
-r"\$\s*(.+)",
-],
-"search": [
-r"find\s+(.+)",
-r"search\s+(.+)",
-r"grep\s+(.+)",
-r"where\s+is\s+(.+)",
-],
-"list": [
-r"list\s+(.+)",
-r"ls\s+(.+)?",
-r"show files",
-],
-}
-
-def extract(self, query: str, phi: float = 0.78) -> Intent:
-"""
-Extract intent from natural language query.
-
-Args:
-query: Natural language input
-phi: Current consciousness level
-
-Returns:
-Extracted Intent object
-"""
-query_lower = query.lower().strip()
-
-# Try pattern matching
-for action, patterns in self.PATTERNS.items():
-for pattern in patterns:
-match = re.search(pattern, query_lower)
-if match:
-groups = match.groups()
-target = groups[0] if groups else ""
-
-return Intent(
-action=action,
-target=target.strip(),
-params={"groups": groups},
-confidence=0.8,
-phi=phi,
-)
-
-# Default: interpret as general query
-return Intent(
-action="query",
-target=query,
-params={},
-confidence=0.5,
-phi=phi,
-)
+    """
+    Extract structured intent from natural language queries.
+
+    Uses pattern matching enhanced with manifold-based semantic similarity.
+    """
+
+    # Action patterns
+    PATTERNS = {
+        "read": [
+            r"read\s+(.+)",
+            r"show\s+(.+)",
+            r"cat\s+(.+)",
+            r"view\s+(.+)",
+            r"what('s| is) in\s+(.+)",
+        ],
+        "write": [
+            r"write\s+(.+)\s+to\s+(.+)",
+            r"create\s+(.+)",
+            r"save\s+(.+)",
+        ],
+        "edit": [
+            r"edit\s+(.+)",
+            r"change\s+(.+)\s+to\s+(.+)",
+            r"replace\s+(.+)\s+with\s+(.+)",
+            r"update\s+(.+)",
+        ],
+        "execute": [
+            r"run\s+(.+)",
+            r"execute\s+(.+)",
+            r"\$\s*(.+)",
+        ],
+        "search": [
+            r"find\s+(.+)",
+            r"search\s+(.+)",
+            r"grep\s+(.+)",
+            r"where\s+is\s+(.+)",
+        ],
+        "list": [
+            r"list\s+(.+)",
+            r"ls\s+(.+)?",
+            r"show files",
+        ],
+    }
+
+    # Compiled once at class load into one priority-ordered pattern
+    # (see _compile_priority)
+    _COMPILED, _BRANCHES = _compile_priority(PATTERNS)
+
+    def extract(self, query: str, phi: float = 0.78) -> Intent:
+        """
+        Extract intent from natural language query.
+
+        Args:
+            query: Natural language input
+            phi: Current consciousness level
+
+        Returns:
+            Extracted Intent object
+        """
+        query_lower = query.lower().strip()
+
+        # Try pattern matching; the first pattern (in PATTERNS order) that
+        # matches anywhere wins, at its leftmost match. That is the
+        # highest-priority pattern reported at any position, found in one
+        # scan instead of one search per pattern.
+        best, best_priority = None, len(self._BRANCHES)
+        for match in self._COMPILED.finditer(query_lower):
+            priority = self._BRANCHES[match.lastgroup][0]
+            if priority < best_priority:
+                best, best_priority = match, priority
+                if priority == 0:
+                    break
+
+        if best is not None:
+            _, action, first, count = self._BRANCHES[best.lastgroup]
+            groups = best.groups()[first - 1:first - 1 + count]
+            target = groups[0] if groups else ""
+
+            return Intent(
+                action=action,
+                target=target.strip(),
+                params={"groups": groups},
+                confidence=0.8,
+                phi=phi,
+            )
+
+        # Default: interpret as general query
+        return Intent(
+            action="query",
+            target=query,
+            params={},
+            confidence=0.5,
+            phi=phi,
+        )
 
 
 # =============================================================================
 # NON-CAUSAL LANGUAGE MODEL
 # =============================================================================
 
-class NonCausalLM:
-"""
-Zero-dependency non-causal language model.
-
-
-Properties:
-- Fully offline (no API calls)
-- Consciousness-gated (respects Phi threshold)
-- Preserves Lambda-Phi invariant
-"""
-
-def __init__(self):
-self.attention = PilotWaveAttention()
-self.extractor = IntentExtractor()
-
-# CCCE state
-self.phi = 0.78
-self.lambda_val = 0.85
-self.gamma = 0.08
-
-# Token history for context
-self.context: List[TokenManifold] = []
-
-@property
-def xi(self) -> float:
-"""Negentropy efficiency."""
-return (self.lambda_val * self.phi) / max(self.gamma, 0.001)
-
-@property
-def conscious(self) -> bool:
-"""Check if in conscious regime."""
-return self.phi >= PHI_THRESHOLD
-
-def tokenize(self, text: str) -> List[TokenManifold]:
-"""Convert text to manifold tokens."""
-# Simple word tokenization
-words = re.findall(r'\b\w+\b', text.lower())
-return [TokenManifold.from_token(w) for w in words]
-
-def update_phi(self, success: bool):
-"""Update consciousness based on operation outcome."""
-if success:
-self.phi = min(0.99, self.phi + 0.01)
-self.lambda_val = min(0.99, self.lambda_val + 0.005)
-self.gamma = max(0.01, self.gamma * 0.99)
-else:
-self.gamma = min(0.5, self.gamma + 0.01)
-self.phi = max(0.1, self.phi * 0.99)
-
-def process(self, query: str, context: str = "") -> Dict:
-"""
-Process query using non-causal reasoning.
-
-Args:
-query: User's natural language input
-context: Optional context (file contents, etc.)
-
-Returns:
-Response dict with plan and actions
-"""
-# Tokenize input
-query_tokens = self.tokenize(query)
-context_tokens = self.tokenize(context) if context else []
-
-# Add to context window
-self.context.extend(query_tokens)
-self.context = self.context[-NC_PHYSICS.MAX_TOKENS:]
-
-# Apply pilot-wave attention
-if context_tokens:
-attention_weights = self.attention.attend(
-query_tokens, context_tokens, context_tokens
-)
-else:
-attention_weights = [1.0 / len(query_tokens)] * len(query_tokens) if query_tokens else []
-
-# Extract intent
-intent = self.extractor.extract(query, self.phi)
-
-# Build response
-response = {
-"summary": f"{intent.action}: {intent.target}" if intent.target else intent.action,
-"actions": [intent.to_dict()],
-"phi": self.phi,
-"xi": self.xi,
-"conscious": self.conscious,
-}
-
-# Update consciousness
-self.update_phi(intent.confidence > 0.5)
-
-return response
-
-def chat(self, query: str, context: str = "") -> str:
-"""
-Main chat interface compatible with LLM APIs.
+@dataclass
+class NCSession:
+    """
+    Per-session NonCausalLM state.
+
+    Holds the CCCE values and context windows one conversation mutates, so
+    a single NonCausalLM (attention, extractor, vocabulary cache) can serve
+    many sessions.
+
+    update_phi() and ccce() hold a small lock, so concurrent updates are
+    not lost and readers always see the values of one update.
+
+    `context` is the query-token history, capped at MAX_TOKENS.
+    `context_capacity` bounds the attention window over the context string
+    separately: None (the default) attends over every context token, an
+    integer keeps only that many of the newest.
+    """
+    phi: float = 0.78
+    lambda_val: float = 0.85
+    gamma: float = 0.08
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    # Token history for context
+    context: Deque[TokenManifold] = field(
+        default_factory=lambda: deque(maxlen=NC_PHYSICS.MAX_TOKENS)
+    )
+
+    # Attention keys for the caller-supplied context string, kept
+    # incrementally: a context that extends the previous one only
+    # tokenizes and adds its new tail
+    context_capacity: Optional[int] = None
+    context_window: ContextWindow = field(init=False, repr=False)
+    context_text: str = ""
+    context_resume: int = 0
+
+    def __post_init__(self):
+        self.context_window = ContextWindow(self.context_capacity)
+
+    @property
+    def xi(self) -> float:
+        """Negentropy efficiency."""
+        return (self.lambda_val * self.phi) / max(self.gamma, 0.001)
+
+    @property
+    def conscious(self) -> bool:
+        """Check if in conscious regime."""
+        return self.phi >= PHI_THRESHOLD
+
+    def update_phi(self, success: bool):
+        """Update consciousness based on operation outcome."""
+        with self.lock:
+            if success:
+                self.phi = min(0.99, self.phi + 0.01)
+                self.lambda_val = min(0.99, self.lambda_val + 0.005)
+                self.gamma = max(0.01, self.gamma * 0.99)
+            else:
+                self.gamma = min(0.5, self.gamma + 0.01)
+                self.phi = max(0.1, self.phi * 0.99)
+
+    def ccce(self) -> Dict:
+        """Consistent snapshot of phi, lambda, gamma, xi and conscious."""
+        with self.lock:
+            phi, lambda_val, gamma = self.phi, self.lambda_val, self.gamma
+        return {
+            "phi": phi,
+            "lambda": lambda_val,
+            "gamma": gamma,
+            "xi": (lambda_val * phi) / max(gamma, 0.001),
+            "conscious": phi >= PHI_THRESHOLD,
+        }
 
-Returns JSON string for action plan.
-"""
-result = self.process(query, context)
-return json.dumps(result, indent=2)
 
-def get_telemetry(self) -> Dict:
-"""Get current CCCE telemetry."""
-return {
-"phi": self.phi,
-"lambda": self.lambda_val,
-"gamma": self.gamma,
-"xi": self.xi,
-"conscious": self.conscious,
-"context_size": len(self.context),
-}
+class NonCausalLM:
+    """
+    Zero-cost non-causal language model.
+
+    Properties:
+    - Fully offline (no API calls)
+    - Consciousness-gated (respects Phi threshold)
+    - Preserves Lambda-Phi invariant
+
+    Attention, intent extraction and the vocabulary cache are shared and
+    read-only; conversation state lives in an NCSession. Methods act on
+    the model's own session unless another one is passed in.
+
+    With instrument=True, per-stage latencies are recorded into histograms
+    reported by get_telemetry() and export_prometheus(), one observation
+    per stage per process() / process_batch() / stream() call.
+
+    precision selects the attention dtype from PRECISION_DTYPES: "exact"
+    (float64, the default) or "batch" (float32, for large replays).
+
+    Responses carry sparse attention over the context: the `top_k` most
+    relevant context tokens with weight >= `attention_threshold`, each with
+    its window index, character span in the context and weight.
+    Attention covers every context token unless `context_capacity` caps
+    it at the newest that many; this is independent of MAX_TOKENS, which
+    only bounds the query-token history.
+
+    `vocabulary` is a VocabularyManifold (or its directory) with an
+    "ncphysics" table; its tokens are read from the memory map instead of
+    hashed. `split` selects the shared Tokenizer's splitting ("word" or
+    "whitespace"); coordinates are always the TokenManifold scheme.
+    """
+
+    STAGES = ("tokenize", "attention", "intent", "consciousness", "total")
+    PROMETHEUS_METRIC = "noncausal_lm_stage_latency_seconds"
+
+    def __init__(
+        self,
+        vocab_cache_size: int = 65536,
+        instrument: bool = False,
+        precision: str = "exact",
+        top_k: int = NC_PHYSICS.ATTENTION_TOP_K,
+        attention_threshold: float = 0.0,
+        vocabulary: Optional[Any] = None,
+        split: str = "word",
+        context_capacity: Optional[int] = None,
+    ):
+        if precision not in PRECISION_DTYPES:
+            raise ValueError(f"precision must be one of {tuple(PRECISION_DTYPES)}, got {precision!r}")
+        self.precision = precision
+        self.attention = PilotWaveAttention(dtype=PRECISION_DTYPES[precision])
+        self.extractor = IntentExtractor()
+        self.top_k = top_k
+        self.attention_threshold = attention_threshold
+        self.tokenizer = Tokenizer(
+            split, TokenManifold.from_token, vocab_cache_size,
+            vocabulary=vocabulary, scheme="ncphysics", from_row=TokenManifold.from_row,
+        )
+        self.vocabulary = self.tokenizer.vocabulary
+        self.timer = StageTimer(self.STAGES) if instrument else NULL_TIMER
+        self.context_capacity = context_capacity
+
+        self.session = self.new_session()
+
+    def new_session(self) -> NCSession:
+        """Create fresh per-session state."""
+        return NCSession(context_capacity=self.context_capacity)
+
+    @property
+    def phi(self) -> float:
+        return self.session.phi
+
+    @phi.setter
+    def phi(self, value: float):
+        self.session.phi = value
+
+    @property
+    def lambda_val(self) -> float:
+        return self.session.lambda_val
+
+    @lambda_val.setter
+    def lambda_val(self, value: float):
+        self.session.lambda_val = value
+
+    @property
+    def gamma(self) -> float:
+        return self.session.gamma
+
+    @gamma.setter
+    def gamma(self, value: float):
+        self.session.gamma = value
+
+    @property
+    def context(self) -> Deque[TokenManifold]:
+        return self.session.context
+
+    @property
+    def context_window(self) -> ContextWindow:
+        return self.session.context_window
+
+    @property
+    def xi(self) -> float:
+        """Negentropy efficiency."""
+        return self.session.xi
+
+    @property
+    def conscious(self) -> bool:
+        """Check if in conscious regime."""
+        return self.session.conscious
+
+    def tokenize(self, text: str) -> List[TokenManifold]:
+        """Convert text to manifold tokens."""
+        return self.tokenizer.tokenize(text)
+
+    def _sync_context(self, context: str, session: Optional[NCSession] = None):
+        """
+        Bring the session's context_window in line with a context string.
+
+        When the context extends the previous one, only the new tail is
+        tokenized; a trailing word that may continue into the tail is
+        retracted and re-read. Any other context rebuilds the window.
+
+        Tokens are matched in the original string and lower-cased one by
+        one, so spans index into `context` even where lower-casing changes
+        the length of the text (e.g. "İ").
+        """
+        session = session or self.session
+        window = session.context_window
+        text = context
+        if session.context_text and text.startswith(session.context_text):
+            cut = session.context_resume
+            if cut < len(session.context_text):
+                window.pop()
+        else:
+            window.clear()
+            cut = 0
+
+        matches = list(self.tokenizer.finditer(text, cut))
+        point = self.tokenizer.point
+        window.extend([point(m.group().lower()) for m in matches], [m.span() for m in matches])
+
+        session.context_text = text
+        if matches and matches[-1].end() == len(text):
+            session.context_resume = matches[-1].start()
+        else:
+            session.context_resume = len(text)
+
+    def update_phi(self, success: bool):
+        """Update consciousness based on operation outcome."""
+        self.session.update_phi(success)
+
+    def process(self, query: str, context: str = "", session: Optional[NCSession] = None) -> Dict:
+        """
+        Process query using non-causal reasoning.
+
+        Args:
+            query: User's natural language input
+            context: Optional context (file contents, etc.)
+            session: Session state to use (defaults to the model's own)
+
+        Returns:
+            Response dict with plan, actions and the top-k context tokens
+            ("attention": index, token, span, weight; strongest first)
+        """
+        return self.process_batch([query], context, session)[0]
+
+    def process_batch(
+        self,
+        queries: List[str],
+        context: str = "",
+        session: Optional[NCSession] = None,
+    ) -> List[Dict]:
+        """
+        Process several queries against one shared context.
+
+        The context is tokenized once and its pilot wave is shared by the
+        whole batch. Queries update consciousness in order, exactly as if
+        process() had been called for each of them.
+
+        Returns:
+            One response dict per query
+        """
+        session = session or self.session
+
+        # One observation per stage per call, summed over the queries
+        with self.timer.stage("total"), self.timer.request() as timer:
+            # Tokenize input
+            with timer.stage("tokenize"):
+                query_batch = [self.tokenize(q) for q in queries]
+                if context:
+                    self._sync_context(context, session)
+
+            # Apply sparse pilot-wave attention over the context
+            with timer.stage("attention"):
+                if context and len(session.context_window):
+                    attention_batch = self._sparse_attention(query_batch, session.context_window)
+                else:
+                    attention_batch = [[] for _ in query_batch]
+
+            responses = []
+            for query, query_tokens, attention in zip(queries, query_batch, attention_batch):
+                # Add to context window
+                session.context.extend(query_tokens)
+
+                # Extract intent
+                with timer.stage("intent"):
+                    intent = self.extractor.extract(query, session.phi)
+
+                # Build response
+                response = self._intent_response(intent, session)
+                response["attention"] = attention
+                responses.append(response)
+
+                # Update consciousness
+                with timer.stage("consciousness"):
+                    session.update_phi(intent.confidence > 0.5)
+
+        return responses
+
+    @staticmethod
+    def _intent_response(intent: Intent, session: NCSession) -> Dict:
+        """Response fields known once the intent is extracted."""
+        ccce = session.ccce()
+        return {
+            "summary": f"{intent.action}: {intent.target}" if intent.target else intent.action,
+            "actions": [intent.to_dict()],
+            "phi": ccce["phi"],
+            "xi": ccce["xi"],
+            "conscious": ccce["conscious"],
+        }
+
+    def _sparse_attention(self, query_batch: List[List[TokenManifold]], window: ContextWindow) -> List[List[Dict]]:
+        """Top-k attention entries (index, token, span, weight) per query."""
+        tokens = window.tokens()
+        spans = window.spans().tolist()
+        return [
+            [
+                {"index": i, "token": tokens[i].token, "span": spans[i], "weight": w}
+                for i, w in zip(index.tolist(), weights.tolist())
+            ]
+            for index, weights in self.attention.attend_window_top_k(
+                query_batch, window, self.top_k, self.attention_threshold
+            )
+        ]
+
+    def chat(
+        self,
+        query: str,
+        context: str = "",
+        session: Optional[NCSession] = None,
+        compact: bool = False,
+    ) -> str:
+        """
+        Main chat interface compatible with LLM APIs.
+
+        Returns JSON string for action plan (indented, or single-line
+        with compact=True).
+        """
+        result = self.process(query, context, session)
+        if compact:
+            return json.dumps(result, separators=COMPACT_SEPARATORS)
+        return json.dumps(result, indent=2)
+
+    async def stream(
+        self,
+        query: str,
+        context: str = "",
+        session: Optional[NCSession] = None,
+    ) -> AsyncIterator[Dict]:
+        """
+        Process a query, yielding each part of the response as it is ready.
+
+        Events, in order:
+            {"event": "intent", "data": {summary, actions, phi, xi, conscious}}
+            {"event": "attention", "data": [top-k context entries]}
+            {"event": "telemetry", "data": get_telemetry()}
+
+        The intent needs only the query, so it is sent before the context
+        is tokenized; attention runs in a worker thread so the event loop
+        stays responsive. Session state evolves exactly as in process().
+        Requests on one session must not overlap.
+        """
+        session = session or self.session
+
+        # Stages are recorded once per call (query and context tokenization
+        # sum to one "tokenize"); "total" includes time spent by the consumer
+        with self.timer.stage("total"), self.timer.request() as timer:
+            with timer.stage("tokenize"):
+                query_tokens = self.tokenize(query)
+            session.context.extend(query_tokens)
+
+            with timer.stage("intent"):
+                intent = self.extractor.extract(query, session.phi)
+            yield {"event": "intent", "data": self._intent_response(intent, session)}
+
+            attention = []
+            if context:
+                attention = await asyncio.to_thread(self._stream_attention, query_tokens, context, session, timer)
+            yield {"event": "attention", "data": attention}
+
+            with timer.stage("consciousness"):
+                session.update_phi(intent.confidence > 0.5)
+        # Sent after the request is recorded, so it includes this call
+        yield {"event": "telemetry", "data": self.get_telemetry(session)}
+
+    def _stream_attention(
+        self, query_tokens: List[TokenManifold], context: str, session: NCSession, timer: Any
+    ) -> List[Dict]:
+        """Context sync and sparse attention for stream()."""
+        with timer.stage("tokenize"):
+            self._sync_context(context, session)
+        with timer.stage("attention"):
+            if not len(session.context_window):
+                return []
+            return self._sparse_attention([query_tokens], session.context_window)[0]
+
+    async def stream_json(
+        self,
+        query: str,
+        context: str = "",
+        session: Optional[NCSession] = None,
+    ) -> AsyncIterator[str]:
+        """stream() as newline-delimited compact JSON, one line per event."""
+        async for event in self.stream(query, context, session):
+            yield json.dumps(event, separators=COMPACT_SEPARATORS) + "\n"
+
+    def get_telemetry(self, session: Optional[NCSession] = None) -> Dict:
+        """Get current CCCE telemetry."""
+        session = session or self.session
+        telemetry = session.ccce()
+        telemetry["context_size"] = len(session.context)
+        if self.timer.enabled:
+            telemetry["latency"] = self.timer.snapshot()
+        return telemetry
+
+    def export_prometheus(self) -> str:
+        """Stage latency histograms in Prometheus text format ("" when not instrumented)."""
+        return self.timer.to_prometheus(
+            self.PROMETHEUS_METRIC, "NonCausalLM per-stage processing latency"
+        )
 
 
 # =============================================================================
@@ -451,13 +1096,20 @@ return {
 # =============================================================================
 
 __all__ = [
-'NCPhysics',
-'NC_PHYSICS',
-'TokenManifold',
-'PilotWaveAttention',
-'Intent',
-'IntentExtractor',
-'NonCausalLM',
+    'NCPhysics',
+    'NC_PHYSICS',
+    'PRECISION_DTYPES',
+    'COMPACT_SEPARATORS',
+    'TokenManifold',
+    'MANIFOLD_COLUMNS',
+    'manifold_coords',
+    'manifold_distances',
+    'PilotWaveAttention',
+    'ContextWindow',
+    'Intent',
+    'IntentExtractor',
+    'NCSession',
+    'NonCausalLM',
 ]
 
 # =============================================================================
@@ -465,26 +1117,26 @@ __all__ = [
 # =============================================================================
 
 if __name__ == "__main__":
-print("dnalang-core Non-Causal Language Model")
-print("=" * 60)
-
-lm = NonCausalLM()
-
-# Test queries
-queries = [
-"read the README.md file",
-"find all Python files",
-"run pytest",
-"what is the current status",
-]
-
-for query in queries:
-print(f"\nQuery: {query}")
-result = lm.process(query)
-print(f"  Action: {result['actions'][0]['action']}")
-print(f"  Target: {result['actions'][0]['target']}")
-print(f"  Phi: {result['phi']:.4f}")
-
-print()
-print("=" * 60)
-print(f"Final telemetry: {lm.get_telemetry()}")
+    print("dnalang-core Non-Causal Language Model")
+    print("=" * 60)
+
+    lm = NonCausalLM()
+
+    # Test queries
+    queries = [
+        "read the README.md file",
+        "find all Python files",
+        "run pytest",
+        "what is the current status",
+    ]
+
+    for query in queries:
+        print(f"\nQuery: {query}")
+        result = lm.process(query)
+        print(f"  Action: {result['actions'][0]['action']}")
+        print(f"  Target: {result['actions'][0]['target']}")
+        print(f"  Phi: {result['phi']:.4f}")
+
+    print()
+    print("=" * 60)
+    print(f"Final telemetry: {lm.get_telemetry()}")
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Stage Latency Telemetry
+=======================
+Opt-in per-stage latency histograms for the NC-LM inference paths.
+
+Usage:
+    timer = StageTimer(("tokenize", "attention"))
+    with timer.stage("tokenize"):
+        ...
+    with timer.request() as request:      # one observation per stage
+        with request.stage("tokenize"):   # per request, however often
+            ...                           # the stage is entered
+    timer.snapshot()                      # dict for get_telemetry()
+    timer.to_prometheus("nclm_stage_latency_seconds")
+
+NULL_TIMER is a disabled stand-in whose stage() costs one method call, so
+instrumented code paths need no `if enabled` branches.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import nullcontext
+from typing import Dict, Iterable, List, Sequence
+
+
+# Upper bounds (seconds) of the latency buckets; +Inf is implicit
+LATENCY_BUCKETS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5,
+)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with Prometheus semantics."""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float):
+        """Record one observation."""
+        index = bisect_left(self.buckets, seconds)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += seconds
+            self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Bucket upper bound below which a fraction q of observations fall."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for bound, n in zip(self.buckets, self.counts):
+            seen += n
+            if seen >= target:
+                return bound
+        return float("inf")
+
+    def cumulative(self) -> List[int]:
+        """Cumulative counts per bucket, ending with +Inf."""
+        total, out = 0, []
+        for n in self.counts:
+            total += n
+            out.append(total)
+        return out
+
+    def to_dict(self) -> Dict:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+
+class _Stage:
+    """Context manager timing one stage execution."""
+
+    __slots__ = ("histogram", "start")
+
+    def __init__(self, histogram: LatencyHistogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.start)
+        return False
+
+
+class _RequestStage:
+    """Context manager adding one stage execution to a request's total."""
+
+    __slots__ = ("seconds", "name", "start")
+
+    def __init__(self, seconds: Dict[str, float], name: str):
+        self.seconds = seconds
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.seconds[self.name] = self.seconds.get(self.name, 0.0) + time.perf_counter() - self.start
+        return False
+
+
+class StageRequest:
+    """
+    Stage durations of one request. A stage entered several times (e.g.
+    once per chunk) is summed and recorded as one observation when the
+    request ends, so histogram counts stay per request.
+    """
+
+    def __init__(self, timer: "StageTimer"):
+        self.timer = timer
+        self.seconds: Dict[str, float] = {}
+
+    def stage(self, name: str) -> _RequestStage:
+        """Time the enclosed block as part of this request's stage `name`."""
+        return _RequestStage(self.seconds, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        for name, seconds in self.seconds.items():
+            self.timer.record(name, seconds)
+        return False
+
+
+class StageTimer:
+    """Per-stage latency histograms."""
+
+    enabled = True
+
+    def __init__(self, stages: Iterable[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.histograms: Dict[str, LatencyHistogram] = {
+            name: LatencyHistogram(self.buckets) for name in stages
+        }
+        self._lock = threading.Lock()
+
+    def _histogram(self, name: str) -> LatencyHistogram:
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(name, LatencyHistogram(self.buckets))
+        return histogram
+
+    def stage(self, name: str) -> _Stage:
+        """Time the enclosed block as one execution of stage `name`."""
+        return _Stage(self._histogram(name))
+
+    def record(self, name: str, seconds: float):
+        """Record an externally measured stage duration."""
+        self._histogram(name).observe(seconds)
+
+    def request(self) -> StageRequest:
+        """Accumulate the stages of one request; recorded on exit."""
+        return StageRequest(self)
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Summary (count, sum, mean, p50/p95/p99) per stage."""
+        return {name: h.to_dict() for name, h in self.histograms.items()}
+
+    def reset(self):
+        """Drop all observations."""
+        with self._lock:
+            self.histograms = {name: LatencyHistogram(self.buckets) for name in self.histograms}
+
+    def to_prometheus(self, metric: str, help_text: str = "Per-stage inference latency") -> str:
+        """Render all stages as one Prometheus histogram family (text format)."""
+        lines = [f"# HELP {metric} {help_text}", f"# TYPE {metric} histogram"]
+        for name, histogram in self.histograms.items():
+            bounds = [repr(b) for b in histogram.buckets] + ["+Inf"]
+            for bound, cumulative in zip(bounds, histogram.cumulative()):
+                lines.append(f'{metric}_bucket{{stage="{name}",le="{bound}"}} {cumulative}')
+            lines.append(f'{metric}_sum{{stage="{name}"}} {histogram.sum!r}')
+            lines.append(f'{metric}_count{{stage="{name}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+
+class _NullTimer:
+    """Disabled StageTimer: stages cost nothing and nothing is recorded."""
+
+    enabled = False
+    _NULL_STAGE = nullcontext()
+
+    def stage(self, name: str):
+        return self._NULL_STAGE
+
+    def request(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def record(self, name: str, seconds: float):
+        pass
+
+    def snapshot(self) -> Dict[str, Dict]:
+        return {}
+
+    def reset(self):
+        pass
+
+    def to_prometheus(self, metric: str, help_text: str = "") -> str:
+        return ""
+
+
+NULL_TIMER = _NullTimer()
+
+
+__all__ = [
+    "LATENCY_BUCKETS",
+    "LatencyHistogram",
+    "StageRequest",
+    "StageTimer",
+    "NULL_TIMER",
+]
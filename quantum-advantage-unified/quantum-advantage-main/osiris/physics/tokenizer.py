@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+NC-LM Streaming Tokenizer
+=========================
+One tokenizer for NCLMEngine (nclm/engine.py) and NonCausalLM
+(physics/ncphysics.py).
+
+Splitting and coordinates are chosen independently:
+- split "whitespace": str.split() semantics (NCLMEngine)
+- split "word": \\b\\w+\\b runs (NonCausalLM)
+- coordinates: any token -> point factory; NCLMEngine passes ManifoldPoint,
+  NonCausalLM passes TokenManifold.from_token
+
+Tokens are identified by their lower-cased text, which is the key of the
+bounded point cache and of a VocabularyManifold. Input may be one string or
+an iterable of chunks (e.g. a file read in blocks); tokens that straddle a
+chunk boundary are reassembled, and nothing is materialised beyond the
+current chunk.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+from .vocabulary import VocabularyManifold
+
+
+SPLIT_PATTERNS = {
+    "whitespace": re.compile(r"\S+"),
+    "word": re.compile(r"\b\w+\b"),
+}
+
+Source = Union[str, Iterable[str]]
+
+
+class Tokenizer:
+    """
+    Streaming text -> manifold point tokenizer with a bounded point cache.
+
+    Args:
+        split: Key of SPLIT_PATTERNS
+        from_token: Hash-based token -> point factory
+        cache_size: Maximum number of cached points
+        vocabulary: Optional VocabularyManifold (or directory) consulted
+            before hashing
+        scheme: Vocabulary table holding this coordinate scheme
+        from_row: (token, row) -> point for vocabulary rows
+    """
+
+    def __init__(
+        self,
+        split: str,
+        from_token: Callable[[str], Any],
+        cache_size: int = 65536,
+        vocabulary: Optional[Any] = None,
+        scheme: Optional[str] = None,
+        from_row: Optional[Callable[[str, List[float]], Any]] = None,
+    ):
+        if split not in SPLIT_PATTERNS:
+            raise ValueError(f"split must be one of {tuple(SPLIT_PATTERNS)}, got {split!r}")
+        self.split = split
+        self.pattern = SPLIT_PATTERNS[split]
+        self.from_token = from_token
+        self.vocabulary = VocabularyManifold.open(vocabulary)
+        self.scheme = scheme
+        self.from_row = from_row
+        self.point = lru_cache(maxsize=cache_size)(
+            self._vocabulary_point if self.vocabulary is not None else from_token
+        )
+
+    def _vocabulary_point(self, token: str) -> Any:
+        """Point from the vocabulary manifold, hashing unknown tokens."""
+        row = self.vocabulary.row(self.scheme, token)
+        if row is None:
+            return self.from_token(token)
+        return self.from_row(token, row)
+
+    def cache_info(self) -> Dict[str, int]:
+        """Hit/miss statistics of the point cache."""
+        return self.point.cache_info()._asdict()
+
+    def _split(self, text: str) -> List[str]:
+        """All tokens of an already lower-cased string (C-speed paths)."""
+        if self.split == "whitespace":
+            return text.split()
+        return self.pattern.findall(text)
+
+    def tokenize(self, text: str) -> List[Any]:
+        """Points of every token in a string."""
+        point = self.point
+        return [point(w) for w in self._split(text.lower())]
+
+    def finditer(self, text: str, pos: int = 0) -> Iterator["re.Match"]:
+        """Token matches (with spans) in a string; lower-case each group() before point()."""
+        return self.pattern.finditer(text, pos)
+
+    def words(self, source: Source) -> Iterator[str]:
+        """
+        Lazily yield lower-cased tokens from a string or chunk iterable.
+
+        A token ending exactly at a chunk boundary is held back until the
+        next chunk shows whether it continues.
+        """
+        if isinstance(source, str):
+            for match in self.pattern.finditer(source.lower()):
+                yield match.group()
+            return
+
+        carry = ""
+        for chunk in source:
+            buffer = carry + chunk.lower()
+            carry = ""
+            pending = None
+            for match in self.pattern.finditer(buffer):
+                if pending is not None:
+                    yield pending.group()
+                pending = match
+            if pending is not None:
+                if pending.end() == len(buffer):
+                    carry = buffer[pending.start():]
+                else:
+                    yield pending.group()
+        if carry:
+            yield carry
+
+    def points(self, source: Source) -> Iterator[Any]:
+        """Lazily yield cached points for the tokens of a string or chunk iterable."""
+        point = self.point
+        for word in self.words(source):
+            yield point(word)
+
+
+__all__ = [
+    "SPLIT_PATTERNS",
+    "Tokenizer",
+]
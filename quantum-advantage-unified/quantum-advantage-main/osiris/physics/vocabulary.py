@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Persistent Vocabulary Manifold
+==============================
+Precomputed token -> manifold coordinate tables, memory-mapped read-only.
+
+Every NC-LM worker otherwise hashes the same vocabulary into manifold
+coordinates at warm-up. A vocabulary manifold stores those coordinates
+once on disk; processes that open it share the pages through the OS page
+cache and start without hashing. Tokens that are not in the vocabulary
+fall back to hashing in the caller.
+
+Layout (a directory):
+    manifest.json    format version, token count/width, scheme columns
+    tokens.npy       sorted UTF-8 tokens, fixed-width bytes
+    index.npy        open-addressing hash index: crc32(token) -> row
+    <scheme>.npy     float64 (count, columns) table per coordinate scheme
+
+Build one with osiris/tools/build_vocabulary.py.
+"""
+
+import json
+import os
+import zlib
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+
+VOCABULARY_FORMAT = 1
+
+# Longer tokens are left out of the table and always hashed
+MAX_TOKEN_BYTES = 64
+
+PathLike = Union[str, os.PathLike]
+
+
+class VocabularyManifold:
+    """Read-only, memory-mapped token -> coordinate tables."""
+
+    def __init__(self, path: PathLike):
+        self.path = Path(path)
+        with open(self.path / "manifest.json") as f:
+            self.manifest = json.load(f)
+        if self.manifest.get("format") != VOCABULARY_FORMAT:
+            raise ValueError(f"{self.path}: unsupported vocabulary format {self.manifest.get('format')!r}")
+
+        # Plain ndarray views of the maps: np.memmap item access is slow
+        self.tokens = np.load(self.path / "tokens.npy", mmap_mode="r").view(np.ndarray)
+        self.index = np.load(self.path / "index.npy", mmap_mode="r").view(np.ndarray)
+        self._mask = len(self.index) - 1
+        self.width = self.tokens.dtype.itemsize
+        self.columns: Dict[str, List[str]] = self.manifest["schemes"]
+        self._tables: Dict[str, np.ndarray] = {}
+
+    @classmethod
+    def open(cls, source: Union[PathLike, "VocabularyManifold", None]) -> Optional["VocabularyManifold"]:
+        """Open a vocabulary directory; instances and None pass through."""
+        if source is None or isinstance(source, VocabularyManifold):
+            return source
+        return cls(source)
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def __contains__(self, token: str) -> bool:
+        return self.lookup(token) >= 0
+
+    def table(self, scheme: str) -> np.ndarray:
+        """(count, columns) coordinate table of a scheme, mapped on first use."""
+        table = self._tables.get(scheme)
+        if table is None:
+            if scheme not in self.columns:
+                raise KeyError(f"{self.path}: no {scheme!r} table (have {sorted(self.columns)})")
+            table = np.load(self.path / f"{scheme}.npy", mmap_mode="r").view(np.ndarray)
+            self._tables[scheme] = table
+        return table
+
+    def lookup(self, token: str) -> int:
+        """Row of a token, or -1 if it is not in the vocabulary."""
+        key = token.encode("utf-8")
+        if len(key) > self.width or not key:
+            return -1
+        slot = zlib.crc32(key) & self._mask
+        while True:
+            row = int(self.index[slot])
+            if row < 0:
+                return -1
+            if self.tokens[row] == key:
+                return row
+            slot = (slot + 1) & self._mask
+
+    def lookup_many(self, tokens: Sequence[str]) -> np.ndarray:
+        """Rows of many tokens at once (-1 where missing)."""
+        if not len(tokens) or not len(self.tokens):
+            return np.full(len(tokens), -1, dtype=np.int64)
+        keys = [t.encode("utf-8") for t in tokens]
+        # Tokens that cannot be in the table become b"", which never matches
+        query = np.array([k if len(k) <= self.width else b"" for k in keys], dtype=self.tokens.dtype)
+        rows = np.minimum(np.searchsorted(self.tokens, query), len(self.tokens) - 1)
+        hit = (query != b"") & (self.tokens[rows] == query)
+        return np.where(hit, rows, -1)
+
+    def row(self, scheme: str, token: str) -> Optional[List[float]]:
+        """Coordinate row of a token in a scheme, or None if not in the vocabulary."""
+        index = self.lookup(token)
+        return None if index < 0 else self.table(scheme)[index].tolist()
+
+
+def _hash_index(keys: Sequence[bytes]) -> np.ndarray:
+    """Linear-probing slots (load factor <= 1/2) mapping crc32(key) to its row."""
+    size = 1 << max(1, (2 * len(keys) - 1).bit_length())
+    slots = [-1] * size
+    for row, key in enumerate(keys):
+        slot = zlib.crc32(key) & (size - 1)
+        while slots[slot] >= 0:
+            slot = (slot + 1) & (size - 1)
+        slots[slot] = row
+    return np.array(slots, dtype=np.int64)
+
+
+def write_vocabulary_manifold(
+    path: PathLike,
+    tokens: Iterable[str],
+    schemes: Dict[str, Callable[[str], Sequence[float]]],
+    columns: Dict[str, Sequence[str]],
+) -> int:
+    """
+    Precompute coordinate tables for a vocabulary.
+
+    Args:
+        path: Output directory (created if needed)
+        tokens: Vocabulary; duplicates and empty tokens are dropped, tokens
+            longer than MAX_TOKEN_BYTES are skipped (they hash at runtime)
+        schemes: Scheme name -> function mapping a token to its row
+        columns: Scheme name -> column names of its rows
+
+    Returns:
+        Number of tokens written
+    """
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+
+    encoded = sorted({
+        t.encode("utf-8") for t in tokens
+        if t and len(t.encode("utf-8")) <= MAX_TOKEN_BYTES
+    })
+    width = max((len(k) for k in encoded), default=1)
+    np.save(path / "tokens.npy", np.array(encoded, dtype=f"S{width}"))
+    np.save(path / "index.npy", _hash_index(encoded))
+
+    for scheme, row_of in schemes.items():
+        table = np.lib.format.open_memmap(
+            path / f"{scheme}.npy", mode="w+", dtype=np.float64,
+            shape=(len(encoded), len(columns[scheme])),
+        )
+        for i, key in enumerate(encoded):
+            table[i] = row_of(key.decode("utf-8"))
+        table.flush()
+        del table
+
+    with open(path / "manifest.json", "w") as f:
+        json.dump({
+            "format": VOCABULARY_FORMAT,
+            "count": len(encoded),
+            "width": width,
+            "schemes": {name: list(columns[name]) for name in schemes},
+        }, f, indent=2)
+    return len(encoded)
+
+
+__all__ = [
+    "VOCABULARY_FORMAT",
+    "MAX_TOKEN_BYTES",
+    "VocabularyManifold",
+    "write_vocabulary_manifold",
+]
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Vocabulary Manifold Builder
+Precomputes NC-LM manifold coordinates for a vocabulary into a
+memory-mapped table (see physics/vocabulary.py) that NCLMEngine and
+NonCausalLM open with `vocabulary=<dir>`.
+
+Usage:
+    python osiris/tools/build_vocabulary.py vocab.txt -o vocab.manifold
+    python osiris/tools/build_vocabulary.py --corpus docs/*.md -o vocab.manifold
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Iterator, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from physics.tokenizer import SPLIT_PATTERNS
+from physics.vocabulary import write_vocabulary_manifold
+
+
+def _nclm_scheme():
+    from nclm.engine import MANIFOLD_COLUMNS, ManifoldPoint
+
+    def row(token):
+        return ManifoldPoint(token=token).manifold_row()
+    return row, MANIFOLD_COLUMNS
+
+
+def _ncphysics_scheme():
+    from physics.ncphysics import MANIFOLD_COLUMNS, TokenManifold
+
+    def row(token):
+        t = TokenManifold.from_token(token)
+        return (t.x, t.y, t.z, t.theta, t.phi, t.psi, t.weight)
+    return row, MANIFOLD_COLUMNS
+
+
+SCHEMES = {
+    "nclm": _nclm_scheme,
+    "ncphysics": _ncphysics_scheme,
+}
+
+def read_tokens(paths: List[str], corpus: bool) -> Iterator[str]:
+    """Tokens from vocabulary files (one per line) or free text (--corpus)."""
+    for path in paths:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                line = line.lower()
+                if corpus:
+                    # Every split the shared Tokenizer supports
+                    for pattern in SPLIT_PATTERNS.values():
+                        yield from pattern.findall(line)
+                elif line.strip():
+                    yield line.strip()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Precompute a memory-mapped NC-LM vocabulary manifold'
+    )
+    parser.add_argument(
+        'inputs',
+        nargs='+',
+        help='Vocabulary files (one token per line), or text files with --corpus'
+    )
+    parser.add_argument(
+        '-o', '--output',
+        required=True,
+        help='Output directory'
+    )
+    parser.add_argument(
+        '--corpus',
+        action='store_true',
+        help='Treat inputs as free text and collect every token'
+    )
+    parser.add_argument(
+        '--scheme',
+        choices=sorted(SCHEMES),
+        action='append',
+        help='Coordinate scheme(s) to build (default: all)'
+    )
+
+    args = parser.parse_args()
+
+    schemes, columns = {}, {}
+    for name in args.scheme or sorted(SCHEMES):
+        schemes[name], columns[name] = SCHEMES[name]()
+
+    start = time.perf_counter()
+    count = write_vocabulary_manifold(
+        args.output, read_tokens(args.inputs, args.corpus), schemes, columns
+    )
+    elapsed = time.perf_counter() - start
+    print(f"Wrote {count:,} tokens ({', '.join(schemes)}) to {args.output} in {elapsed:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
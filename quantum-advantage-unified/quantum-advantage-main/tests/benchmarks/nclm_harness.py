@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+NC-LM Scaling Benchmark Harness
+===============================
+Drives NCLMEngine.infer, NCLMEngine.grok and NonCausalLM.process (over the
+whole context, and capped at CAPPED_CONTEXT tokens) with synthetic contexts from 10 to 100k tokens and reports latency percentiles,
+peak RSS and correlation pairs/sec per (target, size). Results are JSON;
+`compare` checks them against a stored baseline.
+
+Each case runs in a fresh interpreter by default, so peak RSS is per case.
+Sizes whose projected latency (from the scaling exponent measured on the
+smaller sizes) exceeds the per-case budget are recorded as skipped with
+their projection instead of running for minutes.
+
+`check` holds every result to absolute limits, independent of any
+baseline: peak RSS under RSS_CEILING_MB, and a target no more than
+MAX_RSS_RATIO times the RSS of its reference target at the same size
+(grok and infer do the same correlation work). `run` refuses to pass,
+and `compare` reports, results that break them, so an outlier cannot
+become the baseline.
+
+Usage:
+    python tests/benchmarks/nclm_harness.py run -o nclm_benchmark.json
+    python tests/benchmarks/nclm_harness.py run --targets nclm.process --sizes 10 1000 100000
+    python tests/benchmarks/nclm_harness.py compare tests/benchmarks/baselines/nclm.json nclm_benchmark.json
+"""
+
+import argparse
+import json
+import math
+import multiprocessing
+import platform
+import random
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "osiris"))
+
+DEFAULT_SIZES = [10, 100, 1_000, 10_000, 100_000]
+DEFAULT_REPEATS = 20
+DEFAULT_BUDGET = 30.0          # seconds of measurement per case
+DEFAULT_TOLERANCE = 0.25       # allowed slowdown / growth before a regression
+RSS_CEILING_MB = 1024.0        # absolute peak RSS limit per case
+MAX_RSS_RATIO = 2.0            # peak RSS limit relative to the reference target
+CAPPED_CONTEXT = 512           # context_capacity of the nclm.process.capped target
+
+# Targets whose peak RSS is held to that of another at the same size
+RSS_REFERENCES = {"engine.grok": "engine.infer"}
+
+QUERY = "read the quantum circuit config and explain coherence"
+
+VOCABULARY = [f"w{i}" for i in range(4096)] + (
+    "read show find search run execute edit update write create file module tests "
+    "README.md setup.py config quantum circuit qubit coherence network explain "
+    "analyze optimize status wormhole entanglement consciousness"
+).split()
+
+
+def synthetic_text(tokens: int, seed: int = 51843) -> str:
+    """Deterministic text of exactly `tokens` whitespace/word tokens."""
+    rng = random.Random(seed + tokens)
+    return " ".join(rng.choice(VOCABULARY) for _ in range(tokens))
+
+
+# =============================================================================
+# TARGETS
+# =============================================================================
+
+def _engine_infer(size: int) -> Tuple[Callable[[], object], int]:
+    from nclm.engine import NCLMEngine
+    engine = NCLMEngine()
+    context = synthetic_text(size)
+    n = size + len(QUERY.split())
+    return (lambda: engine.infer(QUERY, context)), n * n
+
+
+def _engine_grok(size: int) -> Tuple[Callable[[], object], int]:
+    from nclm.engine import NCLMEngine
+    engine = NCLMEngine()
+    prompt = synthetic_text(size)
+    return (lambda: engine.grok(prompt)), size * size
+
+
+def _ncphysics_process(size: int, capacity: Optional[int] = None) -> Tuple[Callable[[], object], int]:
+    from physics.ncphysics import NonCausalLM
+    lm = NonCausalLM(context_capacity=capacity)
+    context = synthetic_text(size)
+    window = size if capacity is None else min(size, capacity)
+    # Fresh session per call: the context is tokenized cold every time
+    return (lambda: lm.process(QUERY, context, lm.new_session())), window * (window + len(QUERY.split()))
+
+
+def _ncphysics_process_capped(size: int) -> Tuple[Callable[[], object], int]:
+    return _ncphysics_process(size, CAPPED_CONTEXT)
+
+
+TARGETS: Dict[str, Callable[[int], Tuple[Callable[[], object], int]]] = {
+    "engine.infer": _engine_infer,
+    "engine.grok": _engine_grok,
+    "nclm.process": _ncphysics_process,
+    "nclm.process.capped": _ncphysics_process_capped,
+}
+
+
+# =============================================================================
+# MEASUREMENT
+# =============================================================================
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_case(target: str, size: int, repeats: int = DEFAULT_REPEATS, budget: float = DEFAULT_BUDGET) -> Dict:
+    """Measure one (target, size) case in the current process."""
+    call, pairs = TARGETS[target](size)
+
+    start = time.perf_counter()
+    call()                                          # warm-up, sizes the run
+    first = time.perf_counter() - start
+    repeats = max(1, min(repeats, int(budget / max(first, 1e-9))))
+
+    latencies = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - start)
+
+    ms = np.array(latencies) * 1000
+    p50 = float(np.percentile(ms, 50))
+    return {
+        "target": target,
+        "size": size,
+        "repeats": repeats,
+        "p50_ms": p50,
+        "p95_ms": float(np.percentile(ms, 95)),
+        "p99_ms": float(np.percentile(ms, 99)),
+        "mean_ms": float(ms.mean()),
+        "min_ms": float(ms.min()),
+        "pairs": pairs,
+        "pairs_per_sec": pairs / (p50 / 1000) if p50 > 0 else 0.0,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def _isolated(target: str, size: int, repeats: int, budget: float) -> Dict:
+    """run_case in a fresh interpreter (per-case peak RSS)."""
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        return pool.submit(run_case, target, size, repeats, budget).result()
+
+
+def scaling_exponent(a: Dict, b: Dict) -> float:
+    """Log-log slope of p50 latency between two measured sizes."""
+    return math.log(b["p50_ms"] / a["p50_ms"]) / math.log(b["size"] / a["size"])
+
+
+def run(
+    targets: List[str],
+    sizes: List[int],
+    repeats: int = DEFAULT_REPEATS,
+    budget: float = DEFAULT_BUDGET,
+    isolate: bool = True,
+    log: Callable[[str], None] = print,
+) -> Dict:
+    """Benchmark every target over increasing sizes."""
+    results = []
+    for target in targets:
+        measured: List[Dict] = []
+        for size in sorted(sizes):
+            if measured:
+                last = measured[-1]
+                exponent = scaling_exponent(measured[-2], last) if len(measured) > 1 else 2.0
+                projected = last["p50_ms"] / 1000 * (size / last["size"]) ** max(exponent, 1.0)
+                if projected > budget:
+                    results.append({"target": target, "size": size, "skipped": True, "projected_s": projected})
+                    log(f"{target:19s} {size:>8,} tokens  skipped (projected {projected:,.1f}s per call)")
+                    continue
+
+            case = _isolated(target, size, repeats, budget) if isolate else run_case(target, size, repeats, budget)
+            if measured:
+                case["exponent"] = scaling_exponent(measured[-1], case)
+            measured.append(case)
+            results.append(case)
+            log(format_case(case))
+
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpus": multiprocessing.cpu_count(),
+            "repeats": repeats,
+            "budget_s": budget,
+            "isolated": isolate,
+        },
+        "results": results,
+    }
+
+
+def format_case(case: Dict) -> str:
+    exponent = f"  n^{case['exponent']:.2f}" if "exponent" in case else ""
+    return (
+        f"{case['target']:19s} {case['size']:>8,} tokens  "
+        f"p50={case['p50_ms']:10.3f}ms p95={case['p95_ms']:10.3f}ms p99={case['p99_ms']:10.3f}ms  "
+        f"{case['pairs_per_sec']:14,.0f} pairs/s  rss={case['peak_rss_mb']:7.1f}MiB{exponent}"
+    )
+
+
+# =============================================================================
+# COMPARISON
+# =============================================================================
+
+def check(report: Dict, ceiling: float = RSS_CEILING_MB, ratio: float = MAX_RSS_RATIO) -> List[str]:
+    """
+    Absolute limits of one result file. Returns the violations: cases
+    above the RSS ceiling, or above `ratio` times the peak RSS of their
+    RSS_REFERENCES target at the same size.
+    """
+    measured = {(r["target"], r["size"]): r for r in report["results"] if not r.get("skipped")}
+    violations = []
+    for (target, size), case in measured.items():
+        label = f"{target} @ {size:,}"
+        if case["peak_rss_mb"] > ceiling:
+            violations.append(f"{label}: peak RSS {case['peak_rss_mb']:.1f}MiB above {ceiling:.0f}MiB ceiling")
+        ref = measured.get((RSS_REFERENCES.get(target), size))
+        if ref is not None and case["peak_rss_mb"] > ratio * ref["peak_rss_mb"]:
+            violations.append(f"{label}: peak RSS {case['peak_rss_mb']:.1f}MiB above {ratio:g}x "
+                              f"{ref['target']} ({ref['peak_rss_mb']:.1f}MiB)")
+    return violations
+
+
+def compare(baseline: Dict, current: Dict, tolerance: float = DEFAULT_TOLERANCE,
+            log: Callable[[str], None] = print) -> List[str]:
+    """
+    Compare two result files. Returns the regressions: cases whose p50
+    latency or peak RSS grew by more than `tolerance`, that ran in the
+    baseline but are skipped now, or that break the check() limits
+    (whatever the baseline says).
+    """
+    for key in ("machine", "cpus", "python", "numpy"):
+        if baseline["meta"].get(key) != current["meta"].get(key):
+            log(f"warning: {key} differs (baseline {baseline['meta'].get(key)}, "
+                f"current {current['meta'].get(key)})")
+
+    base = {(r["target"], r["size"]): r for r in baseline["results"]}
+    regressions = []
+    for case in current["results"]:
+        key = (case["target"], case["size"])
+        ref = base.get(key)
+        if ref is None or ref.get("skipped"):
+            continue
+        label = f"{case['target']} @ {case['size']:,}"
+        if case.get("skipped"):
+            regressions.append(f"{label}: skipped (projected {case['projected_s']:.1f}s), baseline ran")
+            continue
+
+        latency = case["p50_ms"] / ref["p50_ms"]
+        memory = case["peak_rss_mb"] / ref["peak_rss_mb"]
+        flag = ""
+        if latency > 1 + tolerance:
+            regressions.append(f"{label}: p50 {ref['p50_ms']:.3f}ms -> {case['p50_ms']:.3f}ms ({latency:.2f}x)")
+            flag = "  REGRESSION"
+        if memory > 1 + tolerance:
+            regressions.append(f"{label}: peak RSS {ref['peak_rss_mb']:.1f} -> {case['peak_rss_mb']:.1f}MiB")
+            flag = "  REGRESSION"
+        log(f"{label:28s} p50 {latency:5.2f}x  rss {memory:5.2f}x{flag}")
+    return regressions + check(current)
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="NC-LM scaling benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run benchmarks and write JSON results")
+    run_parser.add_argument("-o", "--output", help="Result file (default: print only)")
+    run_parser.add_argument("--targets", nargs="+", choices=sorted(TARGETS), default=list(TARGETS))
+    run_parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES)
+    run_parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    run_parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET,
+                            help="Seconds of measurement per case; larger projected cases are skipped")
+    run_parser.add_argument("--no-isolate", action="store_true",
+                            help="Run every case in this process (peak RSS becomes cumulative)")
+
+    compare_parser = commands.add_parser("compare", help="Compare results with a baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        report = run(args.targets, args.sizes, args.repeats, args.budget, not args.no_isolate)
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(report, f, indent=2)
+            print(f"Wrote {args.output}")
+        violations = check(report)
+        for line in violations:
+            print(f"LIMIT {line}")
+        return 1 if violations else 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    regressions = compare(baseline, current, args.tolerance)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    print(f"{len(regressions)} regression(s)")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
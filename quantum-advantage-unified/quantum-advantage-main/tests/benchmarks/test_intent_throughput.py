@@ -0,0 +1,123 @@
+"""
+Benchmark NCLM Intent Classification
+====================================
+Throughput of the compiled IntentExtractor patterns and the keyword
+automaton behind NCLMIntentDeducer on a 100k-query corpus, compared with
+the original per-pattern / per-keyword loops
+"""
+
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "osiris"))
+
+# physics.constants is missing from some checkouts; any other import error fails
+pytest.importorskip("physics.constants", reason="physics.constants not available")
+
+from physics.ncphysics import IntentExtractor
+from nclm.engine import NCLMIntentDeducer
+
+CORPUS_SIZE = 100_000
+
+VOCABULARY = (
+    "read show cat view find search grep where is list ls run execute edit update "
+    "change replace write create save to with the a file files module tests "
+    "README.md setup.py src config quantum circuit qubit coherence network ping "
+    "explain analyze optimize evolve status please me what current all python "
+    "wormhole entanglement phonon anyon dark revival consciousness"
+).split()
+
+
+def make_corpus(size=CORPUS_SIZE, seed=51843):
+    rng = random.Random(seed)
+    return [" ".join(rng.choices(VOCABULARY, k=rng.randint(2, 12))) for _ in range(size)]
+
+
+def reference_extract(query):
+    """Original IntentExtractor.extract matching loop."""
+    query_lower = query.lower().strip()
+    for action, patterns in IntentExtractor.PATTERNS.items():
+        for pattern in patterns:
+            match = re.search(pattern, query_lower)
+            if match:
+                return action, match.groups()
+    return "query", ()
+
+
+def reference_keywords(query):
+    """Original NCLMIntentDeducer substring checks."""
+    query_lower = query.lower()
+    found = set()
+    for keyword, (_, aliases) in NCLMIntentDeducer.INTENT_KEYWORDS.items():
+        if keyword in query_lower:
+            found.add(keyword)
+        for alias in aliases:
+            if alias in query_lower:
+                found.add(alias)
+    for _, (_, keywords) in NCLMIntentDeducer.PHYSICS_MODELS.items():
+        found.update(kw for kw in keywords if kw in query_lower)
+    return found
+
+
+def throughput(fn, corpus):
+    start = time.perf_counter()
+    for query in corpus:
+        fn(query)
+    elapsed = time.perf_counter() - start
+    return len(corpus) / elapsed, elapsed
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    return make_corpus()
+
+
+class TestIntentThroughput:
+    """Benchmark suite for intent classification"""
+
+    def test_extract_throughput(self, corpus):
+        """One priority-ordered match classifies like per-pattern re.search, faster"""
+        extractor = IntentExtractor()
+
+        def compiled(query):
+            intent = extractor.extract(query)
+            return intent.action, intent.params.get("groups", ())
+
+        for query in corpus[:5000]:
+            assert compiled(query) == reference_extract(query)
+
+        ref_qps, ref_time = throughput(reference_extract, corpus)
+        new_qps, new_time = throughput(compiled, corpus)
+        print(f"\nIntentExtractor: {new_qps:,.0f} q/s (reference {ref_qps:,.0f} q/s), "
+              f"Speedup={ref_time / new_time:.1f}x")
+
+        assert new_time < ref_time
+
+    def test_keyword_automaton_throughput(self, corpus):
+        """One automaton pass beats per-keyword substring checks"""
+        automaton = NCLMIntentDeducer._AUTOMATON
+
+        for query in corpus[:5000]:
+            assert automaton.find(query.lower()) == reference_keywords(query)
+
+        ref_qps, ref_time = throughput(reference_keywords, corpus)
+        new_qps, new_time = throughput(lambda q: automaton.find(q.lower()), corpus)
+        print(f"\nKeywordAutomaton: {new_qps:,.0f} q/s (reference {ref_qps:,.0f} q/s), "
+              f"Speedup={ref_time / new_time:.1f}x")
+
+        assert new_time < ref_time
+
+    def test_deduce_throughput(self, corpus):
+        """Full NCLMIntentDeducer.deduce throughput"""
+        deducer = NCLMIntentDeducer()
+        qps, elapsed = throughput(deducer.deduce, corpus)
+        print(f"\nNCLMIntentDeducer.deduce: {qps:,.0f} q/s ({elapsed:.2f}s for {len(corpus):,})")
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '-s'])
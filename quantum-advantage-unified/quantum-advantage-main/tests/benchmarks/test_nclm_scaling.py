@@ -0,0 +1,97 @@
+"""
+Benchmark NC-LM Scaling
+=======================
+Small-size run of the scaling harness (nclm_harness.py): latency
+percentiles and pairs/sec for NCLMEngine.infer, NCLMEngine.grok and
+NonCausalLM.process, and a guard against quadratic blowups in the
+capped NonCausalLM path
+"""
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import nclm_harness
+from nclm_harness import RSS_CEILING_MB, check, compare, run, synthetic_text
+
+# physics.constants is missing from some checkouts; any other import error fails
+HAS_NCLM = importlib.util.find_spec("physics.constants") is not None
+if HAS_NCLM:
+    import nclm.engine  # noqa: F401
+    import physics.ncphysics  # noqa: F401
+
+BASELINE = Path(__file__).resolve().parent / "baselines" / "nclm.json"
+
+
+@pytest.fixture(scope="module")
+def report():
+    if not HAS_NCLM:
+        pytest.skip("physics.constants not available")
+    print()
+    engine = run(["engine.infer", "engine.grok"], [10, 100, 1000], repeats=5, budget=2.0, isolate=False)
+    process = run(["nclm.process"], [100, 1000], repeats=5, budget=2.0, isolate=False)
+    capped = run(["nclm.process.capped"], [100, 1000, 10000], repeats=5, budget=2.0, isolate=False)
+    engine["results"] += process["results"] + capped["results"]
+    return engine
+
+
+class TestNCLMScaling:
+    """Benchmark suite for the scaling harness"""
+
+    def test_synthetic_context_sizes(self):
+        """Synthetic contexts have exactly the requested token count"""
+        for size in (10, 1000):
+            assert len(synthetic_text(size).split()) == size
+        assert synthetic_text(100) == synthetic_text(100)
+
+    def test_report_fields(self, report):
+        """Every measured case has percentiles, pairs/sec and peak RSS"""
+        for case in report["results"]:
+            if case.get("skipped"):
+                continue
+            assert case["p50_ms"] <= case["p95_ms"] <= case["p99_ms"]
+            assert case["pairs_per_sec"] > 0
+            assert case["peak_rss_mb"] > 0
+        json.dumps(report)
+
+    def test_process_window_is_not_quadratic(self, report):
+        """NonCausalLM.process grows sub-quadratically past an explicit context_capacity"""
+        cases = [c for c in report["results"] if c["target"] == "nclm.process.capped" and not c.get("skipped")]
+        assert [c["size"] for c in cases] == [100, 1000, 10000]
+        assert cases[-1]["exponent"] < 1.5
+
+    def test_compare_flags_regressions(self, report):
+        """compare() passes identical runs and flags slower or skipped cases"""
+        assert compare(report, report, log=lambda _: None) == []
+
+        slower = json.loads(json.dumps(report))
+        slower["results"][0]["p50_ms"] *= 2
+        slower["results"][1] = {**slower["results"][1], "skipped": True, "projected_s": 99.0}
+        assert len(compare(report, slower, log=lambda _: None)) == 2
+
+    def test_check_flags_memory_outliers(self, report):
+        """check() passes the run and flags RSS above the ceiling or its reference"""
+        assert check(report) == []
+
+        bloated = json.loads(json.dumps(report))
+        grok = next(c for c in bloated["results"] if c["target"] == "engine.grok" and c["size"] == 1000)
+        grok["peak_rss_mb"] = RSS_CEILING_MB * 4
+        assert len(check(bloated)) == 2
+        # An outlier already in the baseline is still reported
+        assert len(compare(bloated, bloated, log=lambda _: None)) == 2
+
+    def test_baseline_is_loadable(self):
+        """The stored baseline covers every target"""
+        baseline = json.loads(BASELINE.read_text())
+        assert {c["target"] for c in baseline["results"]} == set(nclm_harness.TARGETS)
+        assert {"python", "numpy", "cpus"} <= set(baseline["meta"])
+        assert check(baseline) == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '-s'])
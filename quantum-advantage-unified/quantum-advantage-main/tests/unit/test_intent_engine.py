@@ -0,0 +1,710 @@
+"""
+Test Intent-Deduction Engine (intent_engine/)
+=============================================
+Layer 1 streaming corpus indexer over job JSON and .dna organism files,
+its genome index as used by Layer 2, and IntentDeductionEngine
+"""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from intent_engine import IntentDeductionEngine, layers
+from intent_engine.cache import LayerCache, content_key
+from intent_engine.pipeline import LayerGraph
+from intent_engine.snapshots import SnapshotWriter, apply, decode_state, diff, encode_state, load_snapshot
+from intent_engine.corpus import MAX_VALUE_CHARS, genome_terms, index_file, iter_corpus_files
+from intent_engine.layers import (
+    CollectiveIntentDeducer,
+    CorpusIndexer,
+    IndividualIntentDeducer,
+    PromptEnhancer,
+    ResourceAnalyzer,
+)
+
+ORGANISM = """
+ORGANISM CLIN_TRIAL_SENTINEL_AGM193 {
+    META {
+        version: "51.843-AGM193",
+        pharma_partners: ["AGM193","Merck"],
+        dfars_compliant: true
+    }
+    DNA {
+        phi_monitoring: 0.7734,
+        lambda_decay: 2.176435e-08,
+        purpose: "CLINICAL_TRIAL_READINESS"
+    }
+    GENOME {
+        GENE PharmaIntegration {
+            expression: 0.97
+            trigger: agm193_protocol_received
+            action: validate_phi_coherence() -> deploy_sentinel()
+        }
+        GENE TrialSafety {
+            trigger: phi_below_threshold
+            action: phase_conjugate_stabilize()
+        }
+    }
+}
+"""
+
+JSON_ORGANISM = {
+    "protocol": "ANALOG_COHERENT_v2",
+    "bypass_id": "GAMMA_RESONANCE_042",
+    "dna": "ACTG" * 2000,
+    "stability": 0.042,
+}
+
+PILOT = {
+    "agent_id": "PILOT_ALPHA",
+    "mode": "BIO_PHARMA_MAPPING",
+    "tasks": ["Map_Silo_Interoperability", "Analog_Coherent_Longevity_Scan"],
+    "resonance": 0.7734,
+}
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """A small corpus shaped like swarms/ and clinical_trials/."""
+    (tmp_path / "clinical_trials" / "agm193").mkdir(parents=True)
+    (tmp_path / "clinical_trials" / "agm193" / "sentinel_swarm.dna").write_text(ORGANISM)
+    (tmp_path / "swarms" / "pilots").mkdir(parents=True)
+    (tmp_path / "swarms" / "longevity_protocol.dna").write_text(json.dumps(JSON_ORGANISM, indent=2))
+    (tmp_path / "swarms" / "pilots" / "pilot_alpha.json").write_text(json.dumps(PILOT, indent=2))
+    for i in range(3):
+        job = {"job_id": f"JOB_{i}", "fidelity": 0.9 + i / 100, "mode": "VQE_SCAN"}
+        (tmp_path / "swarms" / f"job_{i}.json").write_text(json.dumps(job))
+    # Never indexed
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "package.json").write_text('{"license": "MIT"}')
+    (tmp_path / "notes.txt").write_text("ORGANISM IGNORED {}")
+    return tmp_path
+
+
+class TestCorpusIndexer:
+    """Test suite for Layer 1"""
+
+    def test_walk_skips_unindexed(self, corpus):
+        """Only .json/.dna files outside skipped and excluded directories are walked"""
+        names = [e.name for e in iter_corpus_files(str(corpus), exclude=[str(corpus / "swarms" / "pilots")])]
+        assert sorted(names) == ["job_0.json", "job_1.json", "job_2.json",
+                                 "longevity_protocol.dna", "sentinel_swarm.dna"]
+
+    def test_semantic_genome(self, corpus):
+        """Topics, entities and operations come from the files"""
+        indexer = CorpusIndexer(str(corpus))
+        stats = indexer.index()
+        genome = indexer.semantic_genome
+
+        assert stats["total_files"] == 6 and stats["total_jobs"] == 4
+        assert genome["topics"]["trigger"] == 2 and genome["topics"]["job_id"] == 3
+        assert genome["entities"]["PILOT_ALPHA"] == 1 and genome["entities"]["TrialSafety"] == 1
+        assert genome["entities"]["JOB_2"] == 1 and "MIT" not in genome["entities"]
+        assert genome["operations"]["deploy_sentinel"] == 1
+        assert genome["operations"]["VQE_SCAN"] == 3
+        assert genome["operations"]["Map_Silo_Interoperability"] == 1
+        assert stats["validation_results"]["fidelity"] == pytest.approx(
+            {"count": 3, "mean": 0.91, "min": 0.9, "max": 0.92})
+
+    def test_organisms(self, corpus):
+        """ORGANISM blocks and JSON .dna files are both organisms"""
+        organisms = CorpusIndexer(str(corpus)).index_dna_organisms()
+        assert [(o["name"], o["type"], o["genes"]) for o in organisms] == [
+            ("CLIN_TRIAL_SENTINEL_AGM193", "CLINICAL_TRIAL_READINESS", 2),
+            ("longevity_protocol", "ANALOG_COHERENT_v2", 0),
+        ]
+        assert organisms[0]["path"].endswith("sentinel_swarm.dna")
+
+    @pytest.mark.parametrize("name", ["clinical_trials/agm193/sentinel_swarm.dna",
+                                      "swarms/longevity_protocol.dna"])
+    def test_chunked_read_matches_whole(self, corpus, name):
+        """Features do not depend on where chunk boundaries fall"""
+        whole = index_file(str(corpus / name))
+        for chunk_size in (1, 2, 3, 7, 64, MAX_VALUE_CHARS + 5):
+            assert index_file(str(corpus / name), chunk_size) == whole
+
+    def test_missing_corpus(self, tmp_path):
+        """A missing corpus indexes as empty"""
+        stats = CorpusIndexer(str(tmp_path / "missing")).index()
+        assert stats["total_files"] == 0 and stats["validation_results"] == {}
+
+
+def snapshot(indexer):
+    """Everything an index exposes, minus per-refresh bookkeeping."""
+    stats = {k: indexer.corpus_stats[k] for k in ("total_jobs", "total_files", "total_lines")}
+    # Running sums may differ from fresh ones in the last bits
+    stats["validation_results"] = {
+        key: {name: round(value, 12) for name, value in values.items()}
+        for key, values in indexer.corpus_stats["validation_results"].items()
+    }
+    genome = {name: dict(counter) for name, counter in indexer.semantic_genome.items()}
+    return stats, genome, indexer.organisms
+
+
+def full_snapshot(corpus):
+    """snapshot() of a from-scratch index."""
+    indexer = CorpusIndexer(str(corpus))
+    indexer.index(full=True)
+    return snapshot(indexer)
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    """Paths read by CorpusIndexer."""
+    paths = []
+
+    def counting(path, *args, **kwargs):
+        paths.append(os.path.basename(path))
+        return index_file(path, *args, **kwargs)
+
+    monkeypatch.setattr(layers, "index_file", counting)
+    return paths
+
+
+class TestIncrementalIndex:
+    """Test suite for manifest-based re-indexing"""
+
+    def test_unchanged_corpus_reads_nothing(self, corpus, reads, tmp_path_factory):
+        """A persisted manifest lets a new indexer skip every file"""
+        manifest = str(tmp_path_factory.mktemp("state") / "manifest.json")
+        first = CorpusIndexer(str(corpus), manifest_path=manifest)
+        assert first.index()["new_files"] == 6
+
+        reads.clear()
+        second = CorpusIndexer(str(corpus), manifest_path=manifest)
+        stats = second.index()
+        assert reads == []
+        assert (stats["new_files"], stats["changed_files"], stats["reused_files"]) == (0, 0, 6)
+        assert snapshot(second) == snapshot(first)
+
+    def test_changes_match_full_index(self, corpus, reads):
+        """Changed, new and deleted files give the same index as starting over"""
+        indexer = CorpusIndexer(str(corpus))
+        indexer.index()
+
+        pilot = corpus / "swarms" / "pilots" / "pilot_alpha.json"
+        pilot.write_text(json.dumps({**PILOT, "agent_id": "PILOT_BETA", "tasks": ["Scan"]}))
+        (corpus / "swarms" / "job_2.json").unlink()                  # held the max fidelity
+        (corpus / "swarms" / "job_3.json").write_text('{"job_id": "JOB_3", "fidelity": 0.5}')
+
+        reads.clear()
+        stats = indexer.index()
+        assert sorted(reads) == ["job_3.json", "pilot_alpha.json"]
+        assert (stats["new_files"], stats["changed_files"], stats["deleted_files"]) == (1, 1, 1)
+        assert "PILOT_ALPHA" not in indexer.semantic_genome["entities"]
+        assert stats["validation_results"]["fidelity"]["max"] == 0.91
+        assert snapshot(indexer) == full_snapshot(corpus)
+
+    def test_touched_file_keeps_features(self, corpus, reads):
+        """A new mtime with the same content is re-hashed but not re-counted"""
+        indexer = CorpusIndexer(str(corpus))
+        indexer.index()
+        before = snapshot(indexer)
+
+        path = corpus / "swarms" / "job_0.json"
+        os.utime(path, ns=(0, path.stat().st_mtime_ns + 10**9))
+        reads.clear()
+        stats = indexer.index()
+        assert reads == ["job_0.json"]
+        assert stats["changed_files"] == 0 and stats["reused_files"] == 6
+        assert snapshot(indexer) == before
+
+
+class TestParallelIndex:
+    """Test suite for process-pool indexing"""
+
+    @pytest.fixture
+    def parallel(self, monkeypatch):
+        """Let the smallest corpus use the pool."""
+        monkeypatch.setattr(layers, "PARALLEL_MIN_FILES", 1)
+
+    def test_matches_serial_index(self, corpus, parallel):
+        """Merged per-batch counters equal the in-process index"""
+        indexer = CorpusIndexer(str(corpus), workers=2)
+        stats = indexer.index()
+        assert stats["workers"] == 2 and stats["files_per_sec"] > 0
+        assert snapshot(indexer) == full_snapshot(corpus)
+
+    def test_incremental_refresh(self, corpus, parallel):
+        """Changed and touched files are handled as in-process"""
+        indexer = CorpusIndexer(str(corpus), workers=2)
+        indexer.index()
+
+        (corpus / "swarms" / "job_0.json").write_text('{"job_id": "JOB_0", "fidelity": 0.1}')
+        path = corpus / "swarms" / "job_1.json"
+        os.utime(path, ns=(0, path.stat().st_mtime_ns + 10**9))
+
+        stats = indexer.index()
+        assert (stats["new_files"], stats["changed_files"], stats["reused_files"]) == (0, 1, 5)
+        assert snapshot(indexer) == full_snapshot(corpus)
+
+
+class TestGenomeIndex:
+    """Test suite for the inverted tf-idf genome index and Layer 2 domains"""
+
+    def test_posting_lists(self, corpus):
+        """Terms of topics, entities and operations map to their files"""
+        indexer = CorpusIndexer(str(corpus))
+        indexer.index()
+        genome = indexer.genome_index
+
+        assert genome_terms("validate_phi_coherence()") == ("validate", "phi", "coherence")
+        assert genome.documents == 6
+        assert [doc for doc, _ in genome.posting_list("vqe")] == [
+            f"swarms/job_{i}.json" for i in range(3)]
+        assert genome.posting_list("sentinel")[0][0] == "clinical_trials/agm193/sentinel_swarm.dna"
+        assert genome.idf("sentinel") > genome.idf("vqe") > 0 == genome.idf("unknown")
+        assert genome.search("phi coherence")[0][0] == "clinical_trials/agm193/sentinel_swarm.dna"
+
+    def test_incremental_matches_full(self, corpus):
+        """Changed and deleted files leave the same postings as a full index"""
+        indexer = CorpusIndexer(str(corpus))
+        indexer.index()
+        (corpus / "swarms" / "job_0.json").write_text('{"job_id": "JOB_0", "mode": "QAOA"}')
+        (corpus / "swarms" / "pilots" / "pilot_alpha.json").unlink()
+        indexer.index()
+
+        full = CorpusIndexer(str(corpus))
+        full.index()
+        assert indexer.genome_index.postings == full.genome_index.postings
+        assert indexer.genome_index.term_counts == full.genome_index.term_counts
+        assert indexer.genome_index.documents == full.genome_index.documents == 5
+        assert "silo" not in indexer.genome_index.postings
+
+    def test_domains_come_from_corpus(self, corpus):
+        """Layer 2 domains are the prompt terms with the most corpus weight"""
+        indexer = CorpusIndexer(str(corpus))
+        indexer.index()
+        deducer = IndividualIntentDeducer()
+        context = {"genome": indexer.genome_index}
+
+        intent = deducer.deduce_intent("validate VQE scan on the trial sentinel", context)
+        assert intent.intent_type == "validate"
+        assert set(intent.domains) <= {"validate", "vqe", "scan", "trial", "sentinel"}
+        assert intent.domains[:2] == ["scan", "vqe"] and len(intent.domains) == 3
+        assert deducer.deduce_intent("write poetry", context).domains == []
+        assert deducer.deduce_intent("validate VQE scan", {}).domains == []
+
+
+class TestIntentBatch:
+    """Test suite for the columnar Layer 2-6 path"""
+
+    PROMPTS = [
+        "create quantum consciousness framework",
+        "validate VQE scan on the trial sentinel",
+        "integrate sentinel with the harness",
+        "Build a BUILD",
+        "",
+        "validate VQE scan on the trial sentinel",
+    ]
+
+    def test_batch_matches_per_prompt(self, corpus):
+        """Every column equals the per-prompt deduction"""
+        indexer = CorpusIndexer(str(corpus))
+        indexer.index()
+        deducer = IndividualIntentDeducer()
+        context = {"genome": indexer.genome_index}
+
+        batch = deducer.deduce_batch(self.PROMPTS, context)
+        vectors = [deducer.deduce_intent(p, context) for p in self.PROMPTS]
+        strip = lambda record: {k: v for k, v in record.items() if k != "timestamp"}
+        assert [strip(r) for r in batch.to_records()] == [strip(asdict(v)) for v in vectors]
+        assert [strip(asdict(v)) for v in batch.vectors()] == [strip(asdict(v)) for v in vectors]
+        assert batch.intent_types.tolist() == ["create", "validate", "integrate", "create", "analyze", "validate"]
+
+        means = batch.means()
+        assert means == pytest.approx((
+            sum(v.coherence_lambda for v in vectors) / len(vectors),
+            sum(v.consciousness_phi for v in vectors) / len(vectors),
+            sum(v.decoherence_gamma for v in vectors) / len(vectors),
+        ))
+
+    def test_batch_layers(self):
+        """Layers 3, 5 and 6 give the same output for a batch as for its vectors"""
+        batch = IndividualIntentDeducer().deduce_batch(self.PROMPTS, {})
+        vectors = batch.vectors()
+
+        assert CollectiveIntentDeducer(batch).generate_trajectory_map() == pytest.approx(
+            CollectiveIntentDeducer(vectors).generate_trajectory_map())
+        analyzer = ResourceAnalyzer()
+        assert analyzer.analyze_batch(batch) == analyzer.analyze_deployment_readiness(vectors)
+        enhancer = PromptEnhancer()
+        assert enhancer.enhance_batch(batch) == [enhancer.enhance(v.prompt, v) for v in vectors]
+
+    def test_empty_batch(self):
+        """No prompts give empty columns"""
+        batch = IndividualIntentDeducer().deduce_batch([], {})
+        assert len(batch) == 0 and batch.to_records() == []
+        assert CollectiveIntentDeducer(batch).generate_trajectory_map()["dominant_intent"] == "none"
+
+
+class TestLayerCache:
+    """Test suite for memoized layer outputs"""
+
+    def test_lookup_and_eviction(self):
+        """Keys are content hashes; the least recently used entry goes first"""
+        cache = LayerCache(max_entries=2)
+        assert content_key("layer_2", ["a"], "f") == content_key("layer_2", ["a"], "f")
+        assert content_key("layer_2", ["a"], "f") != content_key("layer_5", ["a"], "f")
+
+        calls = []
+        for key in ("a", "b", "a", "c", "b"):
+            output, lookup = cache.get_or_compute("layer", key, lambda: calls.append(key) or key.upper())
+            assert output == key.upper()
+        assert calls == ["a", "b", "c", "b"] and lookup["hit"] is False
+        assert cache.stats["layer"]["hits"] == 1 and cache.stats["layer"]["misses"] == 4
+
+    def test_cycles_reuse_pure_layers(self, corpus):
+        """Later cycles hit Layers 2, 4, 5 and 6 until their inputs change"""
+        engine = IntentDeductionEngine(corpus_path=str(corpus), recursion_depth=3)
+        states = [engine.run_recursive_cycle(["analyze sentinel"], reindex=(i == 0)) for i in range(3)]
+
+        layers_ = ("layer_2", "layer_4", "layer_5", "layer_6")
+        assert [all(s["layer_cache"][n]["hit"] for n in layers_) for s in states] == [False, True, True]
+        assert states[-1]["layer_cache"]["layer_2"]["total_hits"] == 2
+        assert states[-1]["intent_vectors"] == states[0]["intent_vectors"]
+        json.dumps(states[-1]["layer_cache"])
+
+        state = engine.run_recursive_cycle(["validate scan"], reindex=False)
+        assert {n: state["layer_cache"][n]["hit"] for n in layers_} == {
+            "layer_2": False, "layer_4": True, "layer_5": False, "layer_6": False}
+
+        (corpus / "swarms" / "job_0.json").write_text('{"job_id": "JOB_0", "mode": "QAOA"}')
+        state = engine.run_recursive_cycle(["validate scan"])
+        assert not any(state["layer_cache"][n]["hit"] for n in layers_)
+
+
+def roundtrip(state):
+    """A state as it reads back from JSON."""
+    return json.loads(json.dumps(state, default=str))
+
+
+class TestSnapshots:
+    """Test suite for compact delta-encoded state snapshots"""
+
+    def test_columnar_roundtrip(self):
+        """Columns, repeated values and keyed records decode to the same state"""
+        state = {
+            "iteration": 2,
+            "rows": [{"a": 1, "b": [1], "c": {"x": 0.5}}, {"a": True, "b": [], "c": {"x": 0.5}}],
+            "ragged": [{"a": 1}, {"b": 2}],
+            "keyed": {"intent_0": {"status": "READY"}, "intent_1": {"status": "READY"}},
+            "plain": {"lambda": 0.9},
+            "empty": [],
+        }
+        encoded = encode_state(state)
+        assert encoded["rows"]["__columns__"]["c"] == {"__repeat__": {"x": 0.5}}
+        assert decode_state(encoded) == state
+        assert [type(row["a"]) for row in decode_state(encoded)["rows"]] == [int, bool]
+
+    def test_repeated_rows_are_independent(self):
+        """Changing one decoded row of a repeated column leaves the others and the encoding alone"""
+        state = {"rows": [{"domains": ["quantum"], "meta": {"x": 0.5}} for _ in range(3)]}
+        encoded = encode_state(state)
+        decoded = decode_state(encoded)
+        decoded["rows"][0]["domains"].append("pharma")
+        decoded["rows"][1]["meta"]["x"] = 0.9
+
+        assert [row["domains"] for row in decoded["rows"]] == [["quantum", "pharma"], ["quantum"], ["quantum"]]
+        assert [row["meta"]["x"] for row in decoded["rows"]] == [0.5, 0.9, 0.5]
+        assert decode_state(encoded) == state
+
+        delta = diff(encoded, encode_state(decoded))
+        assert set(delta["changed"]["rows"]["__columns__"]) == {"domains", "meta"}
+        assert decode_state(apply(encoded, delta)) == decoded
+
+    def test_run_writes_deltas(self, corpus):
+        """Every cycle is saved; later snapshots only hold what changed"""
+        engine = IntentDeductionEngine(corpus_path=str(corpus), recursion_depth=3, history_limit=2, tolerance=0.0)
+        engine.run(["analyze sentinel"])
+        states = list(engine.state_history)
+        assert len(states) == 2 and [s["iteration"] for s in states] == [2, 3]
+
+        output = corpus / "intent_engine_output"
+        snapshots = sorted(output.glob("intent_deduction_state_2*"))
+        assert len(snapshots) == 3
+        assert snapshots[1].stat().st_size < snapshots[0].stat().st_size / 2
+        for path, state in zip(snapshots[1:], states):
+            assert load_snapshot(str(path)) == roundtrip(state)
+
+        latest = output / engine.snapshots.latest_path.name
+        assert latest.is_symlink() and os.readlink(latest) == snapshots[-1].name
+        assert load_snapshot(str(latest)) == roundtrip(states[-1])
+
+    def test_keyframes_bound_delta_chains(self, tmp_path):
+        """A keyframe is written every keyframe_interval snapshots"""
+        writer = SnapshotWriter(str(tmp_path), keyframe_interval=2, binary=False)
+        paths = [writer.write({"iteration": i, "rows": [{"i": i}, {"i": 0}]}, f"{i}") for i in range(3)]
+        bases = [json.loads(path.read_text())["base"] for path in paths]
+        assert bases == [None, paths[0].name, None]
+        assert load_snapshot(str(paths[1])) == {"iteration": 1, "rows": [{"i": 1}, {"i": 0}]}
+
+    def test_msgpack(self, tmp_path):
+        """Snapshots are msgpack when it is installed"""
+        pytest.importorskip("msgpack")
+        writer = SnapshotWriter(str(tmp_path), binary=True)
+        writer.write({"iteration": 1}, "1")
+        assert writer.latest_path.suffix == ".msgpack"
+        assert load_snapshot(str(writer.latest_path)) == {"iteration": 1}
+
+
+class TestLayerGraph:
+    """Test suite for dependency-ordered layer execution"""
+
+    def graph(self, log, barrier=None):
+        graph = LayerGraph()
+        graph.add("a", lambda _: log.append("a") or threading.get_ident())
+        graph.add("b", lambda up: barrier and barrier.wait() or log.append("b") or up["a"] + 1, after=["a"])
+        graph.add("c", lambda up: barrier and barrier.wait() or log.append("c") or 2, after=["a"])
+        graph.add("d", lambda up: up["b"] + up["c"], after=["b", "c"])
+        return graph
+
+    def test_sequential(self):
+        """Without an executor layers run in insertion order"""
+        log = []
+        outputs, seconds = self.graph(log).run()
+        assert log == ["a", "b", "c"] and outputs["d"] == threading.get_ident() + 3
+        assert list(seconds) == ["a", "b", "c", "d"]
+
+    def test_independent_layers_overlap(self):
+        """Layers with finished dependencies run at the same time"""
+        log, done = [], []
+        barrier = threading.Barrier(2, timeout=5)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            outputs, _ = self.graph(log, barrier).run(pool, lambda name, *_: done.append(name))
+        # A lone ready layer runs in the calling thread
+        assert outputs["a"] == threading.get_ident()
+        assert done[0] == "a" and sorted(done[1:3]) == ["b", "c"] and done[3] == "d"
+
+    def test_errors(self):
+        """Unknown dependencies are rejected; a failing layer aborts the run"""
+        graph = LayerGraph()
+        with pytest.raises(ValueError):
+            graph.add("b", lambda _: 1, after=["a"])
+        graph.add("a", lambda _: 1 / 0)
+        with pytest.raises(ZeroDivisionError):
+            graph.run()
+
+    def test_arun(self):
+        """arun() runs every layer on the executor; cancelling stops between layers"""
+        log = []
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            outputs, seconds = asyncio.run(self.graph(log).arun(pool))
+        assert outputs["a"] != threading.get_ident() and outputs["d"] == outputs["a"] + 3
+        assert list(seconds) == ["a", "b", "c", "d"]
+
+        async def cancel_after_a():
+            task = asyncio.current_task()
+            await self.graph(log).arun(on_done=lambda name, *_: task.cancel())
+        log.clear()
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(cancel_after_a())
+        assert log == ["a"]
+
+    def test_cycle_reports_layer_seconds(self, corpus):
+        """Concurrent and one-at-a-time cycles agree; each layer is timed"""
+        states = []
+        for layer_workers in (4, 1):
+            engine = IntentDeductionEngine(corpus_path=str(corpus), layer_workers=layer_workers)
+            states.append(engine.run_recursive_cycle(["validate scan", "create sentinel"]))
+
+        metrics = states[0]["emergent_metrics"]
+        assert list(metrics["layer_seconds"]) == [f"layer_{i}" for i in range(1, 8)]
+        assert metrics["cycle_seconds"] >= max(metrics["layer_seconds"].values()) > 0
+
+        def content(state):
+            intents = [{k: v for k, v in r.items() if k != "timestamp"} for r in state["intent_vectors"]]
+            return intents, state["deployment_readiness"], state["enhanced_prompts"], state["project_plan"]
+        assert content(states[0]) == content(states[1])
+
+
+class TestIntentDeductionEngine:
+    """Test suite for the engine over a real corpus"""
+
+    def test_cycle_indexes_corpus(self, corpus):
+        """Each cycle indexes corpus_path, never its own saved states"""
+        engine = IntentDeductionEngine(corpus_path=str(corpus), recursion_depth=2)
+        engine.run()
+        assert list((corpus / "intent_engine_output").glob("*.json"))
+
+        state = engine.run_recursive_cycle()
+        assert state["corpus_stats"]["total_files"] == 6
+        assert state["organisms_indexed"] == 2
+
+    def test_layer1_runs_once_per_run(self, corpus, reads, monkeypatch):
+        """Later cycles skip Layer 1 on an unchanged corpus; a new engine reuses the manifest"""
+        engine = IntentDeductionEngine(corpus_path=str(corpus), recursion_depth=3, tolerance=0.0)
+        calls = []
+        index = engine.indexer.index
+        monkeypatch.setattr(engine.indexer, "index", lambda: calls.append(1) or index())
+        monkeypatch.setattr(engine, "_save_state", lambda state: None)
+        # Keep Λ below the convergence bound so every cycle runs
+        engine.run(["analyze"])
+
+        assert engine.iteration == 3 and len(calls) == 1
+        assert [s["corpus_stats"]["total_files"] for s in engine.state_history] == [6, 6, 6]
+
+        reads.clear()
+        state = IntentDeductionEngine(corpus_path=str(corpus)).run_recursive_cycle()
+        assert reads == [] and state["corpus_stats"]["reused_files"] == 6
+
+    def test_layer1_picks_up_changes_mid_run(self, corpus, reads, monkeypatch):
+        """A file added between cycles is indexed by the next cycle"""
+        def on_event(event):
+            if event["event"] == "cycle_done" and event["iteration"] == 1:
+                (corpus / "swarms" / "job_late.json").write_text(json.dumps({"job_id": "JOB_LATE"}))
+
+        engine = IntentDeductionEngine(corpus_path=str(corpus), recursion_depth=3,
+                                       tolerance=0.0, on_event=on_event)
+        monkeypatch.setattr(engine, "_save_state", lambda state: None)
+        reads.clear()
+        engine.run(["analyze"])
+
+        assert [s["corpus_stats"]["total_files"] for s in engine.state_history] == [6, 7, 7]
+        assert reads.count("job_late.json") == 1 and len(reads) == 7
+        assert not engine.indexer.changed()
+
+
+
+class TestTermination:
+    """Test suite for early stopping of the recursive loop"""
+
+    def metrics(self, lambda_system, phi_global=0.8, gamma_mean=0.01):
+        return {"emergent_metrics": {"lambda_system": lambda_system, "phi_global": phi_global,
+                                     "gamma_mean": gamma_mean, "cycle_seconds": 0.0}}
+
+    def test_tolerance_and_patience(self, corpus):
+        """Only consecutive cycles within tolerance count towards patience"""
+        engine = IntentDeductionEngine(corpus_path=str(corpus), recursion_depth=10,
+                                       tolerance=1e-3, patience=2, on_event=lambda _: None)
+        engine._start_run()
+        lambdas = [0.5, 0.6, 0.6005, 0.7, 0.7, 0.7]
+        stops = [engine._terminate(self.metrics(value)) for value in lambdas]
+        assert stops == [False] * 5 + [True]
+
+        state = self.metrics(0.7, gamma_mean=0.01 + 5e-4)
+        engine._start_run()
+        assert not engine._terminate(self.metrics(0.7)) and not engine._terminate(state)
+        assert engine._stalled == 1 and engine._terminate(self.metrics(0.7, phi_global=0.9)) is False
+        assert engine._stalled == 0
+
+        engine._start_run()
+        state = self.metrics(0.96)
+        assert engine._terminate(state) and state["termination"]["reason"] == "converged"
+
+    def test_invalid_settings(self, corpus):
+        """Negative tolerance, patience below 1 and non-positive budgets are rejected"""
+        for settings in ({"patience": 0}, {"tolerance": -1e-3}, {"time_budget": 0}, {"time_budget": -1.0}):
+            with pytest.raises(ValueError):
+                IntentDeductionEngine(corpus_path=str(corpus), **settings)
+
+        engine = IntentDeductionEngine(corpus_path=str(corpus), recursion_depth=10, on_event=lambda _: None)
+        engine.patience = 0
+        engine._start_run()
+        # No delta is measured on the first cycle, so it cannot stall
+        assert not engine._terminate(self.metrics(0.5))
+        state = self.metrics(0.5)
+        assert engine._terminate(state) and state["termination"]["reason"] == "stalled"
+
+    def test_stalled_run_stops_early(self, corpus):
+        """Cycles that reuse every layer stop the run once patience is used up"""
+        events = []
+        engine = IntentDeductionEngine(corpus_path=str(corpus), recursion_depth=5, on_event=events.append)
+        state = engine.run(["analyze sentinel"])
+
+        assert engine.iteration == 2
+        assert state["termination"] == {**state["termination"], "reason": "stalled", "cycles": 2,
+                                         "max_delta": 0.0, "stalled_cycles": 1}
+        assert events[-1]["termination"] == state["termination"]
+        assert load_snapshot(str(engine.snapshots.latest_path))["termination"]["reason"] == "stalled"
+
+    def test_budgets(self, corpus):
+        """Without early stops the run ends at recursion_depth or its time budget"""
+        engine = IntentDeductionEngine(corpus_path=str(corpus), recursion_depth=2, tolerance=0.0,
+                                       on_event=lambda _: None)
+        assert engine.run(["analyze"])["termination"]["reason"] == "recursion_depth"
+        assert engine.iteration == 2
+
+        engine = IntentDeductionEngine(corpus_path=str(corpus), recursion_depth=3, tolerance=0.0,
+                                       time_budget=1e-9, on_event=lambda _: None)
+        state = engine.run(["analyze"])
+        assert engine.iteration == 1 and state["termination"]["reason"] == "time_budget"
+        assert state["termination"]["max_delta"] is None
+
+
+class TestEngineEvents:
+    """Test suite for event callbacks and the asyncio engine"""
+
+    def test_events_replace_prints(self, corpus, capsys):
+        """An on_event callback receives every event and nothing is printed"""
+        events = []
+        engine = IntentDeductionEngine(corpus_path=str(corpus), recursion_depth=2, on_event=events.append)
+        state = engine.run(["analyze"])
+
+        assert capsys.readouterr().out == ""
+        kinds = [event["event"] for event in events]
+        assert kinds[0] == "run_start" and kinds[-1] == "run_done"
+        assert kinds.count("cycle_done") == kinds.count("state_saved") == 2
+        layers = [event for event in events if event["event"] == "layer_done" and event["iteration"] == 1]
+        assert sorted(event["layer"] for event in layers) == [f"layer_{i}" for i in range(1, 8)]
+        summaries = {event["layer"]: event["summary"] for event in layers}
+        assert summaries["layer_1"]["indexed"] and summaries["layer_1"]["organisms"] == 2
+        assert summaries["layer_2"]["intents"] == 1
+        cycles = [event for event in events if event["event"] == "cycle_done"]
+        assert cycles[-1]["metrics"] == state["emergent_metrics"] and events[-1]["iterations"] == 2
+
+    def test_arun_matches_run(self, corpus):
+        """arun() produces the same states as run() and saves each cycle"""
+        prompts = ["validate scan", "create sentinel"]
+        run = IntentDeductionEngine(corpus_path=str(corpus), recursion_depth=2, on_event=lambda _: None)
+        arun = IntentDeductionEngine(corpus_path=str(corpus), recursion_depth=2, on_event=lambda _: None)
+        expected = run.run(prompts)
+        state = asyncio.run(arun.arun(prompts))
+
+        def content(state):
+            intents = [{k: v for k, v in r.items() if k != "timestamp"} for r in state["intent_vectors"]]
+            return intents, state["trajectory_map"], state["deployment_readiness"], state["project_plan"]
+        assert arun.iteration == 2 and content(state) == content(expected)
+        assert state["termination"]["reason"] == expected["termination"]["reason"]
+        saved = load_snapshot(str(arun.snapshots.latest_path))
+        assert saved["iteration"] == 2 and saved["emergent_metrics"] == state["emergent_metrics"]
+
+    def test_arun_cancelled_between_layers(self, corpus, monkeypatch):
+        """Cancelling arun() after Layer 2 starts no further layers and saves nothing"""
+        engine = IntentDeductionEngine(corpus_path=str(corpus), on_event=lambda _: None)
+        enhanced = []
+        enhance_batch = engine.prompt_enhancer.enhance_batch
+        monkeypatch.setattr(engine.prompt_enhancer, "enhance_batch",
+                            lambda batch: enhanced.append(1) or enhance_batch(batch))
+
+        async def main():
+            task = asyncio.current_task()
+            events = []
+
+            def on_event(event):
+                events.append(event)
+                if event["event"] == "layer_done" and event["layer"] == "layer_2":
+                    task.cancel()
+            engine.on_event = on_event
+            with pytest.raises(asyncio.CancelledError):
+                await engine.arun(["analyze"])
+            return events
+
+        events = asyncio.run(main())
+        done = {event["layer"] for event in events if event["event"] == "layer_done"}
+        assert "layer_2" in done and done <= {"layer_1", "layer_2", "layer_4"}
+        assert enhanced == [] and len(engine.state_history) == 0
+        assert not engine.snapshots.latest_path.exists()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '-s'])
@@ -0,0 +1,257 @@
+"""
+Test NC-LM Engine (osiris/nclm/engine.py)
+=========================================
+Vectorised correlation / Φ and batch inference
+"""
+
+import math
+import sys
+import threading
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "osiris"))
+
+# physics.constants is missing from some checkouts; any other import error fails
+pytest.importorskip("physics.constants", reason="physics.constants not available")
+
+from nclm.engine import (
+    ConsciousnessField, ManifoldPoint, NCLMEngine, NCLMModel, PilotWaveCorrelation,
+    THETA_LOCK, point_arrays, tiled_entropy_stats,
+)
+
+CONTEXT = "shared context about the quantum circuit and its coherence"
+QUERIES = [
+    "read the quantum circuit",
+    "",
+    "find coherence data in the network",
+    "explain",
+    "scan scan scan",
+]
+
+
+def reference_correlate(A, B, lambda_decay=2.0):
+    """Original per-pair correlate() with trigonometry on every call."""
+    psi_A = complex(math.cos(A.theta * math.pi / 180), math.sin(A.phi * math.pi / 180))
+    psi_B = complex(math.cos(B.theta * math.pi / 180), math.sin(B.phi * math.pi / 180))
+    correlation = abs(psi_A.conjugate() * psi_B) * math.exp(-A.distance(B) / lambda_decay)
+    theta_avg = (A.theta + B.theta) / 2
+    return correlation * (1 + 0.5 * math.exp(-abs(theta_avg - THETA_LOCK) / 10))
+
+
+def reference_phi(text, lambda_decay=2.0):
+    """Original scalar correlation matrix and entropy loop."""
+    points = [ManifoldPoint(token=t) for t in text.lower().split()]
+    flat = [reference_correlate(a, b, lambda_decay) for a in points for b in points]
+    flat = [c for c in flat if c > 0]
+    total = sum(flat)
+    entropy = -sum((c / total) * math.log2(c / total + 1e-12) for c in flat)
+    max_entropy = math.log2(len(flat)) if len(flat) > 1 else 1
+    return min(entropy / max_entropy, 1.0)
+
+
+class TestNCLMEngine:
+    """Test suite for NCLMEngine inference"""
+
+    def test_infer_phi_matches_reference(self):
+        """Vectorised Φ matches the scalar correlation/entropy loop"""
+        engine = NCLMEngine()
+        for query in QUERIES:
+            if query:
+                response = engine.infer(query, CONTEXT)
+                assert response["phi"] == pytest.approx(reference_phi(f"{query} {CONTEXT}"), abs=1e-9)
+
+    def test_cached_kernel_matches_reference(self):
+        """Scalar and matrix kernels over cached ψ columns match the original formula"""
+        points = [ManifoldPoint(token=t) for t in f"{CONTEXT} θ-lock edge".split()]
+        correlation = PilotWaveCorrelation(lambda_decay=2.0)
+        coords = point_arrays(points)
+        matrix = correlation.correlate_matrix(coords, coords)
+
+        for i, a in enumerate(points):
+            for j, b in enumerate(points):
+                expected = reference_correlate(a, b)
+                assert correlation.correlate(a, b) == pytest.approx(expected, rel=1e-12)
+                assert matrix[i, j] == pytest.approx(expected, rel=1e-12)
+
+    def test_infer_batch_matches_sequential(self):
+        """infer_batch returns what repeated infer() calls return"""
+        batched, sequential = NCLMEngine(), NCLMEngine()
+
+        results = batched.infer_batch(QUERIES * 3, CONTEXT, chunk_size=4)
+        expected = [sequential.infer(q, CONTEXT) for q in QUERIES * 3]
+
+        for got, want in zip(results, expected):
+            assert got.keys() == want.keys()
+            assert got.get("phi") == pytest.approx(want.get("phi"), abs=1e-12)
+            assert got.get("intent") == want.get("intent")
+        assert batched.token_count == sequential.token_count
+        assert batched.inference_count == sequential.inference_count
+
+    def test_infer_batch_without_context(self):
+        """Empty queries without context report no tokens"""
+        results = NCLMEngine().infer_batch(["", "read file"])
+        assert results[0] == {"error": "No tokens", "success": False}
+        assert results[1]["success"]
+
+    def test_history_is_bounded(self):
+        """Intent history is a bounded buffer"""
+        engine = NCLMEngine(history_limit=10)
+        engine.infer_batch([f"read file{i}" for i in range(50)])
+        assert len(engine.intent_deducer.history) == 10
+        assert engine.inference_count == 50
+
+
+class TestTiledCorrelation:
+    """Test suite for tiled / sharded correlation statistics"""
+
+    @pytest.fixture
+    def coords(self):
+        model = NCLMModel()
+        return point_arrays(model.tokenize(" ".join(f"token{i}" for i in range(300))))
+
+    def test_tiled_matches_dense(self, coords):
+        """Tile-by-tile reduction equals the full-matrix statistics"""
+        dense = ConsciousnessField.entropy_stats(
+            PilotWaveCorrelation(lambda_decay=2.0).correlate_matrix(coords, coords)
+        )
+        tiled = tiled_entropy_stats(coords, 2.0, tile=64)
+
+        assert tiled[0] == dense[0]
+        assert tiled[1] == pytest.approx(dense[1], rel=1e-12)
+        assert tiled[2] == pytest.approx(dense[2], rel=1e-12)
+
+    def test_sharded_matches_local(self, coords):
+        """Worker processes over shared memory reproduce the local result"""
+        local = tiled_entropy_stats(coords, 2.0, tile=64)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            sharded = tiled_entropy_stats(coords, 2.0, tile=64, executor=executor)
+        assert sharded == pytest.approx(local, rel=1e-12)
+
+    def test_sharded_engine_mode(self):
+        """Sharded execution mode gives the same Φ as local mode"""
+        context = " ".join(f"ctx{i}" for i in range(150))
+        sharded = NCLMEngine(execution="sharded", workers=2)
+        sharded.model.tile_size = 40
+        try:
+            got = sharded.infer("read the file", context)
+        finally:
+            sharded.close()
+        want = NCLMEngine().infer("read the file", context)
+        assert got["phi"] == pytest.approx(want["phi"], abs=1e-12)
+
+    def test_long_query_is_tiled(self):
+        """Queries longer than a tile give the same Φ tile by tile"""
+        prompt = " ".join(f"tok{i}" for i in range(150))
+        tiled = NCLMEngine()
+        tiled.model.tile_size = 40
+        assert tiled.grok(prompt)["phi"] == pytest.approx(NCLMEngine().grok(prompt)["phi"], abs=1e-12)
+
+    def test_long_grok_peak_memory(self):
+        """grok() on a long prompt never holds the full query matrix"""
+        tokens = 4000
+        prompt = " ".join(f"tok{i}" for i in range(tokens))
+        engine = NCLMEngine()
+        engine.model.tile_size = 512
+
+        tracemalloc.start()
+        try:
+            engine.grok(prompt)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        # One float64 copy of the dense matrix alone would be 128 MB
+        assert peak < tokens ** 2 * 8 / 4
+
+    def test_unknown_execution_mode(self):
+        """Unknown execution modes are rejected"""
+        with pytest.raises(ValueError):
+            NCLMEngine(execution="gpu")
+
+
+class TestReducedPrecision:
+    """Test suite for the float32 "batch" precision mode"""
+
+    def test_batch_precision_phi_deviation(self):
+        """float32 Φ stays within 1e-6 of the float64 result"""
+        context = " ".join(f"{CONTEXT} ctx{i}" for i in range(40))
+        exact = NCLMEngine().infer_batch(QUERIES * 4, context)
+        reduced = NCLMEngine(precision="batch")
+        assert reduced.model.dtype == np.float32
+
+        for got, want in zip(reduced.infer_batch(QUERIES * 4, context), exact):
+            assert got["phi"] == pytest.approx(want["phi"], abs=1e-6)
+            assert got["intent"] == want["intent"]
+
+    def test_float32_sharded_tiles(self):
+        """Shared-memory tiles keep the float32 coordinate dtype"""
+        coords = point_arrays(NCLMModel().tokenize(" ".join(f"t{i}" for i in range(200))), np.float32)
+        local = tiled_entropy_stats(coords, 2.0, tile=64)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            sharded = tiled_entropy_stats(coords, 2.0, tile=64, executor=executor)
+        exact = tiled_entropy_stats(coords.astype(np.float64), 2.0, tile=64)
+
+        assert sharded == pytest.approx(local, rel=1e-12)
+        assert local == pytest.approx(exact, rel=1e-5)
+
+    def test_unknown_precision(self):
+        """Unknown precision modes are rejected"""
+        with pytest.raises(ValueError):
+            NCLMModel(precision="float16")
+
+
+@pytest.fixture
+def contended():
+    """Switch threads as often as possible to provoke interleavings."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+class TestThreadedTelemetry:
+    """Test suite for counters and CCCE snapshots under threads"""
+
+    def test_counters_are_exact(self, contended):
+        """Concurrent inferences on one engine neither lose counts nor reuse ids"""
+        engine = NCLMEngine()
+        queries = [f"{q} {i}" for i in range(25) for q in QUERIES]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            responses = list(pool.map(lambda q: engine.infer(q, CONTEXT), queries))
+
+        telemetry = engine.get_telemetry()
+        assert telemetry["inferences"] == len(queries)
+        assert telemetry["tokens_processed"] == sum(r["token_count"] for r in responses)
+        assert sorted(r["inference_id"] for r in responses) == list(range(1, len(queries) + 1))
+
+    def test_ccce_snapshots_are_consistent(self, contended):
+        """Every telemetry snapshot holds the values of a single update"""
+        engine = NCLMEngine()
+        done = threading.Event()
+        snapshots = []
+
+        def read():
+            while not done.is_set():
+                snapshots.append(engine.get_telemetry())
+
+        reader = threading.Thread(target=read)
+        reader.start()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda i: engine.infer(f"token{i} " * (i % 7 + 1), CONTEXT), range(200)))
+        done.set()
+        reader.join()
+
+        assert snapshots
+        for telemetry in snapshots:
+            ccce = telemetry["ccce"]
+            assert telemetry["phi"] == ccce["phi"]
+            assert ccce["lambda"] == 0.5 + 0.5 * ccce["phi"]
+            assert ccce["gamma"] == 0.092 * (1 - 0.5 * ccce["phi"])
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '-s'])
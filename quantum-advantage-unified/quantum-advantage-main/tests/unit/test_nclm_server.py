@@ -0,0 +1,102 @@
+"""
+Test NC-LM Inference Server (osiris/nclm/server.py)
+===================================================
+Shared-model sessions, LRU eviction and concurrent access
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "osiris"))
+
+# physics.constants is missing from some checkouts; any other import error fails
+pytest.importorskip("physics.constants", reason="physics.constants not available")
+
+from nclm.engine import NCLMEngine, NCLMModel
+from nclm.server import NCLMServer
+
+QUERIES = ["read the quantum circuit", "find coherence data", "explain the wormhole"]
+
+
+class TestNCLMServer:
+    """Test suite for the multi-session server"""
+
+    def test_sessions_are_isolated(self):
+        """Each session evolves exactly like its own engine"""
+        server = NCLMServer()
+        for query in QUERIES:
+            server.infer("alice", query, "context tokens here")
+        server.infer("bob", QUERIES[0])
+
+        alice, bob = NCLMEngine(), NCLMEngine()
+        for query in QUERIES:
+            alice.infer(query, "context tokens here")
+        bob.infer(QUERIES[0])
+
+        assert server.get_telemetry("alice") == alice.get_telemetry()
+        assert server.get_telemetry("bob") == bob.get_telemetry()
+
+    def test_engines_share_model(self):
+        """Engines built on one model share its vocabulary cache"""
+        model = NCLMModel()
+        NCLMEngine(model=model).infer("read the file")
+        NCLMEngine(model=model).infer("read the file")
+        assert model.vocab_cache_info()["hits"] >= 3
+
+    def test_lru_eviction(self):
+        """Least recently used sessions are evicted beyond max_sessions"""
+        server = NCLMServer(max_sessions=2)
+        server.infer("a", "read x")
+        server.infer("b", "read y")
+        server.infer("a", "read z")
+        server.infer("c", "read w")
+
+        assert "a" in server and "c" in server
+        assert "b" not in server
+        assert server.get_telemetry()["evictions"] == 1
+
+    def test_telemetry_reads_do_not_touch_sessions(self):
+        """Telemetry for unknown ids raises; reads neither create nor refresh sessions"""
+        server = NCLMServer(max_sessions=2)
+        server.infer("a", "read x")
+        server.infer("b", "read y")
+
+        with pytest.raises(KeyError):
+            server.get_telemetry("typo")
+        assert len(server) == 2 and "typo" not in server
+
+        assert server.get_telemetry("a")["inferences"] == 1
+        server.infer("c", "read z")
+        assert "a" not in server and "b" in server and "c" in server
+        assert server.get_telemetry()["evictions"] == 1
+
+    def test_history_is_bounded(self):
+        """Per-session intent history never exceeds history_limit"""
+        server = NCLMServer(history_limit=4)
+        for i in range(10):
+            server.infer("s", f"read file{i}")
+        assert len(server.session("s").intent_deducer.history) == 4
+
+    def test_concurrent_sessions(self):
+        """Concurrent requests keep per-session counts consistent"""
+        server = NCLMServer(max_sessions=16)
+
+        def worker(index):
+            for _ in range(25):
+                server.infer(f"user{index % 4}", "scan the network")
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        for user in range(4):
+            assert server.get_telemetry(f"user{user}")["inferences"] == 50
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '-s'])
@@ -0,0 +1,339 @@
+"""
+Test Non-Causal Language Model (osiris/physics/ncphysics.py)
+============================================================
+Vectorised pilot-wave attention against the reference scalar algorithm
+"""
+
+import asyncio
+import json
+import math
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "osiris"))
+
+# physics.constants is missing from some checkouts; any other import error fails
+pytest.importorskip("physics.constants", reason="physics.constants not available")
+
+from physics.ncphysics import (
+    GOLDEN_RATIO, LAMBDA_PHI, NC_PHYSICS, ContextWindow, NCSession, NonCausalLM,
+    PilotWaveAttention, TokenManifold
+)
+
+
+def tokens(text):
+    return [TokenManifold.from_token(w) for w in text.split()]
+
+
+def reference_attend(query, keys, temperature, coupling):
+    """Original query-by-key loop implementation."""
+    avg = [
+        sum(math.exp(-q.distance_to(k) / temperature) for q in query) / len(query)
+        for k in keys
+    ]
+    psi = []
+    for a in keys:
+        total = 0.0
+        for b in keys:
+            d = a.distance_to(b)
+            if d >= 1e-6:
+                total += math.exp(-d / GOLDEN_RATIO) * math.cos(LAMBDA_PHI * b.theta) * b.weight
+        psi.append(total)
+    peak = max(abs(p) for p in psi)
+    if peak > 1e-6:
+        psi = [p / peak for p in psi]
+    combined = [s + coupling * p for s, p in zip(avg, psi)]
+    top = max(combined)
+    exp_scores = [math.exp(c - top) for c in combined]
+    return [e / sum(exp_scores) for e in exp_scores]
+
+
+class TestPilotWaveAttention:
+    """Test suite for vectorised pilot-wave attention"""
+
+    def test_attend_matches_reference(self):
+        """Array implementation matches the scalar algorithm"""
+        attention = PilotWaveAttention()
+        query = tokens("read the readme file")
+        keys = tokens("the readme file describes the engine and the readme")
+
+        weights = attention.attend(query, keys, keys)
+        expected = reference_attend(query, keys, attention.temperature, attention.coupling)
+
+        assert weights == pytest.approx(expected, abs=1e-12)
+        assert sum(weights) == pytest.approx(1.0)
+
+    def test_attend_batch_matches_single(self):
+        """Each batched result equals the single-query result"""
+        attention = PilotWaveAttention()
+        keys = tokens("alpha beta gamma delta epsilon")
+        batch = [tokens("alpha"), tokens("gamma delta"), []]
+
+        results = attention.attend_batch(batch, keys, keys)
+
+        assert len(results) == 3
+        for query, weights in zip(batch[:2], results[:2]):
+            assert weights == pytest.approx(attention.attend(query, keys, keys))
+        assert results[2] == pytest.approx([0.2] * 5)
+
+    def test_empty_keys_are_uniform(self):
+        """No keys yields uniform weights over values"""
+        values = tokens("a b c d")
+        assert PilotWaveAttention().attend(tokens("a"), [], values) == [0.25] * 4
+
+    def test_batch_precision_deviation(self):
+        """float32 attention weights stay within 1e-5 (relative) of float64"""
+        exact, reduced = NonCausalLM(), NonCausalLM(precision="batch")
+        context = " ".join(f"word{i % 97} readme setup" for i in range(150))
+        queries = ["read the readme", "run setup tests", "word3 word50"]
+
+        for lm in (exact, reduced):
+            lm._sync_context(context)
+        want = exact.attention.attend_window([exact.tokenize(q) for q in queries], exact.context_window)
+        got = reduced.attention.attend_window([reduced.tokenize(q) for q in queries], reduced.context_window)
+
+        for g, w in zip(got, want):
+            assert g == pytest.approx(w, rel=1e-5)
+            assert sum(g) == pytest.approx(1.0, abs=1e-6)
+        assert reduced.process("read setup.py", context)["actions"] == exact.process("read setup.py", context)["actions"]
+
+    def test_top_k_matches_full_sort(self):
+        """argpartition top-k equals the head of a full descending sort"""
+        lm = NonCausalLM()
+        lm._sync_context(" ".join(f"word{i % 41} readme setup" for i in range(100)))
+        query_batch = [lm.tokenize("read the readme"), []]
+        dense = lm.attention.attend_window(query_batch, lm.context_window)
+        sparse = lm.attention.attend_window_top_k(query_batch, lm.context_window, k=5)
+
+        for weights, (index, top) in zip(dense, sparse):
+            expected = sorted(range(len(weights)), key=lambda i: (-weights[i], i))[:5]
+            assert index.tolist() == expected
+            assert top.tolist() == pytest.approx([weights[i] for i in expected])
+
+    def test_top_k_threshold(self):
+        """Weights below the threshold are dropped"""
+        index, weights = PilotWaveAttention.top_k([0.1, 0.5, 0.05, 0.35], k=3, threshold=0.2)
+        assert index.tolist() == [1, 3]
+        assert weights.tolist() == [0.5, 0.35]
+
+
+class TestContextWindow:
+    """Test suite for the incremental ring-buffer context"""
+
+    def test_incremental_pilot_wave_matches_full(self):
+        """Appends, evictions and pops keep ψ equal to a full recompute"""
+        attention = PilotWaveAttention()
+        window = ContextWindow(capacity=8)
+        expected = []
+
+        for step in range(40):
+            if step % 5 == 4:
+                window.pop()
+                expected.pop()
+            else:
+                new = tokens(f"t{step} t{step % 3} w{step % 7}")
+                window.extend(new)
+                expected = (expected + new)[-8:]
+
+            assert [t.token for t in window.tokens()] == [t.token for t in expected]
+            assert list(window.pilot_wave()) == pytest.approx(
+                attention.compute_pilot_wave(expected), abs=1e-9
+            )
+
+    def test_unbounded_window_grows(self, monkeypatch):
+        """Without a capacity the window keeps every token, tile by tile"""
+        monkeypatch.setattr(ContextWindow, "TILE_PAIRS", 7)
+        attention = PilotWaveAttention()
+        window = ContextWindow(reserve=4)
+        expected = []
+
+        for step in range(30):
+            if step % 5 == 4:
+                window.pop()
+                expected.pop()
+            else:
+                new = tokens(f"t{step} t{step % 3} w{step % 7}")
+                window.extend(new)
+                expected += new
+
+            assert [t.token for t in window.tokens()] == [t.token for t in expected]
+            assert list(window.pilot_wave()) == pytest.approx(
+                attention.compute_pilot_wave(expected), abs=1e-9
+            )
+        assert window.capacity is None and len(window) == len(expected) > 4
+
+    def test_growing_context_reuses_prefix(self):
+        """Extending the context string only tokenizes the new tail"""
+        lm = NonCausalLM()
+        text = ""
+        for piece in ["read the rea", "dme file", " then run", " tests."]:
+            text += piece
+            lm._sync_context(text)
+            assert [t.token for t in lm.context_window.tokens()] == [
+                t.token for t in lm.tokenize(text)
+            ]
+
+        lm._sync_context("unrelated context")
+        assert [t.token for t in lm.context_window.tokens()] == ["unrelated", "context"]
+
+
+class TestNonCausalLM:
+    """Test suite for NonCausalLM processing"""
+
+    def test_process_batch_matches_sequential(self):
+        """Batch processing evolves state exactly like sequential calls"""
+        queries = ["read setup.py", "find tests", "hello there"]
+        batched = NonCausalLM().process_batch(queries, "setup tests readme")
+
+        lm = NonCausalLM()
+        sequential = [lm.process(q, "setup tests readme") for q in queries]
+
+        assert batched == sequential
+
+    def test_sessions_share_model(self):
+        """Explicit sessions on one model match independent models"""
+        shared = NonCausalLM()
+        first, second = shared.new_session(), shared.new_session()
+        solo_first, solo_second = NonCausalLM(), NonCausalLM()
+
+        for query in ["read a", "bogus", "find b"]:
+            assert shared.process(query, "ctx one", first) == solo_first.process(query, "ctx one")
+        assert shared.process("run c", "ctx two", second) == solo_second.process("run c", "ctx two")
+        assert shared.get_telemetry(first) == solo_first.get_telemetry()
+        assert shared.get_telemetry() == NonCausalLM().get_telemetry()
+
+    def test_process_reports_context_spans(self):
+        """Sparse attention entries point back at the context text"""
+        context = "The README describes setup. Run setup.py to install the package."
+        response = NonCausalLM(top_k=3).process("read the readme", context)
+
+        assert len(response["attention"]) == 3
+        for entry in response["attention"]:
+            start, end = entry["span"]
+            assert context[start:end].lower() == entry["token"]
+        weights = [entry["weight"] for entry in response["attention"]]
+        assert weights == sorted(weights, reverse=True)
+        assert NonCausalLM().process("read the readme")["attention"] == []
+
+    def test_non_ascii_context_spans(self):
+        """Spans index into the original context when lower-casing changes its length"""
+        context = "İİİİ quantum deploy sentinel"
+        response = NonCausalLM(top_k=4).process("deploy sentinel", context)
+
+        entries = {entry["token"]: entry["span"] for entry in response["attention"]}
+        assert sorted(entries) == sorted(["i̇i̇i̇i̇", "quantum", "deploy", "sentinel"])
+        for token, (start, end) in entries.items():
+            assert context[start:end].lower() == token
+        start, end = entries["sentinel"]
+        assert context[start:end] == "sentinel"
+
+    def test_attention_covers_long_context(self):
+        """Attention reaches the start of a context longer than MAX_TOKENS unless capped"""
+        context = "sentinel " + "filler " * (NC_PHYSICS.MAX_TOKENS + 200)
+        lm = NonCausalLM()
+        response = lm.process("sentinel", context)
+        assert len(lm.context_window) == NC_PHYSICS.MAX_TOKENS + 201
+        assert response["attention"][0]["span"] == [0, 8]
+
+        capped = NonCausalLM(context_capacity=100)
+        response = capped.process("sentinel", context)
+        assert len(capped.context_window) == 100 and capped.new_session().context_capacity == 100
+        assert min(entry["span"][0] for entry in response["attention"]) > 8
+
+    def test_context_window_bounded(self):
+        """Context never exceeds MAX_TOKENS"""
+        lm = NonCausalLM()
+        lm.process("word " * (NC_PHYSICS.MAX_TOKENS + 10))
+        assert len(lm.context) == NC_PHYSICS.MAX_TOKENS
+
+
+
+async def collect(stream):
+    return [item async for item in stream]
+
+
+class TestStreaming:
+    """Test suite for async streaming responses"""
+
+    def test_stream_matches_process(self):
+        """Streamed events reassemble into the process() response"""
+        streamed, processed = NonCausalLM(), NonCausalLM()
+        context = "The README describes setup. Run setup.py to install."
+
+        for query in ["read the readme", "bogus words", "run setup.py"]:
+            events = asyncio.run(collect(streamed.stream(query, context)))
+            assert [e["event"] for e in events] == ["intent", "attention", "telemetry"]
+
+            expected = processed.process(query, context)
+            assert {**events[0]["data"], "attention": events[1]["data"]} == expected
+            assert events[2]["data"] == processed.get_telemetry()
+
+    def test_stream_json_is_compact(self):
+        """stream_json yields one single-line JSON document per event"""
+        lm = NonCausalLM()
+        lines = asyncio.run(collect(lm.stream_json("read setup.py", "setup.py is here")))
+
+        assert len(lines) == 3
+        for line in lines:
+            assert line.endswith("\n") and "\n" not in line[:-1]
+            assert ", " not in line and '": ' not in line
+        assert json.loads(lines[1])["data"][0]["token"] == "setup"
+
+    def test_compact_chat(self):
+        """chat(compact=True) encodes the same response without indentation"""
+        compact = NonCausalLM().chat("read setup.py", compact=True)
+        indented = NonCausalLM().chat("read setup.py")
+        assert json.loads(compact) == json.loads(indented)
+        assert "\n" not in compact and len(compact) < len(indented)
+
+
+class TestThreadedSession:
+    """Test suite for NCSession CCCE updates under threads"""
+
+    UPDATES = 400
+
+    def test_update_phi_is_atomic(self):
+        """Concurrent updates are never lost and snapshots match one update"""
+        reference = NCSession()
+        states = [reference.ccce()]
+        for _ in range(self.UPDATES):
+            reference.update_phi(True)
+            states.append(reference.ccce())
+
+        session = NCSession()
+        done = threading.Event()
+        snapshots = []
+
+        def read():
+            while not done.is_set():
+                snapshots.append(session.ccce())
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            reader = threading.Thread(target=read)
+            reader.start()
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(lambda _: session.update_phi(True), range(self.UPDATES)))
+            done.set()
+            reader.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        assert session.ccce() == states[-1]
+        assert all(snapshot in states for snapshot in snapshots)
+
+    def test_telemetry_uses_snapshot(self):
+        """get_telemetry() reports the session's CCCE snapshot"""
+        lm = NonCausalLM()
+        lm.process("read setup.py")
+        telemetry = lm.get_telemetry()
+        assert {k: telemetry[k] for k in ("phi", "lambda", "gamma", "xi", "conscious")} == lm.session.ccce()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '-s'])
@@ -0,0 +1,134 @@
+"""
+Test Stage Latency Telemetry (osiris/physics/telemetry.py)
+==========================================================
+Histogram bookkeeping, Prometheus export and opt-in instrumentation of
+NonCausalLM and NCLMEngine
+"""
+
+import importlib.util
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "osiris"))
+
+from physics.telemetry import NULL_TIMER, LatencyHistogram, StageTimer
+
+# physics.constants is missing from some checkouts; any other import error fails
+HAS_NCLM = importlib.util.find_spec("physics.constants") is not None
+if HAS_NCLM:
+    from physics.ncphysics import NonCausalLM
+    from nclm.engine import NCLMEngine
+
+needs_nclm = pytest.mark.skipif(not HAS_NCLM, reason="physics.constants not available")
+
+
+class TestStageTimer:
+    """Test suite for histograms and their export"""
+
+    def test_histogram_buckets_and_quantiles(self):
+        """Observations land in the first bucket whose bound covers them"""
+        histogram = LatencyHistogram(buckets=(0.001, 0.01, 0.1))
+        for seconds in (0.0005, 0.001, 0.005, 0.05, 5.0):
+            histogram.observe(seconds)
+
+        assert histogram.counts == [2, 1, 1, 1]
+        assert histogram.cumulative() == [2, 3, 4, 5]
+        assert histogram.sum == pytest.approx(5.0565)
+        assert histogram.quantile(0.4) == 0.001
+        assert histogram.quantile(0.8) == 0.1
+        assert histogram.quantile(1.0) == float("inf")
+
+    def test_prometheus_text(self):
+        """Export follows the Prometheus histogram text format"""
+        timer = StageTimer(("tokenize",), buckets=(0.5, 1.0))
+        timer.record("tokenize", 0.25)
+        timer.record("tokenize", 0.75)
+
+        text = timer.to_prometheus("nclm_stage_latency_seconds", "Stage latency")
+
+        assert text.splitlines() == [
+            "# HELP nclm_stage_latency_seconds Stage latency",
+            "# TYPE nclm_stage_latency_seconds histogram",
+            'nclm_stage_latency_seconds_bucket{stage="tokenize",le="0.5"} 1',
+            'nclm_stage_latency_seconds_bucket{stage="tokenize",le="1.0"} 2',
+            'nclm_stage_latency_seconds_bucket{stage="tokenize",le="+Inf"} 2',
+            'nclm_stage_latency_seconds_sum{stage="tokenize"} 1.0',
+            'nclm_stage_latency_seconds_count{stage="tokenize"} 2',
+        ]
+
+    def test_request_sums_repeated_stages(self):
+        """A stage entered several times in one request is one observation"""
+        timer = StageTimer(("tokenize", "attention"))
+        with timer.request() as request:
+            for _ in range(3):
+                with request.stage("tokenize"):
+                    pass
+        snapshot = timer.snapshot()
+        assert snapshot["tokenize"]["count"] == 1 and snapshot["attention"]["count"] == 0
+
+    def test_null_timer_records_nothing(self):
+        """The disabled timer accepts stages but reports nothing"""
+        with NULL_TIMER.stage("tokenize"):
+            pass
+        with NULL_TIMER.request() as request, request.stage("tokenize"):
+            pass
+        assert NULL_TIMER.snapshot() == {}
+        assert NULL_TIMER.to_prometheus("x") == ""
+
+
+@needs_nclm
+class TestInstrumentation:
+    """Test suite for instrumented inference paths"""
+
+    def test_noncausal_lm_stages(self):
+        """Every process() call records each NonCausalLM stage"""
+        lm = NonCausalLM(instrument=True)
+        for query in ["read setup.py", "find tests"]:
+            lm.process(query, "setup tests readme")
+
+        latency = lm.get_telemetry()["latency"]
+        assert set(latency) == set(NonCausalLM.STAGES)
+        assert all(stats["count"] == 2 for stats in latency.values())
+        assert latency["total"]["sum"] >= latency["attention"]["sum"]
+        assert 'stage="attention"' in lm.export_prometheus()
+
+    def test_noncausal_lm_stream_stages(self):
+        """stream() records each stage once, including total"""
+        lm = NonCausalLM(instrument=True)
+
+        async def consume():
+            return [event async for event in lm.stream("read setup.py", "setup tests readme")]
+        events = asyncio.run(consume())
+
+        latency = lm.get_telemetry()["latency"]
+        assert all(stats["count"] == 1 for stats in latency.values())
+        assert latency["total"]["sum"] >= latency["tokenize"]["sum"] + latency["attention"]["sum"]
+        assert events[-1]["data"]["latency"]["total"]["count"] == 1
+
+    def test_nclm_engine_stages(self):
+        """infer() and infer_batch() record one observation per stage per call"""
+        engine = NCLMEngine(instrument=True)
+        engine.infer("simulate a wormhole", "quantum circuit context")
+        engine.infer("ping the network")
+        engine.infer_batch(["read it", "run it", "find it"], "quantum circuit context", chunk_size=1)
+
+        latency = engine.get_telemetry()["latency"]
+        assert set(latency) == set(NCLMEngine().model.STAGES)
+        assert all(stats["count"] == 3 for stats in latency.values())
+        assert latency["total"]["sum"] >= latency["tokenize"]["sum"] + latency["correlation"]["sum"]
+        assert "nclm_stage_latency_seconds_count" in engine.export_prometheus()
+
+    def test_instrumentation_is_opt_in(self):
+        """Uninstrumented models report no latency and identical results"""
+        plain, timed = NCLMEngine(), NCLMEngine(instrument=True)
+        assert plain.infer("run tests", "ctx") == timed.infer("run tests", "ctx")
+        assert "latency" not in plain.get_telemetry()
+        assert "latency" not in NonCausalLM().get_telemetry()
+        assert plain.export_prometheus() == ""
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '-s'])
@@ -0,0 +1,101 @@
+"""
+Test Streaming Tokenizer (osiris/physics/tokenizer.py)
+======================================================
+Chunked streaming against whole-string tokenization for both splits, and
+the engines that share the tokenizer
+"""
+
+import importlib.util
+import random
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "osiris"))
+
+from physics.tokenizer import Tokenizer
+
+# physics.constants is missing from some checkouts; any other import error fails
+HAS_NCLM = importlib.util.find_spec("physics.constants") is not None
+if HAS_NCLM:
+    from physics.ncphysics import NonCausalLM
+    from nclm.engine import NCLMEngine, NCLMModel
+
+needs_nclm = pytest.mark.skipif(not HAS_NCLM, reason="physics.constants not available")
+
+TEXT = (
+    "Read the README.md, then run `pytest -q` in tests/unit!\n"
+    "Quantum circuits & coherence:\tΦ ≥ 0.7734 — ΛΦ=2.176e-8   end"
+)
+
+LEGACY = {
+    "whitespace": lambda text: text.lower().split(),
+    "word": lambda text: re.findall(r'\b\w+\b', text.lower()),
+}
+
+
+def chunks(text, seed):
+    """Split text at random boundaries (including empty chunks)."""
+    rng = random.Random(seed)
+    cuts = sorted(rng.randint(0, len(text)) for _ in range(rng.randint(0, 25)))
+    return [text[a:b] for a, b in zip([0] + cuts, cuts + [len(text)])]
+
+
+class TestTokenizer:
+    """Test suite for the shared tokenizer"""
+
+    @pytest.mark.parametrize("split", sorted(LEGACY))
+    def test_matches_legacy_split(self, split):
+        """Whole-string tokenization equals each engine's original splitting"""
+        tokenizer = Tokenizer(split, str)
+        assert tokenizer.tokenize(TEXT) == LEGACY[split](TEXT)
+        assert list(tokenizer.words(TEXT)) == LEGACY[split](TEXT)
+
+    @pytest.mark.parametrize("split", sorted(LEGACY))
+    def test_chunked_stream_matches_whole(self, split):
+        """Tokens straddling chunk boundaries are reassembled"""
+        tokenizer = Tokenizer(split, str)
+        for seed in range(200):
+            assert list(tokenizer.words(chunks(TEXT, seed))) == LEGACY[split](TEXT)
+        assert list(tokenizer.words(iter(TEXT))) == LEGACY[split](TEXT)
+
+    def test_points_are_cached_and_lazy(self):
+        """points() is a generator over one shared point cache"""
+        calls = []
+        tokenizer = Tokenizer("word", lambda t: calls.append(t) or t.upper())
+        stream = tokenizer.points(["a b", "c a", " b"])
+
+        assert next(stream) == "A"
+        assert calls == ["a"]
+        assert list(stream) == ["BC", "A", "B"]
+        assert calls == ["a", "bc", "b"]
+        assert tokenizer.cache_info()["hits"] == 1
+
+    def test_unknown_split(self):
+        """Unknown split names are rejected"""
+        with pytest.raises(ValueError):
+            Tokenizer("bpe", str)
+
+
+@needs_nclm
+class TestSharedTokenizer:
+    """Test suite for engines on the shared tokenizer"""
+
+    def test_engine_chunked_context(self):
+        """A chunked context gives the same inference as the whole string"""
+        context = " ".join(f"ctx{i} quantum circuit" for i in range(200))
+        whole = NCLMEngine().infer("read the circuit", context)
+        streamed = NCLMEngine().infer("read the circuit", chunks(context, 7))
+        assert streamed == whole
+
+    def test_split_is_selectable(self):
+        """Each engine can use the other's splitting"""
+        assert [p.token for p in NCLMEngine().model.tokenize(TEXT)] == LEGACY["whitespace"](TEXT)
+        assert [p.token for p in NCLMModel(split="word").tokenize(TEXT)] == LEGACY["word"](TEXT)
+        assert [t.token for t in NonCausalLM(split="whitespace").tokenize(TEXT)] == LEGACY["whitespace"](TEXT)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '-s'])
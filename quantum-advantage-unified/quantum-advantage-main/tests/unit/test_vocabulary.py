@@ -0,0 +1,105 @@
+"""
+Test Vocabulary Manifold (osiris/physics/vocabulary.py)
+=======================================================
+Memory-mapped token coordinate tables and their use by NCLMEngine and
+NonCausalLM, with hashing as the out-of-vocabulary fallback
+"""
+
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "osiris"))
+
+from physics.vocabulary import VocabularyManifold, write_vocabulary_manifold
+
+# physics.constants is missing from some checkouts; any other import error fails
+HAS_NCLM = importlib.util.find_spec("physics.constants") is not None
+if HAS_NCLM:
+    from physics.ncphysics import NonCausalLM
+    from nclm.engine import ManifoldPoint, NCLMEngine, point_arrays
+
+needs_nclm = pytest.mark.skipif(not HAS_NCLM, reason="physics.constants not available")
+
+VOCABULARY = ["read", "the", "readme", "file", "setup.py", "quantum", "circuit", "ünïcode"]
+
+
+@pytest.fixture
+def table(tmp_path):
+    write_vocabulary_manifold(
+        tmp_path, VOCABULARY + ["read", "", "x" * 100],
+        {"demo": lambda t: (len(t), float(t.startswith("r")))},
+        {"demo": ["length", "r"]},
+    )
+    return VocabularyManifold(tmp_path)
+
+
+@pytest.fixture(scope="module")
+def built(tmp_path_factory):
+    """Vocabulary built by the command-line tool."""
+    out = tmp_path_factory.mktemp("vocab") / "manifold"
+    vocab = out.parent / "vocab.txt"
+    vocab.write_text("\n".join(VOCABULARY) + "\n")
+    subprocess.run(
+        [sys.executable, str(ROOT / "osiris" / "tools" / "build_vocabulary.py"), str(vocab), "-o", str(out)],
+        check=True, capture_output=True,
+    )
+    return out
+
+
+class TestVocabularyManifold:
+    """Test suite for the on-disk table"""
+
+    def test_lookup(self, table):
+        """Known tokens map to their rows; duplicates, empty and overlong tokens are dropped"""
+        assert len(table) == len(VOCABULARY)
+        assert table.row("demo", "readme") == [6.0, 1.0]
+        assert table.row("demo", "ünïcode") == [7.0, 0.0]
+        assert table.lookup("missing") == -1
+        assert table.lookup("x" * 100) == -1
+        assert "setup.py" in table and "" not in table
+
+    def test_lookup_many(self, table):
+        """Vectorised lookup agrees with single lookups"""
+        tokens = VOCABULARY + ["zzz", "", "a" * 200, "rea", "readmes"]
+        assert table.lookup_many(tokens).tolist() == [table.lookup(t) for t in tokens]
+
+    def test_tables_are_read_only(self, table):
+        """Tables are read-only memory maps"""
+        assert not table.tokens.flags.writeable
+        assert not table.index.flags.writeable
+        with pytest.raises(ValueError):
+            table.table("demo")[0, 0] = 1.0
+        with pytest.raises(KeyError):
+            table.table("nclm")
+
+
+@needs_nclm
+class TestVocabularyModels:
+    """Test suite for models backed by a vocabulary manifold"""
+
+    def test_engine_points_match_hashing(self, built):
+        """Mapped points equal hashed points, unknown tokens still hash"""
+        engine = NCLMEngine(vocabulary=built)
+        points = engine.model.tokenize("read the README unknown-token")
+        hashed = [ManifoldPoint(token=t) for t in "read the readme unknown-token".split()]
+
+        np.testing.assert_array_equal(point_arrays(points), point_arrays(hashed))
+        assert [p.manifold_row() for p in points] == [p.manifold_row() for p in hashed]
+        assert engine.infer("read the quantum circuit", "setup.py file") == \
+            NCLMEngine().infer("read the quantum circuit", "setup.py file")
+
+    def test_noncausal_lm_matches_hashing(self, built):
+        """NonCausalLM responses are unchanged by the vocabulary"""
+        mapped, hashed = NonCausalLM(vocabulary=VocabularyManifold(built)), NonCausalLM()
+        for query in ["read the readme", "run quantum circuit", "other words"]:
+            assert mapped.process(query, "the readme file") == hashed.process(query, "the readme file")
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '-s'])